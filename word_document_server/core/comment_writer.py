@@ -7,25 +7,55 @@ directly (zip + lxml), since python-docx doesn't support creating comments.
 Reference: Anthropic docx skill scripts/comment.py
 """
 
-import copy
-from word_document_server.defaults import DEFAULT_AUTHOR, DEFAULT_INITIALS
 import random
 import zipfile
 from datetime import datetime, timezone
 from io import BytesIO
 from pathlib import Path
-from typing import Optional
 
 from lxml import etree
 
-# OOXML namespaces
-WORD_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
-W14_NS = "http://schemas.microsoft.com/office/word/2010/wordml"
-REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
-CT_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
-
-W = lambda tag: f"{{{WORD_NS}}}{tag}"
-W14 = lambda tag: f"{{{W14_NS}}}{tag}"
+from word_document_server.defaults import DEFAULT_AUTHOR, DEFAULT_INITIALS
+from word_document_server.core.ooxml_utils import (
+    CT_NS,
+    REL_NS,
+    W14_PARA_ID,
+    W14_TEXT_ID,
+    W_ANNOTATION_REF,
+    W_AUTHOR,
+    W_BODY,
+    W_BOOKMARK_END,
+    W_BOOKMARK_START,
+    W_COMMENT,
+    W_COMMENT_RANGE_END,
+    W_COMMENT_RANGE_START,
+    W_COMMENT_REFERENCE,
+    W_DATE,
+    W_DEL,
+    W_ID,
+    W_INITIALS,
+    W_INS,
+    W_P,
+    W_PERM_END,
+    W_PERM_START,
+    W_R,
+    W_R_PR,
+    W_R_STYLE,
+    W_SZ,
+    W_SZ_CS,
+    W_T,
+    W_VAL,
+    XML_PARSER,
+    XML_SPACE,
+    copy_zip_entry,
+    find_text_in_paragraph,
+    get_next_rid,
+    get_run_rpr,
+    get_run_text,
+    make_run,
+    read_zip_part,
+    serialize_part,
+)
 
 COMMENTS_REL_TYPE = "http://schemas.openxmlformats.org/officeDocument/2006/relationships/comments"
 
@@ -52,8 +82,13 @@ COMMENTS_XML_TEMPLATE = b"""\
 """
 
 
+# Private generator: para ids only need uniqueness, and a dedicated
+# instance skips the module-level random's shared-state indirection.
+_RNG = random.Random()
+
+
 def _generate_hex_id() -> str:
-    return f"{random.randint(0, 0x7FFFFFFE):08X}"
+    return f"{_RNG.randint(0, 0x7FFFFFFE):08X}"
 
 
 def _now_iso() -> str:
@@ -63,108 +98,34 @@ def _now_iso() -> str:
 def _get_max_comment_id(comments_root: etree._Element) -> int:
     """Find the highest existing comment ID."""
     max_id = -1
-    for comment in comments_root.iter(W("comment")):
-        cid = comment.get(W("id"))
-        if cid is not None:
-            try:
-                max_id = max(max_id, int(cid))
-            except ValueError:
-                pass
+    for comment in comments_root.iter(W_COMMENT):
+        cid = comment.get(W_ID)
+        # isdigit screens out malformed values without paying for an
+        # exception per non-numeric id.
+        if cid is not None and cid.isdigit():
+            max_id = max(max_id, int(cid))
     return max_id
 
 
+# The only elements whose w:id values compete with comment IDs; scanning
+# just these avoids walking every element and text node in document.xml.
+_ID_BEARING_TAGS = (
+    W_BOOKMARK_START, W_BOOKMARK_END,
+    W_COMMENT_RANGE_START, W_COMMENT_RANGE_END, W_COMMENT_REFERENCE,
+    W_INS, W_DEL, W_PERM_START, W_PERM_END,
+)
+
+
 def _get_max_id_in_doc(root: etree._Element) -> int:
     """Find the highest w:id in the entire document.xml."""
     max_id = 0
-    for elem in root.iter():
-        val = elem.get(W("id"))
-        if val is not None:
-            try:
-                max_id = max(max_id, int(val))
-            except ValueError:
-                pass
+    for elem in root.iter(*_ID_BEARING_TAGS):
+        val = elem.get(W_ID)
+        if val is not None and val.isdigit():
+            max_id = max(max_id, int(val))
     return max_id
 
 
-def _get_run_text(run: etree._Element) -> str:
-    parts = []
-    for t in run.findall(W("t")):
-        if t.text:
-            parts.append(t.text)
-    return "".join(parts)
-
-
-def _find_text_in_paragraph(p: etree._Element, search_text: str):
-    """Find where search_text appears across runs in a paragraph.
-    Returns list of (run_element, start_offset, end_offset) or None.
-    """
-    runs = [r for r in p.findall(f".//{W('r')}") if r.find(W("t")) is not None]
-    if not runs:
-        return None
-
-    char_map = []
-    for ri, run in enumerate(runs):
-        text = _get_run_text(run)
-        for ci in range(len(text)):
-            char_map.append((ri, ci))
-
-    full_text = "".join(_get_run_text(r) for r in runs)
-    pos = full_text.find(search_text)
-    if pos == -1:
-        return None
-
-    start_ri, start_ci = char_map[pos]
-    end_ri, end_ci = char_map[pos + len(search_text) - 1]
-
-    result = []
-    for ri in range(start_ri, end_ri + 1):
-        run = runs[ri]
-        run_text = _get_run_text(run)
-        s = start_ci if ri == start_ri else 0
-        e = end_ci + 1 if ri == end_ri else len(run_text)
-        result.append((run, s, e))
-
-    return result
-
-
-def _get_run_rpr(run: etree._Element):
-    rpr = run.find(W("rPr"))
-    if rpr is not None:
-        return copy.deepcopy(rpr)
-    return None
-
-
-def _make_run(text: str, rpr=None) -> etree._Element:
-    r = etree.Element(W("r"))
-    if rpr is not None:
-        r.append(copy.deepcopy(rpr))
-    t = etree.SubElement(r, W("t"))
-    t.text = text
-    t.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
-    return r
-
-
-def _load_zip_part(zip_bytes: bytes, part_name: str) -> Optional[bytes]:
-    """Load a single part from a docx zip, or None if missing."""
-    with zipfile.ZipFile(BytesIO(zip_bytes), "r") as zf:
-        if part_name in zf.namelist():
-            return zf.read(part_name)
-    return None
-
-
-def _get_next_rid(rels_root: etree._Element) -> int:
-    """Find the next available rId number."""
-    max_rid = 0
-    for rel in rels_root.iter("{%s}Relationship" % REL_NS):
-        rid = rel.get("Id", "")
-        if rid.startswith("rId"):
-            try:
-                max_rid = max(max_rid, int(rid[3:]))
-            except ValueError:
-                pass
-    return max_rid + 1
-
-
 def _has_comments_rel(rels_root: etree._Element) -> bool:
     """Check if comments.xml relationship already exists."""
     for rel in rels_root.iter("{%s}Relationship" % REL_NS):
@@ -193,207 +154,206 @@ def add_comment_to_doc(
         Dict with success status and details
     """
     filepath = Path(filepath)
-    zip_bytes = filepath.read_bytes()
-
-    # --- Load document.xml ---
-    doc_xml_bytes = _load_zip_part(zip_bytes, "word/document.xml")
-    if doc_xml_bytes is None:
-        return {"success": False, "error": "Cannot find word/document.xml in the docx file"}
-
-    doc_root = etree.fromstring(doc_xml_bytes)
-
-    # --- Find target text in paragraphs ---
-    body = doc_root.find(W("body"))
-    if body is None:
-        return {"success": False, "error": "Document has no body element"}
-
-    paragraphs = body.findall(f".//{W('p')}")
-    match = None
-    match_para = None
-    for p in paragraphs:
-        match = _find_text_in_paragraph(p, target_text)
-        if match is not None:
-            match_para = p
-            break
-
-    if match is None:
-        return {"success": False, "error": f"Target text not found: '{target_text}'"}
-
-    # --- Load or create comments.xml ---
-    comments_bytes = _load_zip_part(zip_bytes, "word/comments.xml")
-    if comments_bytes is not None:
-        comments_root = etree.fromstring(comments_bytes)
-    else:
-        comments_root = etree.fromstring(COMMENTS_XML_TEMPLATE)
-
-    # --- Determine comment ID ---
-    max_comment_id = _get_max_comment_id(comments_root)
-    max_doc_id = _get_max_id_in_doc(doc_root)
-    comment_id = max(max_comment_id, max_doc_id) + 1
-
-    timestamp = _now_iso()
-    para_id = _generate_hex_id()
-
-    # --- Build comment element in comments.xml ---
-    comment_elem = etree.SubElement(comments_root, W("comment"))
-    comment_elem.set(W("id"), str(comment_id))
-    comment_elem.set(W("author"), author)
-    comment_elem.set(W("date"), timestamp)
-    comment_elem.set(W("initials"), initials)
-
-    # Comment paragraph
-    cp = etree.SubElement(comment_elem, W("p"))
-    cp.set(W14("paraId"), para_id)
-    cp.set(W14("textId"), "77777777")
-
-    # Annotation reference run
-    ann_run = etree.SubElement(cp, W("r"))
-    ann_rpr = etree.SubElement(ann_run, W("rPr"))
-    ann_style = etree.SubElement(ann_rpr, W("rStyle"))
-    ann_style.set(W("val"), "CommentReference")
-    etree.SubElement(ann_run, W("annotationRef"))
-
-    # Comment text run
-    text_run = etree.SubElement(cp, W("r"))
-    text_rpr = etree.SubElement(text_run, W("rPr"))
-    sz = etree.SubElement(text_rpr, W("sz"))
-    sz.set(W("val"), "20")
-    szCs = etree.SubElement(text_rpr, W("szCs"))
-    szCs.set(W("val"), "20")
-    ct = etree.SubElement(text_run, W("t"))
-    ct.text = comment_text
-    ct.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
-
-    # --- Inject markers into document.xml ---
-    # We need:
-    #   <w:commentRangeStart w:id="{comment_id}"/>
-    #   ... target runs ...
-    #   <w:commentRangeEnd w:id="{comment_id}"/>
-    #   <w:r><w:rPr><w:rStyle w:val="CommentReference"/></w:rPr><w:commentReference w:id="{comment_id}"/></w:r>
-
-    first_run = match[0][0]
-    first_start = match[0][1]
-    last_run = match[-1][0]
-    last_end = match[-1][2]
-
-    parent = first_run.getparent()
-    first_idx = list(parent).index(first_run)
-    last_idx = list(parent).index(last_run)
-
-    # If the match starts mid-run, split the first run
-    first_run_text = _get_run_text(first_run)
-    if first_start > 0:
-        before_text = first_run_text[:first_start]
-        after_text = first_run_text[first_start:]
-        rpr = _get_run_rpr(first_run)
-
-        before_run = _make_run(before_text, rpr)
-        parent.insert(first_idx, before_run)
-
-        # Update the first run to only contain the matched part
-        for t_elem in first_run.findall(W("t")):
-            first_run.remove(t_elem)
-        new_t = etree.SubElement(first_run, W("t"))
-        new_t.text = after_text
-        new_t.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
-
-        first_idx += 1  # Account for the inserted before_run
-        last_idx = list(parent).index(last_run)
-
-    # If the match ends mid-run, split the last run
-    last_run_text = _get_run_text(last_run)
-    if last_run == first_run:
-        # Recalculate because we may have modified first_run
-        last_run_text = _get_run_text(last_run)
-        effective_end = last_end - first_start if first_start > 0 else last_end
-    else:
-        effective_end = last_end
-
-    if effective_end < len(last_run_text):
-        matched_text = last_run_text[:effective_end]
-        remainder_text = last_run_text[effective_end:]
-        rpr = _get_run_rpr(last_run)
-
-        for t_elem in last_run.findall(W("t")):
-            last_run.remove(t_elem)
-        new_t = etree.SubElement(last_run, W("t"))
-        new_t.text = matched_text
-        new_t.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
-
-        last_idx = list(parent).index(last_run)
-        remainder_run = _make_run(remainder_text, rpr)
-        parent.insert(last_idx + 1, remainder_run)
-
-    # Now insert commentRangeStart before first matched run
-    first_idx = list(parent).index(first_run)
-    range_start = etree.Element(W("commentRangeStart"))
-    range_start.set(W("id"), str(comment_id))
-    parent.insert(first_idx, range_start)
-
-    # Insert commentRangeEnd after last matched run
-    last_idx = list(parent).index(last_run)
-    range_end = etree.Element(W("commentRangeEnd"))
-    range_end.set(W("id"), str(comment_id))
-    parent.insert(last_idx + 1, range_end)
-
-    # Insert commentReference run after commentRangeEnd
-    ref_run = etree.Element(W("r"))
-    ref_rpr = etree.SubElement(ref_run, W("rPr"))
-    ref_style = etree.SubElement(ref_rpr, W("rStyle"))
-    ref_style.set(W("val"), "CommentReference")
-    ref_elem = etree.SubElement(ref_run, W("commentReference"))
-    ref_elem.set(W("id"), str(comment_id))
-    end_idx = list(parent).index(range_end)
-    parent.insert(end_idx + 1, ref_run)
-
-    # --- Handle relationships ---
-    rels_bytes = _load_zip_part(zip_bytes, "word/_rels/document.xml.rels")
-    rels_modified = False
-    if rels_bytes is not None:
-        rels_root = etree.fromstring(rels_bytes)
-        if not _has_comments_rel(rels_root):
-            next_rid = _get_next_rid(rels_root)
-            new_rel = etree.SubElement(rels_root, "{%s}Relationship" % REL_NS)
-            new_rel.set("Id", f"rId{next_rid}")
-            new_rel.set("Type", COMMENTS_REL_TYPE)
-            new_rel.set("Target", "comments.xml")
-            rels_modified = True
-    else:
-        # Very unlikely but handle: no rels file at all
-        rels_root = None
-
-    # --- Handle Content_Types ---
-    ct_bytes = _load_zip_part(zip_bytes, "[Content_Types].xml")
-    ct_modified = False
-    if ct_bytes is not None:
-        ct_root = etree.fromstring(ct_bytes)
-        has_ct = False
-        for override in ct_root.iter("{%s}Override" % CT_NS):
-            if override.get("PartName") == "/word/comments.xml":
-                has_ct = True
-                break
-        if not has_ct:
-            new_override = etree.SubElement(ct_root, "{%s}Override" % CT_NS)
-            new_override.set("PartName", "/word/comments.xml")
-            new_override.set("ContentType",
-                             "application/vnd.openxmlformats-officedocument.wordprocessingml.comments+xml")
-            ct_modified = True
-
-    # --- Serialize and write back ---
-    new_doc_xml = etree.tostring(doc_root, xml_declaration=True, encoding="UTF-8", standalone=True)
-    new_comments_xml = etree.tostring(comments_root, xml_declaration=True, encoding="UTF-8", standalone=True)
-
-    new_rels_xml = None
-    if rels_modified and rels_root is not None:
-        new_rels_xml = etree.tostring(rels_root, xml_declaration=True, encoding="UTF-8", standalone=True)
-
-    new_ct_xml = None
-    if ct_modified and ct_root is not None:
-        new_ct_xml = etree.tostring(ct_root, xml_declaration=True, encoding="UTF-8", standalone=True)
-
-    buffer = BytesIO()
-    with zipfile.ZipFile(BytesIO(zip_bytes), "r") as zf_in:
-        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf_out:
+
+    # Open the zip straight from disk: only the parts actually inspected are
+    # read into memory, instead of buffering the whole package up front.
+    # The single handle serves every part read and the final rewrite.
+    with zipfile.ZipFile(filepath, "r") as zf_in:
+        # ZipFile already indexes entries by name; reuse that mapping for
+        # O(1) membership instead of copying namelist() into a fresh set.
+        name_set = zf_in.NameToInfo
+
+        # --- Load document.xml ---
+        doc_xml_bytes = read_zip_part(zf_in, name_set, "word/document.xml")
+        if doc_xml_bytes is None:
+            return {"success": False, "error": "Cannot find word/document.xml in the docx file"}
+
+        # Parse and search in one pass: iterparse emits each w:p as soon as
+        # it is complete, so the target search runs while the tree is still
+        # being built instead of as a second traversal afterwards.
+        context = etree.iterparse(BytesIO(doc_xml_bytes), events=("end",), tag=W_P, huge_tree=True)
+        match = None
+        match_para = None
+        for _, p in context:
+            if match is None:
+                match = find_text_in_paragraph(p, target_text)
+                if match is not None:
+                    match_para = p
+        doc_root = context.root
+
+        body = doc_root.find(W_BODY)
+        if body is None:
+            return {"success": False, "error": "Document has no body element"}
+
+        if match is None:
+            return {"success": False, "error": f"Target text not found: '{target_text}'"}
+
+        # --- Load or create comments.xml ---
+        comments_bytes = read_zip_part(zf_in, name_set, "word/comments.xml")
+        if comments_bytes is not None:
+            comments_root = etree.fromstring(comments_bytes, XML_PARSER)
+        else:
+            comments_root = etree.fromstring(COMMENTS_XML_TEMPLATE, XML_PARSER)
+
+        # --- Determine comment ID ---
+        max_comment_id = _get_max_comment_id(comments_root)
+        max_doc_id = _get_max_id_in_doc(doc_root)
+        comment_id = max(max_comment_id, max_doc_id) + 1
+
+        timestamp = _now_iso()
+        para_id = _generate_hex_id()
+
+        # --- Build comment element in comments.xml ---
+        comment_elem = etree.SubElement(comments_root, W_COMMENT)
+        comment_elem.set(W_ID, str(comment_id))
+        comment_elem.set(W_AUTHOR, author)
+        comment_elem.set(W_DATE, timestamp)
+        comment_elem.set(W_INITIALS, initials)
+
+        # Comment paragraph
+        cp = etree.SubElement(comment_elem, W_P)
+        cp.set(W14_PARA_ID, para_id)
+        cp.set(W14_TEXT_ID, "77777777")
+
+        # Annotation reference run
+        ann_run = etree.SubElement(cp, W_R)
+        ann_rpr = etree.SubElement(ann_run, W_R_PR)
+        ann_style = etree.SubElement(ann_rpr, W_R_STYLE)
+        ann_style.set(W_VAL, "CommentReference")
+        etree.SubElement(ann_run, W_ANNOTATION_REF)
+
+        # Comment text run
+        text_run = etree.SubElement(cp, W_R)
+        text_rpr = etree.SubElement(text_run, W_R_PR)
+        sz = etree.SubElement(text_rpr, W_SZ)
+        sz.set(W_VAL, "20")
+        szCs = etree.SubElement(text_rpr, W_SZ_CS)
+        szCs.set(W_VAL, "20")
+        ct = etree.SubElement(text_run, W_T)
+        ct.text = comment_text
+        ct.set(XML_SPACE, "preserve")
+
+        # --- Inject markers into document.xml ---
+        # We need:
+        #   <w:commentRangeStart w:id="{comment_id}"/>
+        #   ... target runs ...
+        #   <w:commentRangeEnd w:id="{comment_id}"/>
+        #   <w:r><w:rPr><w:rStyle w:val="CommentReference"/></w:rPr><w:commentReference w:id="{comment_id}"/></w:r>
+
+        first_run = match[0][0]
+        first_start = match[0][1]
+        last_run = match[-1][0]
+        last_end = match[-1][2]
+
+        # If the match starts mid-run, split the first run
+        first_run_text = get_run_text(first_run)
+        if first_start > 0:
+            before_text = first_run_text[:first_start]
+            after_text = first_run_text[first_start:]
+            rpr = get_run_rpr(first_run)
+
+            before_run = make_run(before_text, rpr)
+            first_run.addprevious(before_run)
+
+            # Update the first run to only contain the matched part
+            for t_elem in first_run.findall(W_T):
+                first_run.remove(t_elem)
+            new_t = etree.SubElement(first_run, W_T)
+            new_t.text = after_text
+            new_t.set(XML_SPACE, "preserve")
+
+        # If the match ends mid-run, split the last run. last_run_text is
+        # read after any first-run split above, so it already reflects the
+        # trimmed text and does not need recomputing per branch.
+        last_run_text = get_run_text(last_run)
+        if last_run == first_run:
+            effective_end = last_end - first_start if first_start > 0 else last_end
+        else:
+            effective_end = last_end
+
+        if effective_end < len(last_run_text):
+            matched_text = last_run_text[:effective_end]
+            remainder_text = last_run_text[effective_end:]
+            rpr = get_run_rpr(last_run)
+
+            for t_elem in last_run.findall(W_T):
+                last_run.remove(t_elem)
+            new_t = etree.SubElement(last_run, W_T)
+            new_t.text = matched_text
+            new_t.set(XML_SPACE, "preserve")
+
+            remainder_run = make_run(remainder_text, rpr)
+            last_run.addnext(remainder_run)
+
+        # Now insert commentRangeStart before first matched run
+        range_start = etree.Element(W_COMMENT_RANGE_START)
+        range_start.set(W_ID, str(comment_id))
+        first_run.addprevious(range_start)
+
+        # Insert commentRangeEnd after last matched run
+        range_end = etree.Element(W_COMMENT_RANGE_END)
+        range_end.set(W_ID, str(comment_id))
+        last_run.addnext(range_end)
+
+        # Insert commentReference run after commentRangeEnd
+        ref_run = etree.Element(W_R)
+        ref_rpr = etree.SubElement(ref_run, W_R_PR)
+        ref_style = etree.SubElement(ref_rpr, W_R_STYLE)
+        ref_style.set(W_VAL, "CommentReference")
+        ref_elem = etree.SubElement(ref_run, W_COMMENT_REFERENCE)
+        ref_elem.set(W_ID, str(comment_id))
+        range_end.addnext(ref_run)
+
+        # --- Handle relationships ---
+        rels_bytes = read_zip_part(zf_in, name_set, "word/_rels/document.xml.rels")
+        rels_modified = False
+        if rels_bytes is not None:
+            rels_root = etree.fromstring(rels_bytes, XML_PARSER)
+            if not _has_comments_rel(rels_root):
+                next_rid = get_next_rid(rels_root)
+                new_rel = etree.SubElement(rels_root, "{%s}Relationship" % REL_NS)
+                new_rel.set("Id", f"rId{next_rid}")
+                new_rel.set("Type", COMMENTS_REL_TYPE)
+                new_rel.set("Target", "comments.xml")
+                rels_modified = True
+        else:
+            # Very unlikely but handle: no rels file at all
+            rels_root = None
+
+        # --- Handle Content_Types ---
+        ct_bytes = read_zip_part(zf_in, name_set, "[Content_Types].xml")
+        ct_modified = False
+        if ct_bytes is not None:
+            ct_root = etree.fromstring(ct_bytes, XML_PARSER)
+            has_ct = False
+            for override in ct_root.iter("{%s}Override" % CT_NS):
+                if override.get("PartName") == "/word/comments.xml":
+                    has_ct = True
+                    break
+            if not has_ct:
+                new_override = etree.SubElement(ct_root, "{%s}Override" % CT_NS)
+                new_override.set("PartName", "/word/comments.xml")
+                new_override.set("ContentType",
+                                 "application/vnd.openxmlformats-officedocument.wordprocessingml.comments+xml")
+                ct_modified = True
+
+        # --- Serialize and write back ---
+        new_doc_xml = serialize_part(doc_root)
+        new_comments_xml = serialize_part(comments_root)
+
+        new_rels_xml = None
+        if rels_modified and rels_root is not None:
+            new_rels_xml = serialize_part(rels_root)
+
+        new_ct_xml = None
+        if ct_modified and ct_root is not None:
+            new_ct_xml = serialize_part(ct_root)
+
+        buffer = BytesIO()
+        # Untouched entries bypass compression entirely via copy_zip_entry;
+        # only the few mutated XML parts are DEFLATEd, at the fastest level
+        # since their size barely matters next to the copied media.
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf_out:
             comments_written = False
             for item in zf_in.infolist():
                 if item.filename == "word/document.xml":
@@ -406,7 +366,7 @@ def add_comment_to_doc(
                 elif item.filename == "[Content_Types].xml" and new_ct_xml is not None:
                     zf_out.writestr(item, new_ct_xml)
                 else:
-                    zf_out.writestr(item, zf_in.read(item.filename))
+                    copy_zip_entry(zf_in, zf_out, item)
 
             # If comments.xml didn't exist before, add it
             if not comments_written:
@@ -7,6 +7,7 @@ import os
 import zipfile
 import tempfile
 from typing import Optional, Tuple, Dict, Any, List
+from xml.etree import ElementTree
 from lxml import etree
 from docx import Document
 from docx.oxml.ns import qn
@@ -611,8 +612,14 @@ def delete_footnote_robust(
 
 
 def validate_document_footnotes(filename: str) -> Tuple[bool, str, Dict[str, Any]]:
-    """Validate all footnotes in a document for coherence and compliance."""
-    
+    """Validate all footnotes in a document for coherence and compliance.
+
+    Validation never mutates the parts, so it parses with the stdlib
+    ElementTree instead of lxml: the element trees are plain Python
+    objects freed by the garbage collector as soon as this returns,
+    rather than lxml proxies pinning C-level document memory.
+    """
+
     if not os.path.exists(filename):
         return False, f"File not found: {filename}", {}
     
@@ -631,32 +638,33 @@ def validate_document_footnotes(filename: str) -> Tuple[bool, str, Dict[str, Any
         with zipfile.ZipFile(filename, 'r') as zf:
             # Check document.xml
             doc_xml = zf.read('word/document.xml')
-            doc_root = etree.fromstring(doc_xml)
-            nsmap = {'w': W_NS}
-            
+            doc_root = ElementTree.fromstring(doc_xml)
+            # Stdlib ET has no getparent(); one map covers every ancestor walk
+            parent_map = {child: parent for parent in doc_root.iter() for child in parent}
+
             # Get all footnote references
             ref_ids = set()
-            for ref in doc_root.xpath('//w:footnoteReference', namespaces=nsmap):
+            for ref in doc_root.iter(f'{{{W_NS}}}footnoteReference'):
                 ref_id = ref.get(f'{{{W_NS}}}id')
                 if ref_id:
                     ref_ids.add(ref_id)
                     report['total_references'] += 1
-                    
+
                     # Check location
-                    parent = ref.getparent()
+                    parent = parent_map.get(ref)
                     while parent is not None:
                         if parent.tag in [f'{{{W_NS}}}hdr', f'{{{W_NS}}}ftr']:
                             report['invalid_locations'].append(ref_id)
                             break
-                        parent = parent.getparent()
-            
+                        parent = parent_map.get(parent)
+
             # Check footnotes.xml
             if 'word/footnotes.xml' in zf.namelist():
                 footnotes_xml = zf.read('word/footnotes.xml')
-                footnotes_root = etree.fromstring(footnotes_xml)
-                
+                footnotes_root = ElementTree.fromstring(footnotes_xml)
+
                 content_ids = set()
-                for fn in footnotes_root.xpath('//w:footnote', namespaces=nsmap):
+                for fn in footnotes_root.iter(f'{{{W_NS}}}footnote'):
                     fn_id = fn.get(f'{{{W_NS}}}id')
                     if fn_id:
                         content_ids.add(fn_id)
@@ -673,13 +681,10 @@ def validate_document_footnotes(filename: str) -> Tuple[bool, str, Dict[str, Any
             # Check relationships
             if 'word/_rels/document.xml.rels' in zf.namelist():
                 rels_xml = zf.read('word/_rels/document.xml.rels')
-                rels_root = etree.fromstring(rels_xml)
-                rel_nsmap = {'r': REL_NS}
-                
-                fn_rels = rels_root.xpath(
-                    "//r:Relationship[contains(@Type, 'footnotes')]",
-                    namespaces=rel_nsmap
-                )
+                rels_root = ElementTree.fromstring(rels_xml)
+
+                fn_rels = [rel for rel in rels_root.iter(f'{{{REL_NS}}}Relationship')
+                           if 'footnotes' in (rel.get('Type') or '')]
                 
                 if report['total_content'] > 0 and len(fn_rels) == 0:
                     report['coherence_issues'].append('Missing footnotes relationship')
@@ -689,13 +694,10 @@ def validate_document_footnotes(filename: str) -> Tuple[bool, str, Dict[str, Any
             # Check content types
             if '[Content_Types].xml' in zf.namelist():
                 ct_xml = zf.read('[Content_Types].xml')
-                ct_root = etree.fromstring(ct_xml)
-                ct_nsmap = {'ct': CT_NS}
-                
-                fn_overrides = ct_root.xpath(
-                    "//ct:Override[@PartName='/word/footnotes.xml']",
-                    namespaces=ct_nsmap
-                )
+                ct_root = ElementTree.fromstring(ct_xml)
+
+                fn_overrides = [ov for ov in ct_root.iter(f'{{{CT_NS}}}Override')
+                                if ov.get('PartName') == '/word/footnotes.xml']
                 
                 if report['total_content'] > 0 and len(fn_overrides) == 0:
                     report['coherence_issues'].append('Missing footnotes content type')
@@ -705,10 +707,12 @@ def validate_document_footnotes(filename: str) -> Tuple[bool, str, Dict[str, Any
             # Check styles
             if 'word/styles.xml' in zf.namelist():
                 styles_xml = zf.read('word/styles.xml')
-                styles_root = etree.fromstring(styles_xml)
-                
-                ref_style = styles_root.xpath('//w:style[@w:styleId="FootnoteReference"]', namespaces=nsmap)
-                text_style = styles_root.xpath('//w:style[@w:styleId="FootnoteText"]', namespaces=nsmap)
+                styles_root = ElementTree.fromstring(styles_xml)
+
+                style_ids = {style.get(f'{{{W_NS}}}styleId')
+                             for style in styles_root.iter(f'{{{W_NS}}}style')}
+                ref_style = 'FootnoteReference' in style_ids
+                text_style = 'FootnoteText' in style_ids
                 
                 if not ref_style:
                     report['missing_styles'].append('FootnoteReference')
@@ -0,0 +1,193 @@
+"""
+Shared OOXML helpers for tools that edit .docx packages directly.
+
+comment_writer and hyperlink_writer both manipulate the raw zip + lxml
+representation of a document; the namespace constants, text-search,
+run-construction, and zip plumbing they have in common live here.
+"""
+
+import bisect
+import copy
+import itertools
+import struct
+import zipfile
+from typing import Container, Optional
+
+from lxml import etree
+
+# OOXML namespaces
+WORD_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+W14_NS = "http://schemas.microsoft.com/office/word/2010/wordml"
+REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
+R_NS = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+CT_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
+
+# Precomputed Clark-notation names; formatting these per call showed up
+# in the hot text-search and run-construction loops.
+W_ANNOTATION_REF = f"{{{WORD_NS}}}annotationRef"
+W_AUTHOR = f"{{{WORD_NS}}}author"
+W_BODY = f"{{{WORD_NS}}}body"
+W_BOOKMARK_END = f"{{{WORD_NS}}}bookmarkEnd"
+W_BOOKMARK_START = f"{{{WORD_NS}}}bookmarkStart"
+W_COLOR = f"{{{WORD_NS}}}color"
+W_COMMENT = f"{{{WORD_NS}}}comment"
+W_COMMENT_RANGE_END = f"{{{WORD_NS}}}commentRangeEnd"
+W_COMMENT_RANGE_START = f"{{{WORD_NS}}}commentRangeStart"
+W_COMMENT_REFERENCE = f"{{{WORD_NS}}}commentReference"
+W_DATE = f"{{{WORD_NS}}}date"
+W_DEL = f"{{{WORD_NS}}}del"
+W_DEL_TEXT = f"{{{WORD_NS}}}delText"
+W_HYPERLINK = f"{{{WORD_NS}}}hyperlink"
+W_ID = f"{{{WORD_NS}}}id"
+W_INITIALS = f"{{{WORD_NS}}}initials"
+W_INS = f"{{{WORD_NS}}}ins"
+W_P = f"{{{WORD_NS}}}p"
+W_PERM_END = f"{{{WORD_NS}}}permEnd"
+W_PERM_START = f"{{{WORD_NS}}}permStart"
+W_R = f"{{{WORD_NS}}}r"
+W_R_PR = f"{{{WORD_NS}}}rPr"
+W_R_STYLE = f"{{{WORD_NS}}}rStyle"
+W_SZ = f"{{{WORD_NS}}}sz"
+W_SZ_CS = f"{{{WORD_NS}}}szCs"
+W_T = f"{{{WORD_NS}}}t"
+W_THEME_COLOR = f"{{{WORD_NS}}}themeColor"
+W_U = f"{{{WORD_NS}}}u"
+W_VAL = f"{{{WORD_NS}}}val"
+W14_PARA_ID = f"{{{W14_NS}}}paraId"
+W14_TEXT_ID = f"{{{W14_NS}}}textId"
+XML_SPACE = "{http://www.w3.org/XML/1998/namespace}space"
+
+# Compiled once; lxml evaluates a prepared XPath much faster than findall
+# re-parsing the path expression on every paragraph.
+RUNS_WITH_TEXT = etree.XPath(".//w:r[w:t]", namespaces={"w": WORD_NS})
+
+# Shared parser: huge_tree lifts libxml2's size guards for big documents,
+# and skipping xml:id collection avoids a hash-table insert per element.
+XML_PARSER = etree.XMLParser(huge_tree=True, remove_blank_text=False, collect_ids=False)
+
+
+def get_run_text(run: etree._Element) -> str:
+    # w:t only ever appears as a direct child of w:r, so iterchildren
+    # avoids findall's descendant walk and list materialization.
+    return "".join(t.text for t in run.iterchildren(W_T) if t.text)
+
+
+def find_text_in_paragraph(p: etree._Element, search_text: str):
+    """Find where search_text appears across runs in a paragraph.
+    Returns list of (run_element, start_offset, end_offset) or None.
+
+    The returned entries reference live elements of the caller's tree, so
+    results must never be cached across calls: the runs are split and
+    replaced as part of every edit.
+    """
+    runs = RUNS_WITH_TEXT(p)
+    if not runs:
+        return None
+
+    run_texts = [get_run_text(r) for r in runs]
+    full_text = "".join(run_texts)
+    # Cheap length reject before handing the search to str.find.
+    if len(full_text) < len(search_text):
+        return None
+    pos = full_text.find(search_text)
+    if pos == -1:
+        return None
+
+    # Fast path: single-run paragraphs are the overwhelmingly common case
+    # and need no offset mapping at all.
+    if len(runs) == 1:
+        return [(runs[0], pos, pos + len(search_text))]
+
+    # Cumulative start offset of each run; bisect maps a global character
+    # position back to (run index, offset within run) without building a
+    # per-character map.
+    offsets = list(itertools.accumulate((len(t) for t in run_texts), initial=0))
+    end_pos = pos + len(search_text) - 1
+    start_ri = bisect.bisect_right(offsets, pos) - 1
+    start_ci = pos - offsets[start_ri]
+    end_ri = bisect.bisect_right(offsets, end_pos) - 1
+    end_ci = end_pos - offsets[end_ri]
+
+    # Matches that land entirely inside one run (the typical case even in
+    # multi-run paragraphs) need no per-run slicing loop.
+    if start_ri == end_ri:
+        return [(runs[start_ri], start_ci, end_ci + 1)]
+
+    result = []
+    for ri in range(start_ri, end_ri + 1):
+        s = start_ci if ri == start_ri else 0
+        e = end_ci + 1 if ri == end_ri else len(run_texts[ri])
+        result.append((runs[ri], s, e))
+
+    return result
+
+
+def get_run_rpr(run: etree._Element):
+    # Returns the live rPr element; callers deepcopy at the point where the
+    # properties are attached to a new run, so copying here as well would
+    # clone the subtree twice.
+    return run.find(W_R_PR)
+
+
+def make_run(text: str, rpr=None) -> etree._Element:
+    r = etree.Element(W_R)
+    if rpr is not None:
+        r.append(copy.deepcopy(rpr))
+    t = etree.SubElement(r, W_T)
+    t.text = text
+    t.set(XML_SPACE, "preserve")
+    return r
+
+
+def read_zip_part(zf: zipfile.ZipFile, name_set: Container[str], part_name: str) -> Optional[bytes]:
+    """Read a single part from an already-open docx zip, or None if missing."""
+    if part_name in name_set:
+        return zf.read(part_name)
+    return None
+
+
+def copy_zip_entry(zf_in: zipfile.ZipFile, zf_out: zipfile.ZipFile, item: zipfile.ZipInfo) -> None:
+    """Copy a zip entry into another archive without recompressing it.
+
+    Reads the raw (still-DEFLATEd) payload straight out of the source
+    archive and writes it behind a fresh local header, so unmodified parts
+    (images, fonts, media) never pay a decompress + recompress cycle.
+    """
+    # Locate the raw data behind the entry's local file header.
+    zf_in.fp.seek(item.header_offset)
+    fheader = struct.unpack(zipfile.structFileHeader, zf_in.fp.read(zipfile.sizeFileHeader))
+    data_offset = (item.header_offset + zipfile.sizeFileHeader
+                   + fheader[zipfile._FH_FILENAME_LENGTH]
+                   + fheader[zipfile._FH_EXTRA_FIELD_LENGTH])
+    zf_in.fp.seek(data_offset)
+    raw = zf_in.fp.read(item.compress_size)
+
+    new_info = copy.copy(item)
+    # Sizes are known from the central directory, so drop any
+    # data-descriptor flag and write them directly in the local header.
+    new_info.flag_bits &= ~0x08
+    new_info.header_offset = zf_out.fp.tell()
+    zip64 = (item.file_size > zipfile.ZIP64_LIMIT
+             or item.compress_size > zipfile.ZIP64_LIMIT)
+    zf_out._writecheck(new_info)
+    zf_out._didModify = True
+    zf_out.fp.write(new_info.FileHeader(zip64))
+    zf_out.fp.write(raw)
+    zf_out.start_dir = zf_out.fp.tell()
+    zf_out.filelist.append(new_info)
+    zf_out.NameToInfo[new_info.filename] = new_info
+
+
+def serialize_part(root) -> bytes:
+    """Serialize a part back to bytes with the standard OOXML declaration."""
+    return etree.tostring(root, method="xml", xml_declaration=True, encoding="UTF-8", standalone=True)
+
+
+def get_next_rid(rels_root: etree._Element) -> int:
+    """Find the next available rId number."""
+    max_rid = 0
+    for rel in rels_root.iter("{%s}Relationship" % REL_NS):
+        rid = rel.get("Id", "")
+        if rid.startswith("rId") and rid[3:].isdigit():
+            max_rid = max(max_rid, int(rid[3:]))
+    return max_rid + 1
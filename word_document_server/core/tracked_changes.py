@@ -10,31 +10,60 @@ Reference: Anthropic docx skill SKILL.md tracked changes patterns.
 
 from word_document_server.defaults import DEFAULT_AUTHOR
 
+import bisect
 import copy
+import itertools
 import json
+import os
 import random
 import re
+import tempfile
 import zipfile
 from datetime import datetime, timezone
-from io import BytesIO
+
 from pathlib import Path
 from typing import Optional
 
 from lxml import etree
 
+from word_document_server.core.ooxml_utils import (
+    RUNS_WITH_TEXT,
+    W_AUTHOR,
+    W_DATE,
+    W_DEL,
+    W_DEL_TEXT,
+    W_ID,
+    W_INS,
+    W_P,
+    W_R,
+    W_R_PR,
+    W_T,
+    XML_SPACE,
+    copy_zip_entry,
+    find_text_in_paragraph,
+)
+
 # OOXML namespaces
 WORD_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
 NSMAP = {"w": WORD_NS}
 
-# Qualified name helpers
-W = lambda tag: f"{{{WORD_NS}}}{tag}"
+# XPath queries compiled once at import; findall() re-parses its path string
+# on every call, which dominates runtime when these run per paragraph.
+_XP_PARAS = etree.XPath("w:body//w:p", namespaces=NSMAP)
+_XP_TEXTS = etree.XPath(".//w:t", namespaces=NSMAP)
+_XP_DEL_TEXTS = etree.XPath(".//w:delText", namespaces=NSMAP)
 
 
 def _generate_id(root: etree._Element) -> int:
-    """Generate a unique w:id by finding max existing id + 1."""
+    """Generate a unique w:id by finding max existing id + 1.
+
+    This walks every element, so callers scan once per load and hand the
+    result around as a [next_id] counter rather than rescanning the tree
+    for every change they add.
+    """
     max_id = 0
     for elem in root.iter():
-        val = elem.get(W("id"))
+        val = elem.get(W_ID)
         if val is not None:
             try:
                 max_id = max(max_id, int(val))
@@ -50,19 +79,19 @@ def _now_iso() -> str:
 
 def _get_run_text(run: etree._Element) -> str:
     """Extract all text from a run's <w:t> elements."""
-    parts = []
-    for t in run.findall(W("t")):
-        if t.text:
-            parts.append(t.text)
-    return "".join(parts)
+    # itertext with a tag filter walks the subtree in C; with_tail=False
+    # keeps tail whitespace (which isn't run text) out of the result.
+    return "".join(run.itertext(W_T, with_tail=False))
 
 
 def _get_run_rpr(run: etree._Element) -> Optional[etree._Element]:
-    """Get a deep copy of a run's <w:rPr> (formatting), or None."""
-    rpr = run.find(W("rPr"))
-    if rpr is not None:
-        return copy.deepcopy(rpr)
-    return None
+    """Get a run's <w:rPr> (formatting), or None.
+
+    Returns the live element: _make_run deepcopies at the point where the
+    properties are attached to a new run, so copying here as well would
+    clone the subtree twice per run built.
+    """
+    return run.find(W_R_PR)
 
 
 def _make_run(text: str, rpr: Optional[etree._Element] = None, is_del: bool = False) -> etree._Element:
@@ -73,107 +102,239 @@ def _make_run(text: str, rpr: Optional[etree._Element] = None, is_del: bool = Fa
         rpr: Optional formatting to copy
         is_del: If True, use <w:delText> instead of <w:t>
     """
-    r = etree.SubElement(etree.Element("dummy"), W("r"))
-    r.getparent().remove(r)  # Detach from dummy
+    r = etree.Element(W_R)
 
     if rpr is not None:
         r.append(copy.deepcopy(rpr))
 
-    tag = W("delText") if is_del else W("t")
+    tag = W_DEL_TEXT if is_del else W_T
     t = etree.SubElement(r, tag)
     t.text = text
     # Preserve whitespace
-    t.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
+    t.set(XML_SPACE, "preserve")
 
     return r
 
 
-def _load_document_xml(filepath: str) -> tuple[etree._Element, bytes]:
+def _load_document_xml(filepath: str) -> tuple[etree._Element, Path]:
     """Load and parse document.xml from a .docx file.
 
     Returns:
-        Tuple of (parsed XML root, original zip bytes)
+        Tuple of (parsed XML root, resolved path). Only document.xml is
+        read; the archive stays on disk and is re-opened at save time
+        instead of being held in memory for the whole edit.
     """
     filepath = Path(filepath)
-    zip_bytes = filepath.read_bytes()
-
-    with zipfile.ZipFile(BytesIO(zip_bytes), "r") as zf:
+    with zipfile.ZipFile(filepath, "r") as zf:
         doc_xml = zf.read("word/document.xml")
 
     root = etree.fromstring(doc_xml)
-    return root, zip_bytes
+    return root, filepath
 
 
-def _save_document_xml(filepath: str, root: etree._Element, original_zip_bytes: bytes) -> None:
+def _save_document_xml(filepath: Path, root: etree._Element) -> None:
     """Save modified document.xml back into the .docx zip."""
     filepath = Path(filepath)
     new_xml = etree.tostring(root, xml_declaration=True, encoding="UTF-8", standalone=True)
 
-    # Read original zip and replace document.xml
-    buffer = BytesIO()
-    with zipfile.ZipFile(BytesIO(original_zip_bytes), "r") as zf_in:
-        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf_out:
-            for item in zf_in.infolist():
-                if item.filename == "word/document.xml":
-                    zf_out.writestr(item, new_xml)
-                else:
-                    zf_out.writestr(item, zf_in.read(item.filename))
-
-    filepath.write_bytes(buffer.getvalue())
+    # Rebuild the package next to the original and swap it in with
+    # os.replace: nothing but the new document.xml is ever materialized
+    # in memory, and an interrupted save leaves the original intact.
+    # Untouched entries are copied raw (still compressed), so media parts
+    # never pay a decompress + recompress cycle.
+    fd, tmp_name = tempfile.mkstemp(dir=filepath.parent, suffix=".docx.tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp:
+            with zipfile.ZipFile(filepath, "r") as zf_in:
+                # Only document.xml is actually deflated here (everything
+                # else is raw-copied), so compress it at the fastest level —
+                # the few percent of extra size is noise next to the CPU
+                # saved.
+                with zipfile.ZipFile(tmp, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf_out:
+                    for item in zf_in.infolist():
+                        if item.filename == "word/document.xml":
+                            zf_out.writestr(item, new_xml)
+                        else:
+                            copy_zip_entry(zf_in, zf_out, item)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+    os.replace(tmp_name, filepath)
 
 
 def _get_paragraphs(root: etree._Element) -> list[etree._Element]:
     """Get all <w:p> elements from body."""
-    body = root.find(W("body"))
-    if body is None:
-        return []
-    return body.findall(f".//{W('p')}")
+    return _XP_PARAS(root)
 
 
 def _paragraph_text(p: etree._Element) -> str:
     """Get plain text of a paragraph."""
-    texts = []
-    for t in p.iter(W("t")):
-        if t.text:
-            texts.append(t.text)
-    return "".join(texts)
+    return "".join(p.itertext(W_T, with_tail=False))
 
 
-def _find_text_in_paragraph(p: etree._Element, search_text: str) -> Optional[list[tuple]]:
-    """Find where search_text appears across runs in a paragraph.
+# Cross-run text search: cumulative run offsets + bisect instead of a
+# per-character map. Shared with the comment and hyperlink writers.
+_find_text_in_paragraph = find_text_in_paragraph
 
-    Returns list of (run_element, start_offset, end_offset) tuples
-    that together contain the search_text, or None if not found.
+
+def _map_span_to_runs(
+    runs: list[etree._Element],
+    run_texts: list[str],
+    start: int,
+    end: int,
+) -> tuple[list[tuple], int]:
+    """Map a [start, end) span of the concatenated run text onto runs.
+
+    Returns (match, last_run_index) where match is the usual list of
+    (run_element, start_offset, end_offset) tuples.
     """
-    runs = [r for r in p.findall(f".//{W('r')}") if r.find(W("t")) is not None]
-    if not runs:
-        return None
-
-    # Build a map: (run_index, char_offset_in_run) for each character
-    char_map = []
-    for ri, run in enumerate(runs):
-        text = _get_run_text(run)
-        for ci in range(len(text)):
-            char_map.append((ri, ci))
-
-    full_text = "".join(_get_run_text(r) for r in runs)
-    pos = full_text.find(search_text)
-    if pos == -1:
-        return None
-
-    # Map character positions back to runs
-    start_ri, start_ci = char_map[pos]
-    end_ri, end_ci = char_map[pos + len(search_text) - 1]
-
-    result = []
+    offsets = list(itertools.accumulate((len(t) for t in run_texts), initial=0))
+    start_ri = bisect.bisect_right(offsets, start) - 1
+    end_ri = bisect.bisect_right(offsets, end - 1) - 1
+
+    match = []
     for ri in range(start_ri, end_ri + 1):
-        run = runs[ri]
-        run_text = _get_run_text(run)
-        s = start_ci if ri == start_ri else 0
-        e = end_ci + 1 if ri == end_ri else len(run_text)
-        result.append((run, s, e))
+        s = start - offsets[start_ri] if ri == start_ri else 0
+        e = end - offsets[end_ri] if ri == end_ri else len(run_texts[ri])
+        match.append((runs[ri], s, e))
+    return match, end_ri
+
+
+def _splice_match(
+    match: list[tuple],
+    elements: list[etree._Element],
+    rpr: Optional[etree._Element],
+) -> tuple[Optional[etree._Element], str]:
+    """Replace the matched runs with *elements*, re-creating any unmatched
+    text from the first and last runs around them.
+
+    Returns (remainder_run, remainder_text) for the text trailing the
+    match — or (None, "") — so callers scanning for further occurrences
+    can keep going from the remainder without re-reading the tree.
+    """
+    first_run_elem, first_start, _ = match[0]
+    last_run_elem, _, last_end = match[-1]
+    first_run_text = _get_run_text(first_run_elem)
+    last_run_text = _get_run_text(last_run_elem)
+
+    before_text = first_run_text[:first_start]
+    after_text = last_run_text[last_end:]
+
+    if before_text:
+        first_run_elem.addprevious(_make_run(before_text, rpr))
+    for elem in elements:
+        first_run_elem.addprevious(elem)
+
+    after_run = None
+    if after_text:
+        after_rpr = _get_run_rpr(last_run_elem) if last_run_elem is not first_run_elem else rpr
+        after_run = _make_run(after_text, after_rpr if after_rpr is not None else rpr)
+        last_run_elem.addnext(after_run)
+
+    for run_elem, _, _ in match:
+        run_parent = run_elem.getparent()
+        if run_parent is not None:
+            run_parent.remove(run_elem)
+
+    return after_run, after_text
+
+
+def _apply_replace(
+    root: etree._Element,
+    old_text: str,
+    new_text: str,
+    author: str,
+    timestamp: str,
+    counter: list[int],
+) -> int:
+    """Apply a tracked replacement to an in-memory tree; returns the count."""
+    replacements = 0
+
+    for p in _get_paragraphs(root):
+        # Cheap containment probe first: str.__contains__ runs a C-level
+        # scan over the flattened text, so the vast majority of paragraphs
+        # (which don't mention the target at all) skip the run query and
+        # per-run text extraction entirely.
+        if old_text not in _paragraph_text(p):
+            continue
+
+        # Flatten the paragraph once and walk every occurrence off that one
+        # string, instead of re-reading all runs from the tree after each
+        # splice. After a splice the still-unsearched text is exactly the
+        # remainder run plus the original runs following the match, so the
+        # search window just shifts forward.
+        runs = RUNS_WITH_TEXT(p)
+        if not runs:
+            continue
+        run_texts = [_get_run_text(r) for r in runs]
+        full_text = "".join(run_texts)
+
+        base = 0  # offset of runs[0] within full_text
+        pos = full_text.find(old_text)
+        while pos != -1:
+            end = pos + len(old_text)
+            match, end_ri = _map_span_to_runs(runs, run_texts, pos - base, end - base)
+
+            next_id = counter[0]
+            counter[0] += 2  # del + ins each take an id
+
+            # Get formatting from the first matched run
+            rpr = _get_run_rpr(match[0][0])
+
+            # Build the replacement elements
+            del_elem = etree.Element(W_DEL)
+            del_elem.set(W_ID, str(next_id))
+            del_elem.set(W_AUTHOR, author)
+            del_elem.set(W_DATE, timestamp)
+            del_elem.append(_make_run(old_text, rpr, is_del=True))
+
+            ins_elem = etree.Element(W_INS)
+            ins_elem.set(W_ID, str(next_id + 1))
+            ins_elem.set(W_AUTHOR, author)
+            ins_elem.set(W_DATE, timestamp)
+            ins_elem.append(_make_run(new_text, rpr, is_del=False))
+
+            after_run, after_text = _splice_match(match, [del_elem, ins_elem], rpr)
+            replacements += 1
+
+            # Shift the window past this match before searching again.
+            if after_run is not None:
+                runs = [after_run] + runs[end_ri + 1:]
+                run_texts = [after_text] + run_texts[end_ri + 1:]
+            else:
+                runs = runs[end_ri + 1:]
+                run_texts = run_texts[end_ri + 1:]
+            base = end
+            pos = full_text.find(old_text, end)
+
+    return replacements
+
 
-    return result
+_XML_TAG_RE = re.compile(rb"<[^>]*>")
+
+
+def text_absent_quick(filepath: str, text: str) -> bool:
+    """Cheap probe: True when ``text`` provably does not occur in document.xml.
+
+    Strips tags from the raw part bytes and searches for the XML-escaped
+    needle, so text split across runs still matches the flattened stream.
+    Costs one decompression instead of a full parse + re-zip, which lets
+    callers reject retries for absent text without the heavy path.  False
+    means "maybe present" — never that a match is guaranteed.
+    """
+    try:
+        with zipfile.ZipFile(filepath) as zf:
+            xml = zf.read("word/document.xml")
+    except Exception:
+        return False  # let the full path surface the real error
+
+    flat = _XML_TAG_RE.sub(b"", xml)
+    # Text nodes carry &/</> escaped; escape the needle the same way.
+    needle = (
+        text.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+    ).encode("utf-8")
+    return needle not in flat
 
 
 def track_replace_in_doc(
@@ -193,87 +354,14 @@ def track_replace_in_doc(
     Returns:
         Dict with success status and details
     """
-    root, zip_bytes = _load_document_xml(filepath)
-    timestamp = _now_iso()
-    replacements = 0
-
-    for p in _get_paragraphs(root):
-        # Keep searching in the same paragraph until no more matches
-        while True:
-            match = _find_text_in_paragraph(p, old_text)
-            if match is None:
-                break
-
-            next_id = _generate_id(root)
-
-            # Get formatting from the first matched run
-            first_run = match[0][0]
-            rpr = _get_run_rpr(first_run)
-
-            # Build the replacement elements
-            del_elem = etree.Element(W("del"))
-            del_elem.set(W("id"), str(next_id))
-            del_elem.set(W("author"), author)
-            del_elem.set(W("date"), timestamp)
-            del_run = _make_run(old_text, rpr, is_del=True)
-            del_elem.append(del_run)
-
-            ins_elem = etree.Element(W("ins"))
-            ins_elem.set(W("id"), str(next_id + 1))
-            ins_elem.set(W("author"), author)
-            ins_elem.set(W("date"), timestamp)
-            ins_run = _make_run(new_text, rpr, is_del=False)
-            ins_elem.append(ins_run)
-
-            # Now splice: we need to handle the matched runs
-            # Strategy: split first and last runs, remove middle runs,
-            # insert del+ins at the right position
-
-            first_run_elem, first_start, first_end = match[0]
-            last_run_elem, last_start, last_end = match[-1]
-            first_run_text = _get_run_text(first_run_elem)
-            last_run_text = _get_run_text(last_run_elem)
-
-            # Find the parent of the first run (should be <w:p> or a tracked change wrapper)
-            parent = first_run_elem.getparent()
-
-            # Text before the match in the first run
-            before_text = first_run_text[:first_start]
-            # Text after the match in the last run
-            after_text = last_run_text[last_end:]
-
-            # Determine insertion point (index of first matched run in parent)
-            insert_idx = list(parent).index(first_run_elem)
-
-            # Remove all matched runs
-            for run_elem, _, _ in match:
-                run_parent = run_elem.getparent()
-                if run_parent is not None:
-                    run_parent.remove(run_elem)
-
-            # Insert: before_text_run, del, ins, after_text_run
-            offset = 0
-            if before_text:
-                before_run = _make_run(before_text, rpr)
-                parent.insert(insert_idx + offset, before_run)
-                offset += 1
-
-            parent.insert(insert_idx + offset, del_elem)
-            offset += 1
-            parent.insert(insert_idx + offset, ins_elem)
-            offset += 1
-
-            if after_text:
-                after_rpr = _get_run_rpr(last_run_elem) if last_run_elem != first_run_elem else rpr
-                after_run = _make_run(after_text, after_rpr or rpr)
-                parent.insert(insert_idx + offset, after_run)
-
-            replacements += 1
+    root, path = _load_document_xml(filepath)
+    counter = [_generate_id(root)]
+    replacements = _apply_replace(root, old_text, new_text, author, _now_iso(), counter)
 
     if replacements == 0:
         return {"success": False, "error": f"Text not found: '{old_text}'"}
 
-    _save_document_xml(filepath, root, zip_bytes)
+    _save_document_xml(path, root)
     return {
         "success": True,
         "replacements": replacements,
@@ -281,33 +369,27 @@ def track_replace_in_doc(
     }
 
 
-def track_insert_in_doc(
-    filepath: str,
+def _apply_insert(
+    root: etree._Element,
     after_text: str,
     insert_text: str,
-    author: str = DEFAULT_AUTHOR,
-) -> dict:
-    """Insert text after a specific string, marked as a tracked insertion.
-
-    Args:
-        filepath: Path to .docx file
-        after_text: Text to search for; new text will be inserted right after this
-        insert_text: Text to insert
-        author: Author name for the tracked change
-
-    Returns:
-        Dict with success status and details
-    """
-    root, zip_bytes = _load_document_xml(filepath)
-    timestamp = _now_iso()
+    author: str,
+    timestamp: str,
+    counter: list[int],
+) -> int:
+    """Apply a tracked insertion to an in-memory tree; returns the count."""
     insertions = 0
 
     for p in _get_paragraphs(root):
+        # Same cheap containment probe as _apply_replace.
+        if after_text not in _paragraph_text(p):
+            continue
         match = _find_text_in_paragraph(p, after_text)
         if match is None:
             continue
 
-        next_id = _generate_id(root)
+        next_id = counter[0]
+        counter[0] += 1
 
         # Get formatting from the last matched run
         last_run_elem, last_start, last_end = match[-1]
@@ -315,26 +397,26 @@ def track_insert_in_doc(
         last_run_text = _get_run_text(last_run_elem)
 
         # Build insertion element
-        ins_elem = etree.Element(W("ins"))
-        ins_elem.set(W("id"), str(next_id))
-        ins_elem.set(W("author"), author)
-        ins_elem.set(W("date"), timestamp)
+        ins_elem = etree.Element(W_INS)
+        ins_elem.set(W_ID, str(next_id))
+        ins_elem.set(W_AUTHOR, author)
+        ins_elem.set(W_DATE, timestamp)
         ins_run = _make_run(insert_text, rpr, is_del=False)
         ins_elem.append(ins_run)
 
         parent = last_run_elem.getparent()
-        run_idx = list(parent).index(last_run_elem)
+        run_idx = parent.index(last_run_elem)
 
         # If match ends mid-run, split the run
         after_match_text = last_run_text[last_end:]
         if after_match_text:
             # Truncate the current run to end at the match
             before_match_text = last_run_text[:last_end]
-            for t in last_run_elem.findall(W("t")):
+            for t in last_run_elem.findall(W_T):
                 last_run_elem.remove(t)
-            new_t = etree.SubElement(last_run_elem, W("t"))
+            new_t = etree.SubElement(last_run_elem, W_T)
             new_t.text = before_match_text
-            new_t.set("{http://www.w3.org/XML/1998/namespace}space", "preserve")
+            new_t.set(XML_SPACE, "preserve")
 
             # Insert the tracked insertion
             parent.insert(run_idx + 1, ins_elem)
@@ -349,10 +431,34 @@ def track_insert_in_doc(
         insertions += 1
         break  # Only first occurrence
 
+    return insertions
+
+
+def track_insert_in_doc(
+    filepath: str,
+    after_text: str,
+    insert_text: str,
+    author: str = DEFAULT_AUTHOR,
+) -> dict:
+    """Insert text after a specific string, marked as a tracked insertion.
+
+    Args:
+        filepath: Path to .docx file
+        after_text: Text to search for; new text will be inserted right after this
+        insert_text: Text to insert
+        author: Author name for the tracked change
+
+    Returns:
+        Dict with success status and details
+    """
+    root, path = _load_document_xml(filepath)
+    counter = [_generate_id(root)]
+    insertions = _apply_insert(root, after_text, insert_text, author, _now_iso(), counter)
+
     if insertions == 0:
         return {"success": False, "error": f"Text not found: '{after_text}'"}
 
-    _save_document_xml(filepath, root, zip_bytes)
+    _save_document_xml(path, root)
     return {
         "success": True,
         "insertions": insertions,
@@ -360,6 +466,61 @@ def track_insert_in_doc(
     }
 
 
+def _apply_delete(
+    root: etree._Element,
+    text: str,
+    author: str,
+    timestamp: str,
+    counter: list[int],
+) -> int:
+    """Apply a tracked deletion to an in-memory tree; returns the count."""
+    deletions = 0
+
+    for p in _get_paragraphs(root):
+        # Same cheap containment probe as _apply_replace.
+        if text not in _paragraph_text(p):
+            continue
+        # Single scan over the flattened paragraph, shifting the run window
+        # past each splice — same structure as _apply_replace.
+        runs = RUNS_WITH_TEXT(p)
+        if not runs:
+            continue
+        run_texts = [_get_run_text(r) for r in runs]
+        full_text = "".join(run_texts)
+
+        base = 0  # offset of runs[0] within full_text
+        pos = full_text.find(text)
+        while pos != -1:
+            end = pos + len(text)
+            match, end_ri = _map_span_to_runs(runs, run_texts, pos - base, end - base)
+
+            next_id = counter[0]
+            counter[0] += 1
+
+            rpr = _get_run_rpr(match[0][0])
+
+            # Build deletion element
+            del_elem = etree.Element(W_DEL)
+            del_elem.set(W_ID, str(next_id))
+            del_elem.set(W_AUTHOR, author)
+            del_elem.set(W_DATE, timestamp)
+            del_elem.append(_make_run(text, rpr, is_del=True))
+
+            after_run, after_text = _splice_match(match, [del_elem], rpr)
+            deletions += 1
+
+            if after_run is not None:
+                runs = [after_run] + runs[end_ri + 1:]
+                run_texts = [after_text] + run_texts[end_ri + 1:]
+            else:
+                runs = runs[end_ri + 1:]
+                run_texts = run_texts[end_ri + 1:]
+            base = end
+            pos = full_text.find(text, end)
+
+    return deletions
+
+
 def track_delete_in_doc(
     filepath: str,
     text: str,
@@ -375,68 +536,84 @@ def track_delete_in_doc(
     Returns:
         Dict with success status and details
     """
-    root, zip_bytes = _load_document_xml(filepath)
-    timestamp = _now_iso()
-    deletions = 0
+    root, path = _load_document_xml(filepath)
+    counter = [_generate_id(root)]
+    deletions = _apply_delete(root, text, author, _now_iso(), counter)
 
-    for p in _get_paragraphs(root):
-        while True:
-            match = _find_text_in_paragraph(p, text)
-            if match is None:
-                break
+    if deletions == 0:
+        return {"success": False, "error": f"Text not found: '{text}'"}
+
+    _save_document_xml(path, root)
+    return {
+        "success": True,
+        "deletions": deletions,
+        "message": f"Marked {deletions} occurrence(s) of '{text}' as deleted by {author}",
+    }
 
-            next_id = _generate_id(root)
 
-            first_run_elem, first_start, first_end = match[0]
-            last_run_elem, last_start, last_end = match[-1]
-            rpr = _get_run_rpr(first_run_elem)
-            first_run_text = _get_run_text(first_run_elem)
-            last_run_text = _get_run_text(last_run_elem)
+def track_batch_edits_in_doc(
+    filepath: str,
+    ops: list[dict],
+    author: str = DEFAULT_AUTHOR,
+) -> dict:
+    """Apply several tracked edits with a single load/parse/save cycle.
 
-            # Build deletion element
-            del_elem = etree.Element(W("del"))
-            del_elem.set(W("id"), str(next_id))
-            del_elem.set(W("author"), author)
-            del_elem.set(W("date"), timestamp)
-            del_run = _make_run(text, rpr, is_del=True)
-            del_elem.append(del_run)
-
-            parent = first_run_elem.getparent()
-            insert_idx = list(parent).index(first_run_elem)
-
-            before_text = first_run_text[:first_start]
-            after_text = last_run_text[last_end:]
-
-            # Remove matched runs
-            for run_elem, _, _ in match:
-                run_parent = run_elem.getparent()
-                if run_parent is not None:
-                    run_parent.remove(run_elem)
-
-            offset = 0
-            if before_text:
-                before_run = _make_run(before_text, rpr)
-                parent.insert(insert_idx + offset, before_run)
-                offset += 1
-
-            parent.insert(insert_idx + offset, del_elem)
-            offset += 1
-
-            if after_text:
-                after_rpr = _get_run_rpr(last_run_elem) if last_run_elem != first_run_elem else rpr
-                after_run = _make_run(after_text, after_rpr or rpr)
-                parent.insert(insert_idx + offset, after_run)
+    Each individual track_* call unzips, parses, mutates, re-zips, and
+    rewrites the document; batching amortizes that archive work across
+    every edit in the list.
 
-            deletions += 1
+    Args:
+        filepath: Path to .docx file
+        ops: List of edit dicts. Each needs an "action" of "replace"
+            ({"old_text", "new_text"}), "insert" ({"after_text",
+            "insert_text"}), or "delete" ({"text"}), plus an optional
+            per-op "author".
+        author: Default author for ops that don't specify their own
 
-    if deletions == 0:
-        return {"success": False, "error": f"Text not found: '{text}'"}
+    Returns:
+        Dict with success status, total count, and per-op results
+    """
+    root, path = _load_document_xml(filepath)
+    timestamp = _now_iso()
+    counter = [_generate_id(root)]
+
+    results = []
+    total = 0
+    for op in ops:
+        action = op.get("action")
+        op_author = op.get("author", author)
+        try:
+            if action == "replace":
+                count = _apply_replace(root, op["old_text"], op["new_text"], op_author, timestamp, counter)
+                not_found = f"Text not found: '{op['old_text']}'"
+            elif action == "insert":
+                count = _apply_insert(root, op["after_text"], op["insert_text"], op_author, timestamp, counter)
+                not_found = f"Text not found: '{op['after_text']}'"
+            elif action == "delete":
+                count = _apply_delete(root, op["text"], op_author, timestamp, counter)
+                not_found = f"Text not found: '{op['text']}'"
+            else:
+                results.append({"success": False, "error": f"Unknown action: '{action}'"})
+                continue
+        except KeyError as e:
+            results.append({"success": False, "error": f"Missing key for action '{action}': {e}"})
+            continue
+
+        if count == 0:
+            results.append({"success": False, "error": not_found})
+        else:
+            results.append({"success": True, "count": count})
+            total += count
+
+    if total == 0:
+        return {"success": False, "error": "No edits were applied", "results": results}
 
-    _save_document_xml(filepath, root, zip_bytes)
+    _save_document_xml(path, root)
     return {
         "success": True,
-        "deletions": deletions,
-        "message": f"Marked {deletions} occurrence(s) of '{text}' as deleted by {author}",
+        "applied": total,
+        "results": results,
+        "message": f"Applied {total} tracked edit(s) across {len(ops)} operation(s)",
     }
 
 
@@ -446,64 +623,81 @@ def list_tracked_changes_in_doc(filepath: str) -> dict:
     Returns:
         Dict with lists of insertions and deletions
     """
-    root, _ = _load_document_xml(filepath)
-
     insertions = []
     deletions = []
 
-    for ins in root.iter(W("ins")):
-        author = ins.get(W("author"), "Unknown")
-        date = ins.get(W("date"), "")
-        change_id = ins.get(W("id"), "")
-        # Get inserted text
-        texts = []
-        for t in ins.iter(W("t")):
-            if t.text:
-                texts.append(t.text)
-        text = "".join(texts)
-
-        # Find paragraph context
-        p = ins.getparent()
-        while p is not None and p.tag != W("p"):
-            p = p.getparent()
-        para_text = _paragraph_text(p) if p is not None else ""
-
-        insertions.append({
-            "id": change_id,
-            "author": author,
-            "date": date,
-            "text": text,
-            "paragraph_context": para_text[:100],
-        })
-
-    for del_elem in root.iter(W("del")):
-        author = del_elem.get(W("author"), "Unknown")
-        date = del_elem.get(W("date"), "")
-        change_id = del_elem.get(W("id"), "")
-        # Get deleted text (from <w:delText>)
-        texts = []
-        for dt in del_elem.iter(W("delText")):
-            if dt.text:
-                texts.append(dt.text)
-        # Also check <w:t> in case of malformed docs
-        if not texts:
-            for t in del_elem.iter(W("t")):
-                if t.text:
-                    texts.append(t.text)
-        text = "".join(texts)
-
-        p = del_elem.getparent()
-        while p is not None and p.tag != W("p"):
-            p = p.getparent()
-        para_text = _paragraph_text(p) if p is not None else ""
-
-        deletions.append({
-            "id": change_id,
-            "author": author,
-            "date": date,
-            "text": text,
-            "paragraph_context": para_text[:100],
-        })
+    # Listing never mutates the document, so there is no reason to build
+    # (or keep) the full DOM: iterparse streams document.xml straight out
+    # of the zip, each change is recorded as its subtree completes, and
+    # finished paragraphs are cleared so memory stays bounded by the
+    # largest paragraph rather than the whole document. Paragraph context
+    # is filled in once per paragraph when its end tag arrives.
+    # (Revision data lives entirely in document.xml — comments.xml and
+    # people.xml aren't consulted — so there is nothing to gain from
+    # decompressing parts upfront and parsing them in worker threads.)
+    p_tag, ins_tag = W_P, W_INS
+    current_p = None
+    pending = []
+
+    with zipfile.ZipFile(filepath, "r") as zf:
+        with zf.open("word/document.xml") as stream:
+            for event, elem in etree.iterparse(
+                stream,
+                events=("start", "end"),
+                tag=(W_P, W_INS, W_DEL),
+                huge_tree=True,
+            ):
+                if elem.tag == p_tag:
+                    if event == "start":
+                        current_p = elem
+                        continue
+                    if pending:
+                        context = _paragraph_text(elem)[:100]
+                        for entry in pending:
+                            entry["paragraph_context"] = context
+                        pending.clear()
+                    current_p = None
+                    # Drop the finished paragraph and any earlier siblings.
+                    elem.clear(keep_tail=True)
+                    while elem.getprevious() is not None:
+                        del elem.getparent()[0]
+                    continue
+                if event != "end":
+                    continue
+
+                author = elem.get(W_AUTHOR, "Unknown")
+                date = elem.get(W_DATE, "")
+                change_id = elem.get(W_ID, "")
+
+                if elem.tag == ins_tag:
+                    texts = []
+                    for t in _XP_TEXTS(elem):
+                        if t.text:
+                            texts.append(t.text)
+                    target = insertions
+                else:
+                    # Get deleted text (from <w:delText>)
+                    texts = []
+                    for dt in _XP_DEL_TEXTS(elem):
+                        if dt.text:
+                            texts.append(dt.text)
+                    # Also check <w:t> in case of malformed docs
+                    if not texts:
+                        for t in _XP_TEXTS(elem):
+                            if t.text:
+                                texts.append(t.text)
+                    target = deletions
+
+                entry = {
+                    "id": change_id,
+                    "author": author,
+                    "date": date,
+                    "text": "".join(texts),
+                    "paragraph_context": "",
+                }
+                target.append(entry)
+                if current_p is not None:
+                    pending.append(entry)
 
     return {
         "success": True,
@@ -530,60 +724,48 @@ def accept_tracked_changes_in_doc(
     Returns:
         Dict with success status and count
     """
-    root, zip_bytes = _load_document_xml(filepath)
+    root, path = _load_document_xml(filepath)
     accepted = 0
 
     def _should_process(elem):
         if change_ids is not None:
-            eid = elem.get(W("id"), "")
+            eid = elem.get(W_ID, "")
             try:
                 if int(eid) not in change_ids:
                     return False
             except ValueError:
                 return False
         if author is not None:
-            if elem.get(W("author"), "") != author:
+            if elem.get(W_AUTHOR, "") != author:
                 return False
         return True
 
-    # Accept insertions: unwrap <w:ins> (keep content)
-    for ins in list(root.iter(W("ins"))):
-        if not _should_process(ins):
-            continue
-        parent = ins.getparent()
+    # One walk over both change types; matches are collected first so the
+    # tree isn't mutated under the iterator. (The old second w:del pass
+    # was identical to the first and double-counted every deletion.)
+    matched = [
+        elem
+        for _, elem in etree.iterwalk(root, events=("end",), tag=(W_INS, W_DEL))
+        if _should_process(elem)
+    ]
+
+    ins_tag = W_INS
+    for elem in matched:
+        parent = elem.getparent()
         if parent is None:
             continue
-        idx = list(parent).index(ins)
-        # Move children out of <w:ins>
-        children = list(ins)
-        for i, child in enumerate(children):
-            parent.insert(idx + i, child)
-        parent.remove(ins)
+        if elem.tag == ins_tag:
+            # Accept insertions: unwrap <w:ins> (keep content)
+            for child in list(elem):
+                elem.addprevious(child)
+        # Accept deletions: remove <w:del> and its content entirely
+        parent.remove(elem)
         accepted += 1
 
-    # Accept deletions: remove <w:del> and its content entirely
-    for del_elem in list(root.iter(W("del"))):
-        if not _should_process(del_elem):
-            continue
-        parent = del_elem.getparent()
-        if parent is None:
-            continue
-        parent.remove(del_elem)
-        accepted += 1
-
-    # Also remove rPr/del markers (paragraph deletion markers)
-    for rpr_del in list(root.iter(W("del"))):
-        if not _should_process(rpr_del):
-            continue
-        parent = rpr_del.getparent()
-        if parent is not None:
-            parent.remove(rpr_del)
-            accepted += 1
-
     if accepted == 0:
         return {"success": True, "message": "No matching tracked changes found to accept", "accepted": 0}
 
-    _save_document_xml(filepath, root, zip_bytes)
+    _save_document_xml(path, root)
     return {
         "success": True,
         "accepted": accepted,
@@ -606,53 +788,49 @@ def reject_tracked_changes_in_doc(
     Returns:
         Dict with success status and count
     """
-    root, zip_bytes = _load_document_xml(filepath)
+    root, path = _load_document_xml(filepath)
     rejected = 0
 
     def _should_process(elem):
         if change_ids is not None:
-            eid = elem.get(W("id"), "")
+            eid = elem.get(W_ID, "")
             try:
                 if int(eid) not in change_ids:
                     return False
             except ValueError:
                 return False
         if author is not None:
-            if elem.get(W("author"), "") != author:
+            if elem.get(W_AUTHOR, "") != author:
                 return False
         return True
 
-    # Reject insertions: remove <w:ins> and its content
-    for ins in list(root.iter(W("ins"))):
-        if not _should_process(ins):
-            continue
-        parent = ins.getparent()
-        if parent is None:
-            continue
-        parent.remove(ins)
-        rejected += 1
+    # Single collect-then-apply pass, mirroring accept_tracked_changes_in_doc.
+    matched = [
+        elem
+        for _, elem in etree.iterwalk(root, events=("end",), tag=(W_INS, W_DEL))
+        if _should_process(elem)
+    ]
 
-    # Reject deletions: unwrap <w:del>, convert delText→t (restore original text)
-    for del_elem in list(root.iter(W("del"))):
-        if not _should_process(del_elem):
-            continue
-        parent = del_elem.getparent()
+    ins_tag = W_INS
+    for elem in matched:
+        parent = elem.getparent()
         if parent is None:
             continue
-        idx = list(parent).index(del_elem)
-        children = list(del_elem)
-        for i, child in enumerate(children):
-            # Convert <w:delText> back to <w:t>
-            for dt in child.iter(W("delText")):
-                dt.tag = W("t")
-            parent.insert(idx + i, child)
-        parent.remove(del_elem)
+        if elem.tag != ins_tag:
+            # Reject deletions: unwrap <w:del>, convert delText→t
+            # (restore original text)
+            for child in list(elem):
+                for dt in child.iter(W_DEL_TEXT):
+                    dt.tag = W_T
+                elem.addprevious(child)
+        # Reject insertions: remove <w:ins> and its content
+        parent.remove(elem)
         rejected += 1
 
     if rejected == 0:
         return {"success": True, "message": "No matching tracked changes found to reject", "rejected": 0}
 
-    _save_document_xml(filepath, root, zip_bytes)
+    _save_document_xml(path, root)
     return {
         "success": True,
         "rejected": rejected,
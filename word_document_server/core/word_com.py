@@ -4,11 +4,29 @@ Provides functions to connect to a running Word instance and find open documents
 Only works on Windows with pywin32 installed.
 """
 
+import atexit
 import os
 import sys
+import threading
 import unicodedata
 from contextlib import contextmanager
 
+# Cached Word.Application proxy: GetActiveObject plus the ROT scan cost
+# milliseconds per call, which dominates small live operations.  The cache
+# is revalidated on every use (Word may have quit or lost its documents)
+# and re-acquired transparently when stale.
+_app_cache = None
+_app_lock = threading.Lock()
+
+
+def _drop_app_cache():
+    global _app_cache
+    with _app_lock:
+        _app_cache = None
+
+
+atexit.register(_drop_app_cache)
+
 
 def get_word_app():
     """Get a reference to the running Word application via COM.
@@ -16,11 +34,34 @@ def get_word_app():
     Returns the Word.Application COM object that has open documents.
     When multiple Word instances are running, iterates through all
     Running Object Table (ROT) entries to find one with documents.
+    The connection is cached across calls and revalidated each time, so
+    repeat tool calls skip the dispatch and ROT-scan cost.
     Raises RuntimeError if Word is not running or not on Windows.
     """
+    global _app_cache
+
     if sys.platform != "win32":
         raise RuntimeError("Word COM automation is only available on Windows")
 
+    with _app_lock:
+        app = _app_cache
+        if app is not None:
+            try:
+                if app.Documents.Count > 0:
+                    return app
+                # Cached instance lost its documents — another instance may
+                # have them now, so fall through to a fresh scan.
+            except Exception:
+                pass  # Word quit; the proxy is dead
+            _app_cache = None
+
+        app = _acquire_word_app()
+        _app_cache = app
+        return app
+
+
+def _acquire_word_app():
+    """Connect to a running Word instance (uncached path)."""
     import win32com.client
 
     try:
@@ -122,7 +163,8 @@ def find_document(app, filename: str = None):
     Raises:
         ValueError: If the document is not found or no documents are open.
     """
-    if app.Documents.Count == 0:
+    count = app.Documents.Count
+    if count == 0:
         raise ValueError("No documents are open in Word")
 
     if not filename:
@@ -134,20 +176,43 @@ def find_document(app, filename: str = None):
         if os.path.isabs(filename) else None
     )
 
-    for i in range(1, app.Documents.Count + 1):
-        doc = app.Documents(i)
-        if unicodedata.normalize('NFC', doc.Name).lower() == target_basename:
-            return doc
-        if target_fullpath and unicodedata.normalize('NFC', os.path.normpath(doc.FullName)).lower() == target_fullpath:
+    # Every Documents(i) / .Name / .FullName access is a cross-process COM
+    # round-trip, so snapshot the collection and fetch each property exactly
+    # once, then match against local dicts. setdefault keeps the earliest
+    # document when two share a name, matching the old first-match scan.
+    docs = [app.Documents(i) for i in range(1, count + 1)]
+    raw_names = [doc.Name for doc in docs]
+
+    by_name = {}
+    for doc, raw_name in zip(docs, raw_names):
+        by_name.setdefault(unicodedata.normalize('NFC', raw_name).lower(), doc)
+    doc = by_name.get(target_basename)
+    if doc is not None:
+        return doc
+
+    if target_fullpath:
+        # FullName costs another round-trip per document; only pay it when
+        # the caller actually passed an absolute path.
+        by_path = {}
+        for doc in docs:
+            by_path.setdefault(
+                unicodedata.normalize('NFC', os.path.normpath(doc.FullName)).lower(), doc
+            )
+        doc = by_path.get(target_fullpath)
+        if doc is not None:
             return doc
 
-    open_docs = [app.Documents(i).Name for i in range(1, app.Documents.Count + 1)]
     raise ValueError(
         f"Document '{filename}' is not open in Word. "
-        f"Open documents: {open_docs}"
+        f"Open documents: {raw_names}"
     )
 
 
+# Non-zero while a batch_session is active: nested undo_record calls from
+# the individual tools must not end the batch's custom record.
+_BATCH_DEPTH = 0
+
+
 @contextmanager
 def undo_record(app, name: str):
     """Wrap a block of COM mutations in a single Word UndoRecord.
@@ -165,6 +230,12 @@ def undo_record(app, name: str):
         with undo_record(app, "MCP: Insert Text"):
             doc.Range(0, 0).InsertBefore("Hello")
     """
+    if _BATCH_DEPTH:
+        # A batch_session already holds the custom record; grouping every
+        # nested edit under it is exactly what the batch wants.
+        yield
+        return
+
     rec = None
     try:
         rec = app.UndoRecord
@@ -185,3 +256,58 @@ def undo_record(app, name: str):
                 rec.EndCustomRecord()
             except Exception:
                 pass
+
+
+@contextmanager
+def batch_session(app, name: str = "MCP: Batch"):
+    """Run a batch of COM edits with redraw and background work suspended.
+
+    Turns off ScreenUpdating, background pagination, and as-you-type
+    proofing for the duration of the block, and groups everything under a
+    single UndoRecord, so N edits cost one layout recompute instead of N.
+    All flags are restored afterwards even on error; each toggle degrades
+    gracefully on Word versions that lack it.
+
+    Usage::
+
+        with batch_session(app, "MCP: Batch Edits"):
+            ...  # any number of COM mutations, including undo_record users
+    """
+    global _BATCH_DEPTH
+
+    saved = []
+
+    def _suspend(obj, attr, value):
+        try:
+            saved.append((obj, attr, getattr(obj, attr)))
+            setattr(obj, attr, value)
+        except Exception:
+            pass  # older Word: leave the flag alone
+
+    _suspend(app, "ScreenUpdating", False)
+    try:
+        options = app.Options
+    except Exception:
+        options = None
+    if options is not None:
+        _suspend(options, "Pagination", False)
+        _suspend(options, "CheckGrammarAsYouType", False)
+        _suspend(options, "CheckSpellingAsYouType", False)
+
+    try:
+        with undo_record(app, name):
+            _BATCH_DEPTH += 1
+            try:
+                yield
+            finally:
+                _BATCH_DEPTH -= 1
+    finally:
+        for obj, attr, value in reversed(saved):
+            try:
+                setattr(obj, attr, value)
+            except Exception:
+                pass
+        try:
+            app.ScreenRefresh()
+        except Exception:
+            pass
@@ -2,73 +2,203 @@
 Main entry point for the Word Document MCP Server.
 Acts as the central controller for the MCP server that handles Word document operations.
 Supports multiple transports: stdio, sse, and streamable-http using standalone FastMCP.
+
+Importing this module is side-effect free apart from a one-time, guarded
+.env load (needed before the module-level FastMCP instance reads its
+settings): logging setup, tool registration, and transport startup all
+happen inside run_server().  Tests and MCP inspectors can therefore do
+``from word_document_server.main import mcp`` without spawning a server
+or writing to stdout.
 """
 
+import asyncio
+import functools
+import importlib
+from dataclasses import dataclass
+import logging
 import os
 import sys
+import threading
 from dotenv import load_dotenv
 from word_document_server.defaults import DEFAULT_AUTHOR, DEFAULT_INITIALS
 
-# Load environment variables from .env file
-print("Loading configuration from .env file...", file=sys.stderr)
-load_dotenv()
+# All informational output goes through this logger, whose handler writes to
+# stderr: on the stdio transport, stdout carries the JSON-RPC stream, and a
+# single stray print() there corrupts the protocol.
+logger = logging.getLogger("word_mcp")
+
+# Load environment variables from .env file.  The sentinel skips re-parsing
+# .env when the module is re-imported (e.g. under reload-style dev servers),
+# and override=False keeps explicitly exported variables authoritative.
+if not os.getenv('_DOTENV_LOADED'):
+    load_dotenv(override=False)
+    os.environ['_DOTENV_LOADED'] = '1'
 # Set required environment variable for FastMCP 2.8.1+
 os.environ.setdefault('FASTMCP_LOG_LEVEL', 'INFO')
 from fastmcp import FastMCP
+from fastmcp.server.middleware.caching import MemoryStore, ResponseCachingMiddleware
 from mcp.types import ToolAnnotations
+from starlette.responses import JSONResponse
+
+# The live/screen-capture modules only import stdlib at top level (their COM
+# and GUI dependencies load inside each function), so importing them here is
+# effectively free.
 from word_document_server.tools import (
-    document_tools,
-    content_tools,
-    format_tools,
-    protection_tools,
-    footnote_tools,
-    extended_document_tools,
-    comment_tools,
-    comment_write_tools,
-    hyperlink_tools,
-    tracked_changes_tools,
     live_tools,
     live_read_tools,
     live_layout_tools,
     screen_capture_tools,
-    layout_tools,
 )
-from word_document_server.tools.content_tools import replace_paragraph_block_below_header_tool
-from word_document_server.tools.content_tools import replace_block_between_manual_anchors_tool
+# The file-based tool modules pull in python-docx and lxml, which dominate
+# server startup time.  They are imported on the first call that needs them
+# instead of at registration; the tool wrappers below only publish name,
+# annotations, and schema up front.
+_TOOL_MODULE_CACHE = {}
+
+
+def _load(modname):
+    """Import a tools submodule on first use and memoize it."""
+    module = _TOOL_MODULE_CACHE.get(modname)
+    if module is None:
+        module = importlib.import_module(f"word_document_server.tools.{modname}")
+        _TOOL_MODULE_CACHE[modname] = module
+    return module
+
+
+# Tool profiles let a client opt into schema cost incrementally: only the
+# profiles named in MCP_TOOL_PROFILE are registered at startup, and the
+# discover_tools meta-tool activates the rest on demand.
+TOOL_PROFILES = (
+    "core",
+    "content",
+    "formatting",
+    "tables",
+    "protection",
+    "footnotes",
+    "comments",
+    "tracked",
+    "layout",
+    "live",
+)
+_active_profiles = set()
+
+
+def _live_supported():
+    """Whether the live (COM/JXA) profile can work in this environment.
+
+    The live tool modules themselves are cheap to import (their COM and GUI
+    dependencies load inside each function), so this gates registration
+    rather than imports: on headless Linux deployments the live tools can
+    never attach to a running Word instance, and listing 57 dead tools only
+    bloats every tools/list response.  WORD_MCP_ENABLE_LIVE=1/0 overrides
+    the platform default.
+    """
+    env = os.getenv('WORD_MCP_ENABLE_LIVE')
+    if env is not None:
+        return env.strip().lower() in ('1', 'true', 'yes')
+    return sys.platform in ('win32', 'darwin')
+_pending_tools = {}  # profile -> [(tool kwargs, wrapper)] parked until discovered
+
+
+# The hint flags only occur in a handful of combinations, so the pydantic
+# models are built once here and shared across tools (ToolAnnotations is
+# immutable after validation).  The human-readable title rides on the
+# Tool-level ``title`` field, which the MCP spec prefers over
+# ``annotations.title``, so sharing does not lose per-tool titles.
+_ANNOTATION_SHAPES = {
+    (None, None): ToolAnnotations(),
+    (True, None): ToolAnnotations(readOnlyHint=True),
+    (None, True): ToolAnnotations(destructiveHint=True),
+    (False, False): ToolAnnotations(readOnlyHint=False, destructiveHint=False),
+    (False, True): ToolAnnotations(readOnlyHint=False, destructiveHint=True),
+}
+
+
+def _tool(profile, title, *, read_only=None, destructive=None, description=None,
+          output_schema=None):
+    """Declarative tool registration shared by every wrapper below.
+
+    Picks the shared ToolAnnotations instance for the hint flags — one
+    code path instead of a hand-written pydantic block per tool — and
+    respects the active profile set: wrappers in inactive profiles are
+    parked instead of registered so discover_tools can add them to the
+    session later.  Hint flags left as None are omitted from the
+    annotations.
+    """
+    kwargs = {'title': title, 'annotations': _ANNOTATION_SHAPES[(read_only, destructive)]}
+    if description is not None:
+        kwargs['description'] = description
+    if output_schema is not None:
+        kwargs['output_schema'] = output_schema
+
+    if profile in _active_profiles:
+        return mcp.tool(**kwargs)
+
+    def park(fn):
+        _pending_tools.setdefault(profile, []).append((kwargs, fn))
+        return fn
+
+    return park
+
+
+def _activate_profile(profile):
+    """Register every parked tool of a profile; returns the tool names."""
+    names = []
+    for kwargs, fn in _pending_tools.pop(profile, []):
+        mcp.tool(**kwargs)(fn)
+        names.append(fn.__name__)
+    _active_profiles.add(profile)
+    return names
+
+@dataclass(slots=True, frozen=True)
+class TransportConfig:
+    """Immutable transport settings resolved once at startup.
+
+    Defaults match the historical config dict; frozen so a long-lived HTTP
+    session cannot be broken by accidental mutation after startup.
+    """
+    transport: str = 'stdio'  # Default to stdio for backward compatibility
+    host: str = '0.0.0.0'
+    port: int = 8000
+    path: str = '/mcp'
+    sse_path: str = '/sse'
 
+
+@functools.lru_cache(maxsize=1)
 def get_transport_config():
     """
     Get transport configuration from environment variables.
-    
+
+    The environment does not change after startup, so the result is computed
+    once and memoized.
+
     Returns:
-        dict: Transport configuration with type, host, port, and other settings
+        TransportConfig: Transport configuration with type, host, port, and
+        other settings
     """
-    # Default configuration
-    config = {
-        'transport': 'stdio',  # Default to stdio for backward compatibility
-        'host': '0.0.0.0',
-        'port': 8000,
-        'path': '/mcp',
-        'sse_path': '/sse'
-    }
-    
-    # Override with environment variables if provided
-    transport = os.getenv('MCP_TRANSPORT', 'stdio').lower()
-    print(f"Transport: {transport}", file=sys.stderr)
+    defaults = TransportConfig()
+
+    # Override with environment variables if provided.  Hosted platforms
+    # (Render sets PORT/RENDER) need a long-lived HTTP server rather than a
+    # stdio pipe, so they default to streamable-http; local clients that
+    # spawn the server keep the stdio default.
+    default_transport = 'streamable-http' if (os.getenv('PORT') or os.getenv('RENDER')) else 'stdio'
+    transport = os.getenv('MCP_TRANSPORT', default_transport).lower()
+    logger.info("Transport: %s", transport)
     # Validate transport type
     valid_transports = ['stdio', 'streamable-http', 'sse']
     if transport not in valid_transports:
-        print(f"Warning: Invalid transport '{transport}'. Falling back to 'stdio'.", file=sys.stderr)
+        logger.warning("Invalid transport '%s'. Falling back to 'stdio'.", transport)
         transport = 'stdio'
-    
-    config['transport'] = transport
-    config['host'] = os.getenv('MCP_HOST', config['host'])
-    # Use PORT from Render if available, otherwise fall back to MCP_PORT or default
-    config['port'] = int(os.getenv('PORT', os.getenv('MCP_PORT', config['port'])))
-    config['path'] = os.getenv('MCP_PATH', config['path'])
-    config['sse_path'] = os.getenv('MCP_SSE_PATH', config['sse_path'])
-    
-    return config
+
+    return TransportConfig(
+        transport=transport,
+        host=os.getenv('MCP_HOST', defaults.host),
+        # Use PORT from Render if available, otherwise fall back to MCP_PORT or default
+        port=int(os.getenv('PORT', os.getenv('MCP_PORT', defaults.port))),
+        path=os.getenv('MCP_PATH', defaults.path),
+        sse_path=os.getenv('MCP_SSE_PATH', defaults.sse_path),
+    )
 
 
 def setup_logging(debug_mode):
@@ -78,65 +208,139 @@ def setup_logging(debug_mode):
     Args:
         debug_mode (bool): Whether to enable debug logging
     """
-    import logging
-    
     if debug_mode:
         logging.basicConfig(
+            stream=sys.stderr,
             level=logging.DEBUG,
             format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
         )
-        print("Debug logging enabled", file=sys.stderr)
+        logger.debug("Debug logging enabled")
     else:
         logging.basicConfig(
+            stream=sys.stderr,
             level=logging.INFO,
             format='%(asctime)s - %(levelname)s - %(message)s'
         )
 
 
-# Initialize FastMCP server
-mcp = FastMCP("Word Document Server")
+# Initialize FastMCP server.  The MCP SDK re-enumerates the tool registry on
+# every tools/list (and several times per tools/call), which with this many
+# tools means rebuilding every schema each time; cache the response for five
+# minutes instead.  tools/call caching stays off — the tools mutate files on
+# disk, so replaying a cached result would be wrong.
+_tool_list_cache = MemoryStore()
+mcp = FastMCP(
+    "Word Document Server",
+    middleware=[
+        ResponseCachingMiddleware(
+            cache_storage=_tool_list_cache,
+            list_tools_settings={"ttl": 300},
+            call_tool_settings={"enabled": False},
+            read_resource_settings={"enabled": False},
+            get_prompt_settings={"enabled": False},
+        ),
+    ],
+)
 
 
 def register_tools():
-    """Register all tools with the MCP server using FastMCP decorators."""
-    
-    # Document tools (create, copy, info, etc.)
+    """Register all tools with the MCP server using FastMCP decorators.
+
+    Only the profiles named in MCP_TOOL_PROFILE (comma-separated, default
+    "core"; "all" enables everything) are registered immediately.  The rest
+    are parked and can be activated mid-session with discover_tools.
+    """
+    requested = os.getenv("MCP_TOOL_PROFILE", "core").strip().lower()
+    if requested == "all":
+        _active_profiles.update(TOOL_PROFILES)
+    else:
+        for name in requested.split(","):
+            name = name.strip()
+            if name in TOOL_PROFILES:
+                _active_profiles.add(name)
+            elif name:
+                logger.warning("Unknown tool profile '%s'. Available: %s",
+                               name, ', '.join(TOOL_PROFILES))
+    if 'live' in _active_profiles and not _live_supported():
+        _active_profiles.discard('live')
+        logger.info("Live profile disabled: no Word automation on this "
+                    "platform (set WORD_MCP_ENABLE_LIVE=1 to force).")
+
+    @mcp.custom_route("/health", methods=["GET"])
+    async def health(request):
+        """Liveness probe for container orchestrators (HTTP transports only).
+
+        Answers without creating an MCP session, so healthchecks stay cheap
+        and don't churn the session store.
+        """
+        return JSONResponse({"ok": True})
+
     @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Create Word Document",
-            destructiveHint=True,
-        ),
+        title="Discover Tools",
+        annotations=_ANNOTATION_SHAPES[(True, None)],
+        # Loose on purpose: the result is a profile listing, an activation
+        # report, or an error, so only the top-level shape is promised.
+        output_schema={"type": "object"},
     )
+    async def discover_tools(category: str = None):
+        """List tool profiles, or activate one to register its tools.
+
+        Without a category, returns which profiles are active and which are
+        still available.  With a category (e.g. 'tables', 'footnotes',
+        'live', or 'all'), registers that profile's tools for this session
+        and returns their names.
+        """
+        if not category:
+            return {
+                "active_profiles": sorted(_active_profiles),
+                "available_profiles": [p for p in TOOL_PROFILES
+                                       if p not in _active_profiles
+                                       and (p != 'live' or _live_supported())],
+            }
+        category = category.strip().lower()
+        if category == 'live' and not _live_supported():
+            return {"error": "The live profile needs Word automation "
+                             "(Windows COM or macOS JXA), which is not "
+                             "available on this platform. Set "
+                             "WORD_MCP_ENABLE_LIVE=1 to force it."}
+        if category == "all":
+            wanted = [p for p in TOOL_PROFILES
+                      if p not in _active_profiles
+                      and (p != 'live' or _live_supported())]
+        elif category in TOOL_PROFILES:
+            wanted = [category]
+        else:
+            return {"error": f"Unknown profile '{category}'. "
+                             f"Available: {', '.join(TOOL_PROFILES)}"}
+        registered = {profile: _activate_profile(profile) for profile in wanted}
+        # The cached tools/list responses are now stale; delete them so the
+        # next enumeration sees the newly registered tools.  (Deleting keys
+        # keeps the collection usable, unlike destroy_collection.)
+        try:
+            stale = await _tool_list_cache.keys(collection="tools/list")
+        except KeyError:
+            stale = []  # nothing was cached yet
+        if stale:
+            await _tool_list_cache.delete_many(keys=stale, collection="tools/list")
+        return {"registered": registered, "active_profiles": sorted(_active_profiles)}
+
+    # Document tools (create, copy, info, etc.)
+    @_tool("core", "Create Word Document", destructive=True)
     def create_document(filename: str, title: str = None, author: str = None):
         """Create a new Word document with optional metadata."""
-        return document_tools.create_document(filename, title, author)
+        return _load("document_tools").create_document(filename, title, author)
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Copy Word Document",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("core", "Copy Word Document", destructive=True)
     def copy_document(source_filename: str, destination_filename: str = None):
         """Create a copy of a Word document."""
-        return document_tools.copy_document(source_filename, destination_filename)
+        return _load("document_tools").copy_document(source_filename, destination_filename)
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Get Document Info",
-            readOnlyHint=True,
-        ),
-    )
+    @_tool("core", "Get Document Info", read_only=True)
     def get_document_info(filename: str):
         """Get information about a Word document."""
-        return document_tools.get_document_info(filename)
+        return _load("document_tools").get_document_info(filename)
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Get Document Text",
-            readOnlyHint=True,
-        ),
-    )
+    @_tool("core", "Get Document Text", read_only=True)
     def get_document_text(filename: str, show_revisions: bool = False):
         """Extract all text from a Word document.
 
@@ -144,80 +348,41 @@ def register_tools():
         deletions removed).  Set show_revisions=True to get inline redline
         markup where deletions appear as [-deleted-] and insertions as
         {+inserted+}."""
-        return document_tools.get_document_text(filename, show_revisions=show_revisions)
+        return _load("document_tools").get_document_text(filename, show_revisions=show_revisions)
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Get Document Outline",
-            readOnlyHint=True,
-        ),
-    )
+    @_tool("core", "Get Document Outline", read_only=True)
     def get_document_outline(filename: str):
         """Get the structure of a Word document."""
-        return document_tools.get_document_outline(filename)
+        return _load("document_tools").get_document_outline(filename)
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="List Available Documents",
-            readOnlyHint=True,
-        ),
-    )
+    @_tool("core", "List Available Documents", read_only=True)
     def list_available_documents(directory: str = "."):
         """List all .docx files in the specified directory."""
-        return document_tools.list_available_documents(directory)
+        return _load("document_tools").list_available_documents(directory)
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Get Document XML",
-            readOnlyHint=True,
-        ),
-    )
+    @_tool("core", "Get Document XML", read_only=True)
     def get_document_xml(filename: str):
         """Get the raw XML structure of a Word document."""
-        return document_tools.get_document_xml_tool(filename)
+        return _load("document_tools").get_document_xml_tool(filename)
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Insert Header Near Text",
-            readOnlyHint=False,
-            destructiveHint=False,
-        ),
-    )
+    @_tool("content", "Insert Header Near Text", read_only=False, destructive=False)
     def insert_header_near_text(filename: str, target_text: str = None, header_title: str = None, position: str = 'after', header_style: str = 'Heading 1', target_paragraph_index: int = None):
         """Insert a header (with specified style) before or after the target paragraph. Specify by text or paragraph index. Args: filename (str), target_text (str, optional), header_title (str), position ('before' or 'after'), header_style (str, default 'Heading 1'), target_paragraph_index (int, optional)."""
-        return content_tools.insert_header_near_text_tool(filename, target_text, header_title, position, header_style, target_paragraph_index)
+        return _load("content_tools").insert_header_near_text_tool(filename, target_text, header_title, position, header_style, target_paragraph_index)
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Insert Line Near Text",
-            readOnlyHint=False,
-            destructiveHint=False,
-        ),
-    )
+    @_tool("content", "Insert Line Near Text", read_only=False, destructive=False)
     def insert_line_or_paragraph_near_text(filename: str, target_text: str = None, line_text: str = None, position: str = 'after', line_style: str = None, target_paragraph_index: int = None):
         """
         Insert a new line or paragraph (with specified or matched style) before or after the target paragraph. Specify by text or paragraph index. Args: filename (str), target_text (str, optional), line_text (str), position ('before' or 'after'), line_style (str, optional), target_paragraph_index (int, optional).
         """
-        return content_tools.insert_line_or_paragraph_near_text_tool(filename, target_text, line_text, position, line_style, target_paragraph_index)
+        return _load("content_tools").insert_line_or_paragraph_near_text_tool(filename, target_text, line_text, position, line_style, target_paragraph_index)
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Insert List Near Text",
-            readOnlyHint=False,
-            destructiveHint=False,
-        ),
-    )
+    @_tool("content", "Insert List Near Text", read_only=False, destructive=False)
     def insert_numbered_list_near_text(filename: str, target_text: str = None, list_items: list[str] = None, position: str = 'after', target_paragraph_index: int = None, bullet_type: str = 'bullet'):
         """Insert a bulleted or numbered list before or after the target paragraph. Specify by text or paragraph index. Args: filename (str), target_text (str, optional), list_items (list of str), position ('before' or 'after'), target_paragraph_index (int, optional), bullet_type ('bullet' for bullets or 'number' for numbered lists, default: 'bullet')."""
-        return content_tools.insert_numbered_list_near_text_tool(filename, target_text, list_items, position, target_paragraph_index, bullet_type)
+        return _load("content_tools").insert_numbered_list_near_text_tool(filename, target_text, list_items, position, target_paragraph_index, bullet_type)
     # Content tools (paragraphs, headings, tables, etc.)
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Add Paragraph",
-            readOnlyHint=False,
-            destructiveHint=False,
-        ),
-    )
+    @_tool("core", "Add Paragraph", read_only=False, destructive=False)
     def add_paragraph(filename: str, text: str, style: str = None,
                       font_name: str = None, font_size: int = None,
                       bold: bool = None, italic: bool = None, color: str = None):
@@ -233,15 +398,9 @@ def register_tools():
             italic: Make text italic
             color: Text color as hex RGB (e.g., '000000')
         """
-        return content_tools.add_paragraph(filename, text, style, font_name, font_size, bold, italic, color)
+        return _load("content_tools").add_paragraph(filename, text, style, font_name, font_size, bold, italic, color)
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Add Heading",
-            readOnlyHint=False,
-            destructiveHint=False,
-        ),
-    )
+    @_tool("core", "Add Heading", read_only=False, destructive=False)
     def add_heading(filename: str, text: str, level: int = 1,
                     font_name: str = None, font_size: int = None,
                     bold: bool = None, italic: bool = None, border_bottom: bool = False):
@@ -257,466 +416,279 @@ def register_tools():
             italic: Make heading italic
             border_bottom: Add bottom border (for section headers)
         """
-        return content_tools.add_heading(filename, text, level, font_name, font_size, bold, italic, border_bottom)
+        return _load("content_tools").add_heading(filename, text, level, font_name, font_size, bold, italic, border_bottom)
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Add Picture",
-            readOnlyHint=False,
-            destructiveHint=False,
-        ),
-    )
+    @_tool("content", "Add Picture", read_only=False, destructive=False)
     def add_picture(filename: str, image_path: str, width: float = None):
         """Add an image to a Word document."""
-        return content_tools.add_picture(filename, image_path, width)
+        return _load("content_tools").add_picture(filename, image_path, width)
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Add Table",
-            readOnlyHint=False,
-            destructiveHint=False,
-        ),
-    )
+    @_tool("content", "Add Table", read_only=False, destructive=False)
     def add_table(filename: str, rows: int, cols: int, data: list[list[str]] = None):
         """Add a table to a Word document."""
-        return content_tools.add_table(filename, rows, cols, data)
+        return _load("content_tools").add_table(filename, rows, cols, data)
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Add Page Break",
-            readOnlyHint=False,
-            destructiveHint=False,
-        ),
-    )
+    @_tool("content", "Add Page Break", read_only=False, destructive=False)
     def add_page_break(filename: str):
         """Add a page break to the document."""
-        return content_tools.add_page_break(filename)
+        return _load("content_tools").add_page_break(filename)
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Delete Paragraph",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("content", "Delete Paragraph", destructive=True)
     def delete_paragraph(filename: str, paragraph_index: int):
         """Delete a paragraph from a document."""
-        return content_tools.delete_paragraph(filename, paragraph_index)
+        return _load("content_tools").delete_paragraph(filename, paragraph_index)
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Search and Replace",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("core", "Search and Replace", destructive=True)
     def search_and_replace(filename: str, find_text: str, replace_text: str):
         """Search for text and replace all occurrences."""
-        return content_tools.search_and_replace(filename, find_text, replace_text)
+        return _load("content_tools").search_and_replace(filename, find_text, replace_text)
     
     # Format tools (styling, text formatting, etc.)
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Create Custom Style",
-            readOnlyHint=False,
-            destructiveHint=False,
-        ),
-    )
+    @_tool("formatting", "Create Custom Style", read_only=False, destructive=False)
     def create_custom_style(filename: str, style_name: str, bold: bool = None,
                           italic: bool = None, font_size: int = None,
                           font_name: str = None, color: str = None,
                           base_style: str = None):
         """Create a custom style in the document."""
-        return format_tools.create_custom_style(
+        return _load("format_tools").create_custom_style(
             filename, style_name, bold, italic, font_size, font_name, color, base_style
         )
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Format Text",
-            readOnlyHint=False,
-            destructiveHint=False,
-        ),
-        description=format_tools.format_text.__doc__,
-    )
+    @_tool("formatting", "Format Text", read_only=False, destructive=False)
     def format_text(filename: str, paragraph_index: int, start_pos: int, end_pos: int,
                    bold: bool = None, italic: bool = None, underline: bool = None,
                    color: str = None, font_size: int = None, font_name: str = None):
-        return format_tools.format_text(
+        """Format text within a paragraph using python-docx (cross-platform, file-based).
+        Only supports: bold, italic, underline, color, font_size, font_name.
+        Does NOT support: highlight colors, styles, tracked changes.
+        For highlight/style changes, use word_live_format_text instead (Windows only).
+
+        Args:
+            filename: Path to the Word document (must not be open in Word).
+            paragraph_index: Index of the paragraph (0-based).
+            start_pos: Start position within the paragraph text.
+            end_pos: End position within the paragraph text.
+            bold: Set text bold (True/False).
+            italic: Set text italic (True/False).
+            underline: Set text underlined (True/False).
+            color: Text color — named ("red", "blue") or hex ("FF0000").
+            font_size: Font size in points.
+            font_name: Font name/family (e.g., "Arial").
+        """
+        return _load("format_tools").format_text(
             filename, paragraph_index, start_pos, end_pos, bold, italic,
             underline, color, font_size, font_name
         )
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Format Table",
-            readOnlyHint=False,
-            destructiveHint=False,
-        ),
-    )
+    @_tool("tables", "Format Table", read_only=False, destructive=False)
     def format_table(filename: str, table_index: int, has_header_row: bool = None,
                     border_style: str = None, shading: list[str] = None):
         """Format a table with borders, shading, and structure."""
-        return format_tools.format_table(filename, table_index, has_header_row, border_style, shading)
+        return _load("format_tools").format_table(filename, table_index, has_header_row, border_style, shading)
     
     # New table cell shading tools
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Set Table Cell Shading",
-            readOnlyHint=False,
-            destructiveHint=False,
-        ),
-    )
+    @_tool("tables", "Set Table Cell Shading", read_only=False, destructive=False)
     def set_table_cell_shading(filename: str, table_index: int, row_index: int,
                               col_index: int, fill_color: str, pattern: str = "clear"):
         """Apply shading/filling to a specific table cell."""
-        return format_tools.set_table_cell_shading(filename, table_index, row_index, col_index, fill_color, pattern)
+        return _load("format_tools").set_table_cell_shading(filename, table_index, row_index, col_index, fill_color, pattern)
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Apply Alternating Row Colors",
-            readOnlyHint=False,
-            destructiveHint=False,
-        ),
-    )
+    @_tool("tables", "Apply Alternating Row Colors", read_only=False, destructive=False)
     def apply_table_alternating_rows(filename: str, table_index: int,
                                    color1: str = "FFFFFF", color2: str = "F2F2F2"):
         """Apply alternating row colors to a table for better readability."""
-        return format_tools.apply_table_alternating_rows(filename, table_index, color1, color2)
+        return _load("format_tools").apply_table_alternating_rows(filename, table_index, color1, color2)
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Highlight Table Header",
-            readOnlyHint=False,
-            destructiveHint=False,
-        ),
-    )
+    @_tool("tables", "Highlight Table Header", read_only=False, destructive=False)
     def highlight_table_header(filename: str, table_index: int,
                              header_color: str = "4472C4", text_color: str = "FFFFFF"):
         """Apply special highlighting to table header row."""
-        return format_tools.highlight_table_header(filename, table_index, header_color, text_color)
+        return _load("format_tools").highlight_table_header(filename, table_index, header_color, text_color)
     
     # Cell merging tools
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Merge Table Cells",
-            readOnlyHint=False,
-            destructiveHint=True,
-        ),
-    )
+    @_tool("tables", "Merge Table Cells", read_only=False, destructive=True)
     def merge_table_cells(filename: str, table_index: int, start_row: int, start_col: int,
                         end_row: int, end_col: int):
         """Merge cells in a rectangular area of a table."""
-        return format_tools.merge_table_cells(filename, table_index, start_row, start_col, end_row, end_col)
+        return _load("format_tools").merge_table_cells(filename, table_index, start_row, start_col, end_row, end_col)
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Merge Cells Horizontally",
-            readOnlyHint=False,
-            destructiveHint=True,
-        ),
-    )
+    @_tool("tables", "Merge Cells Horizontally", read_only=False, destructive=True)
     def merge_table_cells_horizontal(filename: str, table_index: int, row_index: int,
                                    start_col: int, end_col: int):
         """Merge cells horizontally in a single row."""
-        return format_tools.merge_table_cells_horizontal(filename, table_index, row_index, start_col, end_col)
+        return _load("format_tools").merge_table_cells_horizontal(filename, table_index, row_index, start_col, end_col)
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Merge Cells Vertically",
-            readOnlyHint=False,
-            destructiveHint=True,
-        ),
-    )
+    @_tool("tables", "Merge Cells Vertically", read_only=False, destructive=True)
     def merge_table_cells_vertical(filename: str, table_index: int, col_index: int,
                                  start_row: int, end_row: int):
         """Merge cells vertically in a single column."""
-        return format_tools.merge_table_cells_vertical(filename, table_index, col_index, start_row, end_row)
+        return _load("format_tools").merge_table_cells_vertical(filename, table_index, col_index, start_row, end_row)
     
     # Cell alignment tools
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Set Cell Alignment",
-            readOnlyHint=False,
-            destructiveHint=False,
-        ),
-    )
+    @_tool("tables", "Set Cell Alignment", read_only=False, destructive=False)
     def set_table_cell_alignment(filename: str, table_index: int, row_index: int, col_index: int,
                                horizontal: str = "left", vertical: str = "top"):
         """Set text alignment for a specific table cell."""
-        return format_tools.set_table_cell_alignment(filename, table_index, row_index, col_index, horizontal, vertical)
+        return _load("format_tools").set_table_cell_alignment(filename, table_index, row_index, col_index, horizontal, vertical)
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Set Table Alignment",
-            readOnlyHint=False,
-            destructiveHint=False,
-        ),
-    )
+    @_tool("tables", "Set Table Alignment", read_only=False, destructive=False)
     def set_table_alignment_all(filename: str, table_index: int,
                               horizontal: str = "left", vertical: str = "top"):
         """Set text alignment for all cells in a table."""
-        return format_tools.set_table_alignment_all(filename, table_index, horizontal, vertical)
+        return _load("format_tools").set_table_alignment_all(filename, table_index, horizontal, vertical)
     
     # Protection tools
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Protect Document",
-            readOnlyHint=False,
-            destructiveHint=True,
-        ),
-    )
+    @_tool("protection", "Protect Document", read_only=False, destructive=True)
     def protect_document(filename: str, password: str):
         """Add password protection to a Word document."""
-        return protection_tools.protect_document(filename, password)
+        return _load("protection_tools").protect_document(filename, password)
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Unprotect Document",
-            readOnlyHint=False,
-            destructiveHint=True,
-        ),
-    )
+    @_tool("protection", "Unprotect Document", read_only=False, destructive=True)
     def unprotect_document(filename: str, password: str):
         """Remove password protection from a Word document."""
-        return protection_tools.unprotect_document(filename, password)
+        return _load("protection_tools").unprotect_document(filename, password)
     
     # Footnote tools
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Add Footnote",
-            readOnlyHint=False,
-            destructiveHint=False,
-        ),
-    )
+    @_tool("footnotes", "Add Footnote", read_only=False, destructive=False)
     def add_footnote_to_document(filename: str, paragraph_index: int, footnote_text: str):
         """Add a footnote to a specific paragraph in a Word document."""
-        return footnote_tools.add_footnote_to_document(filename, paragraph_index, footnote_text)
+        return _load("footnote_tools").add_footnote_to_document(filename, paragraph_index, footnote_text)
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Add Footnote After Text",
-            readOnlyHint=False,
-            destructiveHint=False,
-        ),
-    )
+    @_tool("footnotes", "Add Footnote After Text", read_only=False, destructive=False)
     def add_footnote_after_text(filename: str, search_text: str, footnote_text: str,
                                output_filename: str = None):
         """Add a footnote after specific text with proper superscript formatting.
         This enhanced function ensures footnotes display correctly as superscript."""
-        return footnote_tools.add_footnote_after_text(filename, search_text, footnote_text, output_filename)
+        return _load("footnote_tools").add_footnote_after_text(filename, search_text, footnote_text, output_filename)
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Add Footnote Before Text",
-            readOnlyHint=False,
-            destructiveHint=False,
-        ),
-    )
+    @_tool("footnotes", "Add Footnote Before Text", read_only=False, destructive=False)
     def add_footnote_before_text(filename: str, search_text: str, footnote_text: str,
                                 output_filename: str = None):
         """Add a footnote before specific text with proper superscript formatting.
         This enhanced function ensures footnotes display correctly as superscript."""
-        return footnote_tools.add_footnote_before_text(filename, search_text, footnote_text, output_filename)
+        return _load("footnote_tools").add_footnote_before_text(filename, search_text, footnote_text, output_filename)
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Add Footnote Enhanced",
-            readOnlyHint=False,
-            destructiveHint=False,
-        ),
-    )
+    @_tool("footnotes", "Add Footnote Enhanced", read_only=False, destructive=False)
     def add_footnote_enhanced(filename: str, paragraph_index: int, footnote_text: str,
                              output_filename: str = None):
         """Enhanced footnote addition with guaranteed superscript formatting.
         Adds footnote at the end of a specific paragraph with proper style handling."""
-        return footnote_tools.add_footnote_enhanced(filename, paragraph_index, footnote_text, output_filename)
+        return _load("footnote_tools").add_footnote_enhanced(filename, paragraph_index, footnote_text, output_filename)
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Add Endnote",
-            readOnlyHint=False,
-            destructiveHint=False,
-        ),
-    )
+    @_tool("footnotes", "Add Endnote", read_only=False, destructive=False)
     def add_endnote_to_document(filename: str, paragraph_index: int, endnote_text: str):
         """Add an endnote to a specific paragraph in a Word document."""
-        return footnote_tools.add_endnote_to_document(filename, paragraph_index, endnote_text)
+        return _load("footnote_tools").add_endnote_to_document(filename, paragraph_index, endnote_text)
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Customize Footnote Style",
-            readOnlyHint=False,
-            destructiveHint=False,
-        ),
-    )
+    @_tool("footnotes", "Customize Footnote Style", read_only=False, destructive=False)
     def customize_footnote_style(filename: str, numbering_format: str = "1, 2, 3",
                                 start_number: int = 1, font_name: str = None,
                                 font_size: int = None):
         """Customize footnote numbering and formatting in a Word document."""
-        return footnote_tools.customize_footnote_style(
+        return _load("footnote_tools").customize_footnote_style(
             filename, numbering_format, start_number, font_name, font_size
         )
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Delete Footnote",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("footnotes", "Delete Footnote", destructive=True)
     def delete_footnote_from_document(filename: str, footnote_id: int = None,
                                      search_text: str = None, output_filename: str = None):
         """Delete a footnote from a Word document.
         Identify the footnote either by ID (1, 2, 3, etc.) or by searching for text near it."""
-        return footnote_tools.delete_footnote_from_document(
+        return _load("footnote_tools").delete_footnote_from_document(
             filename, footnote_id, search_text, output_filename
         )
     
     # Robust footnote tools - Production-ready with comprehensive validation
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Add Footnote Robust",
-            readOnlyHint=False,
-            destructiveHint=False,
-        ),
-    )
+    @_tool("footnotes", "Add Footnote Robust", read_only=False, destructive=False)
     def add_footnote_robust(filename: str, search_text: str = None,
                            paragraph_index: int = None, footnote_text: str = "",
                            validate_location: bool = True, auto_repair: bool = False):
         """Add footnote with robust validation and Word compliance.
         This is the production-ready version with comprehensive error handling."""
-        return footnote_tools.add_footnote_robust_tool(
+        return _load("footnote_tools").add_footnote_robust_tool(
             filename, search_text, paragraph_index, footnote_text,
             validate_location, auto_repair
         )
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Validate Footnotes",
-            readOnlyHint=True,
-        ),
-    )
+    # Declaring the result shape lets schema-aware clients cache and dedupe
+    # repeat validations.  Only the dict-returning tools can declare one:
+    # the JSON-string tools return plain error strings on failure, which an
+    # object schema would reject.
+    @_tool("footnotes", "Validate Footnotes", read_only=True,
+           output_schema={
+               "type": "object",
+               "properties": {
+                   "valid": {"type": "boolean"},
+                   "message": {"type": "string"},
+                   "report": {"type": "object"},
+               },
+               "required": ["valid", "message", "report"],
+           })
     def validate_document_footnotes(filename: str):
         """Validate all footnotes in document for coherence and compliance.
         Returns detailed report on ID conflicts, orphaned content, missing styles, etc."""
-        return footnote_tools.validate_footnotes_tool(filename)
+        return _load("footnote_tools").validate_footnotes_tool(filename)
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Delete Footnote Robust",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("footnotes", "Delete Footnote Robust", destructive=True)
     def delete_footnote_robust(filename: str, footnote_id: int = None,
                               search_text: str = None, clean_orphans: bool = True):
         """Delete footnote with comprehensive cleanup and orphan removal.
         Ensures complete removal from document.xml, footnotes.xml, and relationships."""
-        return footnote_tools.delete_footnote_robust_tool(
+        return _load("footnote_tools").delete_footnote_robust_tool(
             filename, footnote_id, search_text, clean_orphans
         )
     
     # Extended document tools
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Get Paragraph Text",
-            readOnlyHint=True,
-        ),
-    )
+    @_tool("core", "Get Paragraph Text", read_only=True)
     def get_paragraph_text_from_document(filename: str, paragraph_index: int):
         """Get text from a specific paragraph in a Word document."""
-        return extended_document_tools.get_paragraph_text_from_document(filename, paragraph_index)
+        return _load("extended_document_tools").get_paragraph_text_from_document(filename, paragraph_index)
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Find Text",
-            readOnlyHint=True,
-        ),
-    )
+    @_tool("core", "Find Text", read_only=True)
     def find_text_in_document(filename: str, text_to_find: str, match_case: bool = True,
                              whole_word: bool = False):
         """Find occurrences of specific text in a Word document."""
-        return extended_document_tools.find_text_in_document(
+        return _load("extended_document_tools").find_text_in_document(
             filename, text_to_find, match_case, whole_word
         )
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Get Highlighted Text",
-            readOnlyHint=True,
-        ),
-    )
+    @_tool("content", "Get Highlighted Text", read_only=True)
     def get_highlighted_text(filename: str, color: str = None):
         """Extract all highlighted/colored text from a Word document, including text inside tables."""
-        return extended_document_tools.get_highlighted_text_from_document(filename, color)
+        return _load("extended_document_tools").get_highlighted_text_from_document(filename, color)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Convert to PDF",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("content", "Convert to PDF", destructive=True)
     def convert_to_pdf(filename: str, output_filename: str = None):
         """Convert a Word document to PDF format."""
-        return extended_document_tools.convert_to_pdf(filename, output_filename)
+        return _load("extended_document_tools").convert_to_pdf(filename, output_filename)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Replace Block Below Header",
-            readOnlyHint=False,
-            destructiveHint=True,
-        ),
-    )
+    @_tool("content", "Replace Block Below Header", read_only=False, destructive=True)
     def replace_paragraph_block_below_header(filename: str, header_text: str, new_paragraphs: list[str], detect_block_end_fn: str = None):
         """Reemplaza el bloque de párrafos debajo de un encabezado, evitando modificar TOC."""
-        return replace_paragraph_block_below_header_tool(filename, header_text, new_paragraphs, detect_block_end_fn)
+        return _load("content_tools").replace_paragraph_block_below_header_tool(filename, header_text, new_paragraphs, detect_block_end_fn)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Replace Block Between Anchors",
-            readOnlyHint=False,
-            destructiveHint=True,
-        ),
-    )
+    @_tool("content", "Replace Block Between Anchors", read_only=False, destructive=True)
     def replace_block_between_manual_anchors(filename: str, start_anchor_text: str, new_paragraphs: list[str], end_anchor_text: str = None, match_fn: str = None, new_paragraph_style: str = None):
         """Replace all content between start_anchor_text and end_anchor_text (or next logical header if not provided)."""
-        return replace_block_between_manual_anchors_tool(filename, start_anchor_text, new_paragraphs, end_anchor_text, match_fn, new_paragraph_style)
+        return _load("content_tools").replace_block_between_manual_anchors_tool(filename, start_anchor_text, new_paragraphs, end_anchor_text, match_fn, new_paragraph_style)
 
     # Comment tools
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Get All Comments",
-            readOnlyHint=True,
-        ),
-    )
+    @_tool("comments", "Get All Comments", read_only=True)
     def get_all_comments(filename: str):
         """Extract all comments from a Word document."""
-        return comment_tools.get_all_comments(filename)
+        return _load("comment_tools").get_all_comments(filename)
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Get Comments by Author",
-            readOnlyHint=True,
-        ),
-    )
+    @_tool("comments", "Get Comments by Author", read_only=True)
     def get_comments_by_author(filename: str, author: str):
         """Extract comments from a specific author in a Word document."""
-        return comment_tools.get_comments_by_author(filename, author)
+        return _load("comment_tools").get_comments_by_author(filename, author)
     
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Get Comments for Paragraph",
-            readOnlyHint=True,
-        ),
-    )
+    @_tool("comments", "Get Comments for Paragraph", read_only=True)
     def get_comments_for_paragraph(filename: str, paragraph_index: int):
         """Extract comments for a specific paragraph in a Word document."""
-        return comment_tools.get_comments_for_paragraph(filename, paragraph_index)
+        return _load("comment_tools").get_comments_for_paragraph(filename, paragraph_index)
     # Comment write tools
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Add Comment",
-            readOnlyHint=False,
-            destructiveHint=False,
-        ),
-    )
+    @_tool("comments", "Add Comment", read_only=False, destructive=False)
     def add_comment(filename: str, target_text: str, comment_text: str,
                     author: str = DEFAULT_AUTHOR, initials: str = DEFAULT_INITIALS):
         """Add a comment to a Word document anchored to specific text.
@@ -729,16 +701,10 @@ def register_tools():
             author: Comment author name (env: MCP_AUTHOR)
             initials: Author initials (env: MCP_AUTHOR_INITIALS)
         """
-        return comment_write_tools.add_comment(filename, target_text, comment_text, author, initials)
+        return _load("comment_write_tools").add_comment(filename, target_text, comment_text, author, initials)
 
     # Hyperlink tools
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Manage Hyperlinks",
-            readOnlyHint=False,
-            destructiveHint=False,
-        ),
-    )
+    @_tool("content", "Manage Hyperlinks", read_only=False, destructive=False)
     def manage_hyperlinks(filename: str, action: str = "add", text: str = "",
                           url: str = "", paragraph_index: int = None):
         """Add or manage hyperlinks in a Word document.
@@ -751,171 +717,135 @@ def register_tools():
             url: URL the hyperlink should point to
             paragraph_index: If specified, only search in this paragraph (0-based)
         """
-        return hyperlink_tools.manage_hyperlinks(filename, action, text, url, paragraph_index)
+        return _load("hyperlink_tools").manage_hyperlinks(filename, action, text, url, paragraph_index)
 
     # New table column width tools
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Set Column Width",
-            readOnlyHint=False,
-            destructiveHint=False,
-        ),
-    )
+    @_tool("tables", "Set Column Width", read_only=False, destructive=False)
     def set_table_column_width(filename: str, table_index: int, col_index: int,
                               width: float, width_type: str = "points"):
         """Set the width of a specific table column."""
-        return format_tools.set_table_column_width(filename, table_index, col_index, width, width_type)
+        return _load("format_tools").set_table_column_width(filename, table_index, col_index, width, width_type)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Set Column Widths",
-            readOnlyHint=False,
-            destructiveHint=False,
-        ),
-    )
+    @_tool("tables", "Set Column Widths", read_only=False, destructive=False)
     def set_table_column_widths(filename: str, table_index: int, widths: list[float],
                                width_type: str = "points"):
         """Set the widths of multiple table columns."""
-        return format_tools.set_table_column_widths(filename, table_index, widths, width_type)
+        return _load("format_tools").set_table_column_widths(filename, table_index, widths, width_type)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Set Table Width",
-            readOnlyHint=False,
-            destructiveHint=False,
-        ),
-    )
+    @_tool("tables", "Set Table Width", read_only=False, destructive=False)
     def set_table_width(filename: str, table_index: int, width: float,
                        width_type: str = "points"):
         """Set the overall width of a table."""
-        return format_tools.set_table_width(filename, table_index, width, width_type)
+        return _load("format_tools").set_table_width(filename, table_index, width, width_type)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Auto-Fit Table Columns",
-            readOnlyHint=False,
-            destructiveHint=False,
-        ),
-    )
+    @_tool("tables", "Auto-Fit Table Columns", read_only=False, destructive=False)
     def auto_fit_table_columns(filename: str, table_index: int):
         """Set table columns to auto-fit based on content."""
-        return format_tools.auto_fit_table_columns(filename, table_index)
+        return _load("format_tools").auto_fit_table_columns(filename, table_index)
 
     # New table cell text formatting and padding tools
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Format Cell Text",
-            readOnlyHint=False,
-            destructiveHint=False,
-        ),
-    )
+    @_tool("tables", "Format Cell Text", read_only=False, destructive=False)
     def format_table_cell_text(filename: str, table_index: int, row_index: int, col_index: int,
                                text_content: str = None, bold: bool = None, italic: bool = None,
                                underline: bool = None, color: str = None, font_size: int = None,
                                font_name: str = None):
         """Format text within a specific table cell."""
-        return format_tools.format_table_cell_text(filename, table_index, row_index, col_index,
+        return _load("format_tools").format_table_cell_text(filename, table_index, row_index, col_index,
                                                    text_content, bold, italic, underline, color, font_size, font_name)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Set Cell Padding",
-            readOnlyHint=False,
-            destructiveHint=False,
-        ),
-    )
+    @_tool("tables", "Set Cell Padding", read_only=False, destructive=False)
     def set_table_cell_padding(filename: str, table_index: int, row_index: int, col_index: int,
                                top: float = None, bottom: float = None, left: float = None,
                                right: float = None, unit: str = "points"):
         """Set padding/margins for a specific table cell."""
-        return format_tools.set_table_cell_padding(filename, table_index, row_index, col_index,
+        return _load("format_tools").set_table_cell_padding(filename, table_index, row_index, col_index,
                                                    top, bottom, left, right, unit)
 
 
 
     # Tracked changes tools
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Track Replace",
-            destructiveHint=True,
-        ),
-        description=tracked_changes_tools.track_replace.__doc__,
-    )
+    @_tool("tracked", "Track Replace", destructive=True)
     def track_replace(filename: str, old_text: str, new_text: str, author: str = DEFAULT_AUTHOR):
-        return tracked_changes_tools.track_replace(filename, old_text, new_text, author)
+        """Replace text content with tracked changes (marks old as deleted, new as inserted).
+        This changes TEXT CONTENT only — it does not change formatting (font, highlight, style).
+        To change formatting, use word_live_format_text instead.
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Track Insert",
-            destructiveHint=True,
-        ),
-        description=tracked_changes_tools.track_insert.__doc__,
-    )
+        Args:
+            filename: Path to Word document.
+            old_text: Text to find and mark as deleted.
+            new_text: Replacement text to insert (must differ from old_text).
+            author: Author name for the tracked change.
+        """
+        return _load("tracked_changes_tools").track_replace(filename, old_text, new_text, author)
+
+    @_tool("tracked", "Track Insert", destructive=True)
     def track_insert(filename: str, after_text: str, insert_text: str, author: str = DEFAULT_AUTHOR):
-        return tracked_changes_tools.track_insert(filename, after_text, insert_text, author)
+        """Insert text content after a specific string, marked as a tracked insertion.
+        This changes TEXT CONTENT only — it does not change formatting.
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Track Delete",
-            destructiveHint=True,
-        ),
-        description=tracked_changes_tools.track_delete.__doc__,
-    )
+        Args:
+            filename: Path to Word document.
+            after_text: Text to search for; new text is inserted right after this.
+            insert_text: Text to insert.
+            author: Author name for the tracked change.
+        """
+        return _load("tracked_changes_tools").track_insert(filename, after_text, insert_text, author)
+
+    @_tool("tracked", "Track Delete", destructive=True)
     def track_delete(filename: str, text: str, author: str = DEFAULT_AUTHOR):
-        return tracked_changes_tools.track_delete(filename, text, author)
+        """Mark text content as deleted (tracked deletion).
+        This changes TEXT CONTENT only — it does not change formatting.
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="List Tracked Changes",
-            readOnlyHint=True,
-        ),
-    )
+        Args:
+            filename: Path to Word document.
+            text: Text to mark as deleted.
+            author: Author name for the tracked change.
+        """
+        return _load("tracked_changes_tools").track_delete(filename, text, author)
+
+    @_tool("tracked", "Track Batch Edits", destructive=True)
+    def track_batch_edits(filename: str, edits: list[dict], author: str = DEFAULT_AUTHOR):
+        """Apply several tracked edits in one pass (one document load and save).
+        Equivalent to a sequence of track_replace / track_insert / track_delete
+        calls but much faster for long edit lists.
+
+        Args:
+            filename: Path to Word document.
+            edits: List of edit dicts. Each needs an "action" of "replace"
+                ({"old_text", "new_text"}), "insert" ({"after_text",
+                "insert_text"}), or "delete" ({"text"}), plus an optional
+                per-edit "author".
+            author: Default author for edits that don't specify their own.
+        """
+        return _load("tracked_changes_tools").track_batch_edits(filename, edits, author)
+
+    @_tool("tracked", "List Tracked Changes", read_only=True)
     def list_tracked_changes(filename: str):
         """List all tracked changes (insertions and deletions) in a Word document.
         Returns author, date, text, and paragraph context for each change."""
-        return tracked_changes_tools.list_tracked_changes(filename)
+        return _load("tracked_changes_tools").list_tracked_changes(filename)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Accept Tracked Changes",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("tracked", "Accept Tracked Changes", destructive=True)
     def accept_tracked_changes(filename: str, author: str = None, change_ids: list[int] = None):
         """Accept tracked changes: apply insertions (keep text) and remove deletions.
         Optionally filter by author or specific change IDs."""
-        return tracked_changes_tools.accept_tracked_changes(filename, author, change_ids)
+        return _load("tracked_changes_tools").accept_tracked_changes(filename, author, change_ids)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Reject Tracked Changes",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("tracked", "Reject Tracked Changes", destructive=True)
     def reject_tracked_changes(filename: str, author: str = None, change_ids: list[int] = None):
         """Reject tracked changes: remove insertions and restore deleted text.
         Optionally filter by author or specific change IDs."""
-        return tracked_changes_tools.reject_tracked_changes(filename, author, change_ids)
+        return _load("tracked_changes_tools").reject_tracked_changes(filename, author, change_ids)
 
     # --- Live editing tools (Windows only, requires Word running) ---
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Screen Capture",
-            readOnlyHint=True,
-        ),
-    )
+    @_tool("live", "Word Screen Capture", read_only=True)
     def word_screen_capture(filename: str = None, output_path: str = None):
         """[Windows only] Capture a screenshot of a Word document window.
         Returns the path to the saved PNG image. Requires Word to be running."""
         return screen_capture_tools.word_screen_capture(filename, output_path)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Insert Text",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("live", "Word Live Insert Text", destructive=True)
     def word_live_insert_text(
         filename: str = None,
         text: str = "",
@@ -929,90 +859,15 @@ def register_tools():
             filename, text, position, bookmark, track_changes
         )
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Format Text",
-            destructiveHint=True,
-        ),
-        description=live_tools.word_live_format_text.__doc__,
-    )
-    def word_live_format_text(
-        filename: str = None,
-        start: int = None,
-        end: int = None,
-        start_paragraph: int = None,
-        end_paragraph: int = None,
-        bold: bool = None,
-        italic: bool = None,
-        underline: bool = None,
-        strikethrough: bool = None,
-        font_name: str = None,
-        font_size: float = None,
-        font_color: str = None,
-        highlight_color: int = None,
-        style_name: str = None,
-        paragraph_alignment: str = None,
-        page_break_before: bool = None,
-        preserve_direct_formatting: bool = False,
-        track_changes: bool = False,
-    ):
-        return live_tools.word_live_format_text(
-            filename, start, end, start_paragraph, end_paragraph,
-            bold, italic, underline, strikethrough,
-            font_name, font_size, font_color, highlight_color,
-            style_name, paragraph_alignment, page_break_before,
-            preserve_direct_formatting, track_changes,
-        )
+    # Registered verbatim: the implementation is eagerly imported and its
+    # signature is the schema, so no wrapper frame is needed.
+    _tool("live", "Word Live Format Text", destructive=True)(live_tools.word_live_format_text)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Replace Text",
-            destructiveHint=True,
-        ),
-        description=live_tools.word_live_replace_text.__doc__,
-    )
-    def word_live_replace_text(
-        filename: str = None,
-        find_text: str = "",
-        replace_text: str = "",
-        match_case: bool = False,
-        match_whole_word: bool = False,
-        use_wildcards: bool = False,
-        replace_all: bool = True,
-        track_changes: bool = False,
-    ):
-        return live_tools.word_live_replace_text(
-            filename, find_text, replace_text, match_case,
-            match_whole_word, use_wildcards, replace_all, track_changes,
-        )
+    _tool("live", "Word Live Replace Text", destructive=True)(live_tools.word_live_replace_text)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Insert Paragraphs",
-            destructiveHint=True,
-        ),
-        description=live_tools.word_live_insert_paragraphs.__doc__,
-    )
-    def word_live_insert_paragraphs(
-        filename: str = None,
-        paragraphs: list = None,
-        target_text: str = None,
-        target_paragraph_index: int = None,
-        position: str = "after",
-        style: str = None,
-        track_changes: bool = False,
-    ):
-        return live_tools.word_live_insert_paragraphs(
-            filename, paragraphs, target_text, target_paragraph_index,
-            position, style, track_changes,
-        )
+    _tool("live", "Word Live Insert Paragraphs", destructive=True)(live_tools.word_live_insert_paragraphs)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Add Table",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("live", "Word Live Add Table", destructive=True)
     def word_live_add_table(
         filename: str = None,
         rows: int = 2,
@@ -1031,36 +886,9 @@ def register_tools():
             filename, rows, cols, position, data, style, autofit, track_changes
         )
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Format Table",
-            destructiveHint=True,
-        ),
-        description=live_tools.word_live_format_table.__doc__,
-    )
-    def word_live_format_table(
-        filename: str = None,
-        table_index: int = -1,
-        border_style: str = None,
-        cell_bold: list = None,
-        cell_alignment: list = None,
-        column_widths: list = None,
-        table_alignment: str = None,
-        cell_shading: list = None,
-        autofit: str = None,
-    ):
-        return live_tools.word_live_format_table(
-            filename, table_index, border_style, cell_bold, cell_alignment,
-            column_widths, table_alignment, cell_shading, autofit
-        )
+    _tool("live", "Word Live Format Table", destructive=True)(live_tools.word_live_format_table)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Modify Table",
-            destructiveHint=True,
-        ),
-        description=live_tools.word_live_modify_table.__doc__,
-    )
+    @_tool("live", "Word Live Modify Table", destructive=True, description=live_tools.word_live_modify_table.__doc__)
     def word_live_modify_table(
         filename: str = None,
         table_index: int = 1,
@@ -1087,12 +915,7 @@ def register_tools():
             autofit_mode, accept_revisions, track_changes,
         )
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Delete Text",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("live", "Word Live Delete Text", destructive=True)
     def word_live_delete_text(
         filename: str = None,
         start: int = None,
@@ -1105,184 +928,47 @@ def register_tools():
             filename, start, end, track_changes
         )
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Apply List",
-            destructiveHint=True,
-        ),
-        description=live_tools.word_live_apply_list.__doc__,
-    )
-    def word_live_apply_list(
-        filename: str = None,
-        start_paragraph: int = None,
-        end_paragraph: int = None,
-        list_type: str = "bullet",
-        level: int = 0,
-        remove: bool = False,
-        continue_previous: bool = False,
-        number_format: dict = None,
-        number_style: dict = None,
-        start_at: dict = None,
-        level_map: dict = None,
-        track_changes: bool = False,
-    ):
-        return live_tools.word_live_apply_list(
-            filename, start_paragraph, end_paragraph, list_type,
-            level, remove, continue_previous, number_format,
-            number_style, start_at, level_map, track_changes,
-        )
+    _tool("live", "Word Live Apply List", destructive=True)(live_tools.word_live_apply_list)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Setup Heading Numbering",
-            destructiveHint=True,
-        ),
-        description=live_tools.word_live_setup_heading_numbering.__doc__,
-    )
-    def word_live_setup_heading_numbering(
-        filename: str = None,
-        h1_paragraphs: list = None,
-        h2_paragraphs: list = None,
-        strip_manual_numbers: bool = True,
-        h1_number_format: str = None,
-        h2_number_format: str = None,
-        font_name: str = None,
-        h1_size: float = None,
-        h2_size: float = None,
-        bold: bool = None,
-        alignment: str = None,
-        font_color: str = None,
-        h1_space_before: float = None,
-        h1_space_after: float = None,
-        h2_space_before: float = None,
-        h2_space_after: float = None,
-        line_spacing: float = None,
-    ):
-        return live_tools.word_live_setup_heading_numbering(
-            filename, h1_paragraphs, h2_paragraphs, strip_manual_numbers,
-            h1_number_format, h2_number_format,
-            font_name, h1_size, h2_size, bold, alignment, font_color,
-            h1_space_before, h1_space_after, h2_space_before, h2_space_after,
-            line_spacing,
-        )
+    _tool("live", "Word Live Setup Heading Numbering", destructive=True)(live_tools.word_live_setup_heading_numbering)
 
     # --- Live read tools (Windows only, requires Word running) ---
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Get Text",
-            readOnlyHint=True,
-        ),
-    )
+    @_tool("live", "Word Live Get Text", read_only=True)
     def word_live_get_text(filename: str = None):
         """[Windows only] Get all text from a Word document open in Word, paragraph by paragraph. For large documents (200+ paragraphs), automatically returns only the first 3 pages — use word_live_get_page_text to read specific pages."""
         return live_read_tools.word_live_get_text(filename)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Take Snapshot",
-            readOnlyHint=True,
-        ),
-    )
+    @_tool("live", "Word Live Take Snapshot", read_only=True)
     def word_live_take_snapshot(filename: str = None):
         """[Windows only] Store a snapshot of the current document text for later diffing without returning the full text. Use word_live_get_diff afterwards to see what changed."""
         return live_read_tools.word_live_take_snapshot(filename)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Get Diff",
-            readOnlyHint=True,
-        ),
-    )
+    @_tool("live", "Word Live Get Diff", read_only=True)
     def word_live_get_diff(filename: str = None):
         """[Windows only] Return only paragraphs that changed since the last snapshot. Compares current document against snapshot from word_live_take_snapshot. Returns added, modified, deleted paragraphs. Automatically updates snapshot after diffing."""
         return live_read_tools.word_live_get_diff(filename)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Snapshot Status",
-            readOnlyHint=True,
-        ),
-    )
+    @_tool("live", "Word Live Snapshot Status", read_only=True)
     def word_live_snapshot_status(filename: str = None):
         """[Windows only] Check whether a snapshot exists for the document and how old it is. Returns has_snapshot, age_seconds, and paragraph_count."""
         return live_read_tools.word_live_snapshot_status(filename)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Get Paragraph Format",
-            readOnlyHint=True,
-        ),
-        description=live_read_tools.word_live_get_paragraph_format.__doc__,
-    )
-    def word_live_get_paragraph_format(
-        filename: str = None,
-        start_paragraph: int = None,
-        end_paragraph: int = None,
-        include_runs: bool = False,
-    ):
-        return live_read_tools.word_live_get_paragraph_format(
-            filename, start_paragraph, end_paragraph, include_runs,
-        )
+    _tool("live", "Word Live Get Paragraph Format", read_only=True)(live_read_tools.word_live_get_paragraph_format)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Get Info",
-            readOnlyHint=True,
-        ),
-    )
+    @_tool("live", "Word Live Get Info", read_only=True)
     def word_live_get_info(filename: str = None):
         """[Windows only] Get document info (pages, words, sections, etc.) from a Word document open in Word. Requires Word running."""
         return live_read_tools.word_live_get_info(filename)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Set Core Properties",
-            destructiveHint=True,
-        ),
-        description=live_read_tools.word_live_set_core_properties.__doc__,
-    )
-    def word_live_set_core_properties(
-        filename: str = None,
-        title: str = None,
-        subject: str = None,
-        author: str = None,
-        keywords: str = None,
-        comments: str = None,
-        category: str = None,
-        manager: str = None,
-        company: str = None,
-        last_author: str = None,
-    ):
-        return live_read_tools.word_live_set_core_properties(
-            filename=filename,
-            title=title,
-            subject=subject,
-            author=author,
-            keywords=keywords,
-            comments=comments,
-            category=category,
-            manager=manager,
-            company=company,
-            last_author=last_author,
-        )
+    _tool("live", "Word Live Set Core Properties", destructive=True)(live_read_tools.word_live_set_core_properties)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live List Open",
-            readOnlyHint=True,
-        ),
-    )
+    @_tool("live", "Word Live List Open", read_only=True)
     def word_live_list_open():
         """[Windows only] List all documents currently open in Word with name, path, pages, and saved status."""
         return live_read_tools.word_live_list_open()
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Find Text",
-            readOnlyHint=True,
-        ),
-    )
+    @_tool("live", "Word Live Find Text", read_only=True)
     def word_live_find_text(
         filename: str = None,
         search_text: str = "",
@@ -1300,22 +986,12 @@ def register_tools():
             use_wildcards, context_chars, max_results,
         )
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Get Comments",
-            readOnlyHint=True,
-        ),
-    )
+    @_tool("live", "Word Live Get Comments", read_only=True)
     def word_live_get_comments(filename: str = None):
         """[Windows only] Get all comments from a Word document open in Word. Requires Word running."""
         return live_read_tools.word_live_get_comments(filename)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Add Comment",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("live", "Word Live Add Comment", destructive=True)
     def word_live_add_comment(
         filename: str = None,
         start: int = None,
@@ -1330,12 +1006,7 @@ def register_tools():
             filename, start, end, paragraph_index, text, author
         )
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Reply to Comment",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("live", "Word Live Reply to Comment", destructive=True)
     def word_live_reply_to_comment(
         filename: str = None,
         comment_index: int = None,
@@ -1349,12 +1020,7 @@ def register_tools():
             filename, comment_index, text, author
         )
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Resolve Comment",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("live", "Word Live Resolve Comment", destructive=True)
     def word_live_resolve_comment(
         filename: str = None,
         comment_index: int = None,
@@ -1367,12 +1033,7 @@ def register_tools():
             filename, comment_index, resolve
         )
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Delete Comment",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("live", "Word Live Delete Comment", destructive=True)
     def word_live_delete_comment(
         filename: str = None,
         comment_index: int = None,
@@ -1384,22 +1045,12 @@ def register_tools():
             filename, comment_index
         )
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live List Revisions",
-            readOnlyHint=True,
-        ),
-    )
+    @_tool("live", "Word Live List Revisions", read_only=True)
     def word_live_list_revisions(filename: str = None):
         """[Windows only] List all tracked changes (revisions) in a Word document open in Word. Requires Word running."""
         return live_read_tools.word_live_list_revisions(filename)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Accept Revisions",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("live", "Word Live Accept Revisions", destructive=True)
     def word_live_accept_revisions(
         filename: str = None,
         author: str = None,
@@ -1411,12 +1062,7 @@ def register_tools():
             filename, author, revision_ids
         )
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Reject Revisions",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("live", "Word Live Reject Revisions", destructive=True)
     def word_live_reject_revisions(
         filename: str = None,
         author: str = None,
@@ -1428,39 +1074,15 @@ def register_tools():
             filename, author, revision_ids
         )
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Get Page Text",
-            readOnlyHint=True,
-        ),
-        description=live_read_tools.word_live_get_page_text.__doc__,
-    )
-    def word_live_get_page_text(
-        filename: str = None,
-        page: int = 1,
-        end_page: int = None,
-    ):
-        return live_read_tools.word_live_get_page_text(
-            filename, page, end_page,
-        )
+    _tool("live", "Word Live Get Page Text", read_only=True)(live_read_tools.word_live_get_page_text)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Get Undo History",
-            readOnlyHint=True,
-        ),
-    )
+    @_tool("live", "Word Live Get Undo History", read_only=True)
     def word_live_get_undo_history(filename: str = None):
         """[Windows only] Get the undo stack from a Word document open in Word.
         Shows MCP tool operations as named entries. Requires Word running."""
         return live_read_tools.word_live_get_undo_history(filename)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Undo",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("live", "Word Live Undo", destructive=True)
     def word_live_undo(
         filename: str = None,
         times: int = 1,
@@ -1469,12 +1091,7 @@ def register_tools():
         Each MCP tool call is one undo entry. Requires Word running."""
         return live_tools.word_live_undo(filename, times)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Save",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("live", "Word Live Save", destructive=True)
     def word_live_save(
         filename: str = None,
         save_as: str = None,
@@ -1483,12 +1100,7 @@ def register_tools():
         Optionally save to a new path with save_as. Requires Word running."""
         return live_tools.word_live_save(filename, save_as)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Toggle Track Changes",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("live", "Word Live Toggle Track Changes", destructive=True)
     def word_live_toggle_track_changes(
         filename: str = None,
         enable: bool = None,
@@ -1497,42 +1109,9 @@ def register_tools():
         If enable is omitted, toggles current state. Requires Word running."""
         return live_tools.word_live_toggle_track_changes(filename, enable)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Insert Image",
-            destructiveHint=True,
-        ),
-        description=live_tools.word_live_insert_image.__doc__,
-    )
-    def word_live_insert_image(
-        filename: str = None,
-        image_path: str = "",
-        paragraph_index: int = None,
-        position: str = "end",
-        width_inches: float = None,
-        height_inches: float = None,
-        width_pt: float = None,
-        height_pt: float = None,
-        alignment: str = None,
-        wrapping: str = None,
-        border_style: str = None,
-        border_width_pt: float = None,
-        border_color: str = None,
-        link_to_file: bool = False,
-    ):
-        return live_tools.word_live_insert_image(
-            filename, image_path, paragraph_index, position,
-            width_inches, height_inches, width_pt, height_pt,
-            alignment, wrapping, border_style, border_width_pt,
-            border_color, link_to_file
-        )
+    _tool("live", "Word Live Insert Image", destructive=True)(live_tools.word_live_insert_image)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Insert Cross Reference",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("live", "Word Live Insert Cross Reference", destructive=True)
     def word_live_insert_cross_reference(
         filename: str = None,
         ref_type: str = "heading",
@@ -1552,12 +1131,7 @@ def register_tools():
             insert_position, paragraph_index, insert_as_hyperlink
         )
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live List Cross Reference Items",
-            readOnlyHint=True,
-        ),
-    )
+    @_tool("live", "Word Live List Cross Reference Items", read_only=True)
     def word_live_list_cross_reference_items(
         filename: str = None,
         ref_type: str = "heading",
@@ -1568,12 +1142,7 @@ def register_tools():
         Requires Word running."""
         return live_tools.word_live_list_cross_reference_items(filename, ref_type)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Insert Equation",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("live", "Word Live Insert Equation", destructive=True)
     def word_live_insert_equation(
         filename: str = None,
         equation: str = "",
@@ -1591,24 +1160,13 @@ def register_tools():
             filename, equation, paragraph_index, position, display_mode
         )
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Diagnose Layout",
-            readOnlyHint=True,
-        ),
-        description=live_read_tools.word_live_diagnose_layout.__doc__,
-    )
-    def word_live_diagnose_layout(filename: str = None):
-        return live_read_tools.word_live_diagnose_layout(filename)
+    _tool("live", "Word Live Batch", destructive=True)(live_tools.word_live_batch)
+
+    _tool("live", "Word Live Diagnose Layout", read_only=True)(live_read_tools.word_live_diagnose_layout)
 
     # --- Live layout tools (Windows only, requires Word running) ---
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Set Page Layout",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("live", "Word Live Set Page Layout", destructive=True)
     def word_live_set_page_layout(
         filename: str = None,
         section_index: int = 1,
@@ -1628,12 +1186,7 @@ def register_tools():
             margin_left_inches, margin_right_inches,
         )
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Add Header/Footer",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("live", "Word Live Add Header/Footer", destructive=True)
     def word_live_add_header_footer(
         filename: str = None,
         section_index: int = 1,
@@ -1648,12 +1201,7 @@ def register_tools():
             header_alignment, footer_alignment,
         )
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Add Page Numbers",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("live", "Word Live Add Page Numbers", destructive=True)
     def word_live_add_page_numbers(
         filename: str = None,
         section_index: int = 1,
@@ -1669,12 +1217,7 @@ def register_tools():
             prefix, suffix, include_total,
         )
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Add Section Break",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("live", "Word Live Add Section Break", destructive=True)
     def word_live_add_section_break(
         filename: str = None,
         break_type: str = "new_page",
@@ -1684,12 +1227,7 @@ def register_tools():
             filename, break_type,
         )
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Set Paragraph Spacing",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("live", "Word Live Set Paragraph Spacing", destructive=True)
     def word_live_set_paragraph_spacing(
         filename: str = None,
         paragraph_index: int = None,
@@ -1710,12 +1248,7 @@ def register_tools():
             keep_with_next, keep_together, alignment,
         )
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Add Bookmark",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("live", "Word Live Add Bookmark", destructive=True)
     def word_live_add_bookmark(
         filename: str = None,
         paragraph_index: int = 1,
@@ -1727,12 +1260,7 @@ def register_tools():
             filename, paragraph_index, bookmark_name,
         )
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Word Live Add Watermark",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("live", "Word Live Add Watermark", destructive=True)
     def word_live_add_watermark(
         filename: str = None,
         text: str = "TASLAK",
@@ -1748,12 +1276,7 @@ def register_tools():
 
     # --- Layout, header/footer, spacing, bookmark, watermark tools ---
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Set Page Layout",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("layout", "Set Page Layout", destructive=True)
     def set_page_layout(
         filename: str,
         section_index: int = 0,
@@ -1766,19 +1289,14 @@ def register_tools():
         margin_right_inches: float = None,
     ):
         """Set page layout (orientation, size, margins) for a document section."""
-        return layout_tools.set_page_layout(
+        return _load("layout_tools").set_page_layout(
             filename, section_index, orientation,
             page_width_inches, page_height_inches,
             margin_top_inches, margin_bottom_inches,
             margin_left_inches, margin_right_inches,
         )
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Add Header/Footer",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("layout", "Add Header/Footer", destructive=True)
     def add_header_footer(
         filename: str,
         section_index: int = 0,
@@ -1788,17 +1306,12 @@ def register_tools():
         footer_alignment: str = "center",
     ):
         """Add header and/or footer text to a document section."""
-        return layout_tools.add_header_footer(
+        return _load("layout_tools").add_header_footer(
             filename, section_index, header_text, footer_text,
             header_alignment, footer_alignment,
         )
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Add Page Numbers",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("layout", "Add Page Numbers", destructive=True)
     def add_page_numbers(
         filename: str,
         section_index: int = 0,
@@ -1809,27 +1322,17 @@ def register_tools():
         include_total: bool = False,
     ):
         """Add page numbers to header or footer using PAGE/NUMPAGES fields."""
-        return layout_tools.add_page_numbers(
+        return _load("layout_tools").add_page_numbers(
             filename, section_index, position, alignment,
             prefix, suffix, include_total,
         )
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Add Section Break",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("layout", "Add Section Break", destructive=True)
     def add_section_break(filename: str, break_type: str = "new_page"):
         """Add a section break (new_page, continuous, even_page, odd_page)."""
-        return layout_tools.add_section_break(filename, break_type)
+        return _load("layout_tools").add_section_break(filename, break_type)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Set Paragraph Spacing",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("layout", "Set Paragraph Spacing", destructive=True)
     def set_paragraph_spacing(
         filename: str,
         paragraph_index: int = None,
@@ -1842,27 +1345,17 @@ def register_tools():
     ):
         """Set paragraph spacing (before/after/line) for one or a range of paragraphs.
         line_spacing_rule: single, 1.5_lines, double, exactly, at_least, multiple."""
-        return layout_tools.set_paragraph_spacing(
+        return _load("layout_tools").set_paragraph_spacing(
             filename, paragraph_index, start_paragraph, end_paragraph,
             space_before_pt, space_after_pt, line_spacing, line_spacing_rule,
         )
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Add Bookmark",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("layout", "Add Bookmark", destructive=True)
     def add_bookmark(filename: str, paragraph_index: int, bookmark_name: str):
         """Add a named bookmark at a paragraph for cross-referencing."""
-        return layout_tools.add_bookmark(filename, paragraph_index, bookmark_name)
+        return _load("layout_tools").add_bookmark(filename, paragraph_index, bookmark_name)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Add Watermark",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("layout", "Add Watermark", destructive=True)
     def add_watermark(
         filename: str,
         text: str = "TASLAK",
@@ -1872,129 +1365,180 @@ def register_tools():
         section_index: int = 0,
     ):
         """Add a diagonal text watermark (e.g. TASLAK, GİZLİ, DRAFT) to a document."""
-        return layout_tools.add_watermark(
+        return _load("layout_tools").add_watermark(
             filename, text, font_size, font_color, rotation, section_index,
         )
 
+    @_tool("layout", "Apply Layout Plan", destructive=True)
+    def apply_layout_plan(filename: str, ops: list[dict]):
+        """Apply several layout operations with one document load and save. Each op dict needs an "op" of set_page_layout, add_header_footer, add_page_numbers, add_section_break, set_paragraph_spacing, add_bookmark, or add_watermark, plus that tool's arguments (without filename)."""
+        return _load("layout_tools").apply_layout_plan(filename, ops)
+
     # --- Previously unregistered existing tools ---
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Add Table of Contents",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("content", "Add Table of Contents", destructive=True)
     def add_table_of_contents(filename: str, title: str = "Table of Contents", max_level: int = 3):
         """Add a table of contents based on heading styles."""
-        return content_tools.add_table_of_contents(filename, title, max_level)
+        return _load("content_tools").add_table_of_contents(filename, title, max_level)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Merge Documents",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("content", "Merge Documents", destructive=True)
     def merge_documents(target_filename: str, source_filenames: list[str], add_page_breaks: bool = True):
         """Merge multiple Word documents into a single target document."""
-        return document_tools.merge_documents(target_filename, source_filenames, add_page_breaks)
+        return _load("document_tools").merge_documents(target_filename, source_filenames, add_page_breaks)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Add Restricted Editing",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("protection", "Add Restricted Editing", destructive=True)
     def add_restricted_editing(filename: str, password: str, editable_sections: list[str]):
         """Add restricted editing to a document, allowing editing only in specified sections."""
-        return protection_tools.add_restricted_editing(filename, password, editable_sections)
+        return _load("protection_tools").add_restricted_editing(filename, password, editable_sections)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Add Digital Signature",
-            destructiveHint=True,
-        ),
-    )
+    @_tool("protection", "Add Digital Signature", destructive=True)
     def add_digital_signature(filename: str, signer_name: str, reason: str = None):
         """Add a digital signature to a Word document."""
-        return protection_tools.add_digital_signature(filename, signer_name, reason)
+        return _load("protection_tools").add_digital_signature(filename, signer_name, reason)
 
-    @mcp.tool(
-        annotations=ToolAnnotations(
-            title="Verify Document",
-            readOnlyHint=True,
-        ),
-    )
+    @_tool("protection", "Verify Document", read_only=True)
     def verify_document(filename: str, password: str = None):
         """Verify document protection and/or digital signature."""
-        return protection_tools.verify_document(filename, password)
+        return _load("protection_tools").verify_document(filename, password)
+
+
+def _prewarm():
+    """Import the heavy document libraries ahead of the first tool call.
+
+    Tool modules load lazily (see _load), so a cold server would otherwise
+    pay the python-docx/lxml import cost inside the first request.  Runs on
+    a daemon thread so transport startup is not delayed either.
+    """
+    try:
+        import docx  # noqa: F401
+        import lxml.etree  # noqa: F401
+    except ImportError:
+        pass
 
 
 def run_server():
     """Run the Word Document MCP Server with configurable transport."""
+    # Setup logging first so everything below (including the transport
+    # resolution) is reported through the stderr handler.
+    debug_mode = os.getenv('MCP_DEBUG', '').lower() in ('1', 'true', 'yes')
+    setup_logging(debug_mode)
+
     # Get transport configuration
     config = get_transport_config()
-    
-    # Setup logging
-    # setup_logging(config['debug'])
-    
-    # Monkey-patch Document.save() to preserve comments.xml and other custom parts
-    from word_document_server.utils.save_utils import install_save_hook
-    install_save_hook()
 
-    # Monkey-patch PhysPkgReader to detect Word-locked files
-    from word_document_server.utils.path_utils import install_path_hook
-    install_path_hook()
+
+    # The save and open hooks only matter when documents get written: one
+    # preserves comments.xml on save, the other turns a Word lock into a
+    # clear error on open.  Sessions that declare themselves read-only can
+    # skip both patches (and their per-open/per-save probes) entirely.
+    read_only = os.getenv('WORD_MCP_READ_ONLY', '').lower() in ('1', 'true', 'yes')
+    if read_only:
+        logger.info("WORD_MCP_READ_ONLY set: save/path hooks not installed")
+    else:
+        # Monkey-patch Document.save() to preserve comments.xml and other custom parts
+        from word_document_server.utils.save_utils import install_save_hook
+        install_save_hook()
+
+        # Monkey-patch PhysPkgReader to detect Word-locked files
+        from word_document_server.utils.path_utils import install_path_hook
+        install_path_hook()
 
     # Register all tools
     register_tools()
-    
-    # Print startup information
-    transport_type = config['transport']
-    print(f"Starting Word Document MCP Server with {transport_type} transport...", file=sys.stderr)
-    
-    # if config['debug']:
-    #     print(f"Configuration: {config}")
-    
+
+    # FastMCP builds each tool's input schema once at decoration time, so
+    # there is nothing further to precompute per tool; prime the tools/list
+    # response cache here so even the first enumeration of a session is
+    # served from the precomputed entry.
+    try:
+        asyncio.run(mcp.list_tools())
+    except Exception:
+        pass  # best-effort: the first client request warms it instead
+
+    # Warm the document libraries concurrently with transport startup.
+    threading.Thread(target=_prewarm, name="prewarm", daemon=True).start()
+
+    # uvloop is optional; when installed it cuts event-loop dispatch cost
+    # for long-lived (keep-alive) sessions.
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
+    # Log startup information
+    transport_type = config.transport
+    logger.info("Starting Word Document MCP Server with %s transport...", transport_type)
+    logger.debug("Configuration: %s", config)
+
     try:
         if transport_type == 'stdio':
             # Run with stdio transport (default, backward compatible)
-            print("Server running on stdio transport", file=sys.stderr)
+            logger.info("Server running on stdio transport")
             mcp.run(transport='stdio')
-            
+
         elif transport_type == 'streamable-http':
             # Run with streamable HTTP transport
-            print(f"Server running on streamable-http transport at http://{config['host']}:{config['port']}{config['path']}", file=sys.stderr)
+            logger.info("Server running on streamable-http transport at http://%s:%s%s",
+                        config.host, config.port, config.path)
             mcp.run(
                 transport='streamable-http',
-                host=config['host'],
-                port=config['port'],
-                path=config['path']
+                host=config.host,
+                port=config.port,
+                path=config.path
             )
-            
+
         elif transport_type == 'sse':
             # Run with SSE transport
-            print(f"Server running on SSE transport at http://{config['host']}:{config['port']}{config['sse_path']}", file=sys.stderr)
+            logger.info("Server running on SSE transport at http://%s:%s%s",
+                        config.host, config.port, config.sse_path)
             mcp.run(
                 transport='sse',
-                host=config['host'],
-                port=config['port'],
-                path=config['sse_path']
+                host=config.host,
+                port=config.port,
+                path=config.sse_path
             )
-            
+
     except KeyboardInterrupt:
-        print("\nShutting down server...", file=sys.stderr)
+        logger.info("Shutting down server...")
     except Exception as e:
-        print(f"Error starting server: {e}", file=sys.stderr)
-        if config['debug']:
-            import traceback
-            traceback.print_exc()
+        if debug_mode:
+            logger.exception("Error starting server")
+        else:
+            logger.error("Error starting server: %s", e)
         sys.exit(1)
-    
+
     return mcp
 
 
 def main():
-    """Main entry point for the server."""
+    """Main entry point for the server.
+
+    Command-line flags take precedence over the corresponding environment
+    variables (MCP_TRANSPORT, MCP_HOST, MCP_PORT); both feed the same
+    get_transport_config() path, so flags avoid the transport auto-detect
+    guesswork without adding a second configuration source.
+    """
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Word Document MCP Server")
+    parser.add_argument('--transport', choices=['stdio', 'sse', 'streamable-http'],
+                        help="Transport to serve on (default: from MCP_TRANSPORT, or auto-detected)")
+    parser.add_argument('--host', help="Bind address for HTTP transports (default: from MCP_HOST)")
+    parser.add_argument('--port', type=int, help="Port for HTTP transports (default: from MCP_PORT/PORT)")
+    args = parser.parse_args()
+
+    if args.transport:
+        os.environ['MCP_TRANSPORT'] = args.transport
+    if args.host:
+        os.environ['MCP_HOST'] = args.host
+    if args.port is not None:
+        os.environ['MCP_PORT'] = str(args.port)
+        if 'PORT' in os.environ:
+            # Hosted platforms inject PORT, which normally wins over
+            # MCP_PORT; an explicit flag outranks both.
+            os.environ['PORT'] = str(args.port)
+
     run_server()
 
 
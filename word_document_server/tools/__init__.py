@@ -3,49 +3,77 @@ MCP tool implementations for the Word Document Server.
 
 This package contains the MCP tool implementations that expose functionality
 to clients through the Model Context Protocol.
-"""
-
-# Document tools
-from word_document_server.tools.document_tools import (
-    create_document, get_document_info, get_document_text, 
-    get_document_outline, list_available_documents, 
-    copy_document, merge_documents
-)
-
-# Content tools
-from word_document_server.tools.content_tools import (
-    add_heading, add_paragraph, add_table, add_picture,
-    add_page_break, add_table_of_contents, delete_paragraph,
-    search_and_replace
-)
 
-# Format tools
-from word_document_server.tools.format_tools import (
-    format_text, create_custom_style, format_table
-)
-
-# Protection tools
-from word_document_server.tools.protection_tools import (
-    protect_document, add_restricted_editing,
-    add_digital_signature, verify_document
-)
+Submodules and the historically re-exported tool functions resolve lazily
+(PEP 562): importing this package no longer pulls python-docx and lxml into
+the process, so server startup cost stays independent of the number of tool
+modules.
+"""
 
-# Footnote tools
-from word_document_server.tools.footnote_tools import (
-    add_footnote_to_document, add_endnote_to_document,
-    convert_footnotes_to_endnotes_in_document, customize_footnote_style
-)
+import importlib
 
-# Comment tools
-from word_document_server.tools.comment_tools import (
-    get_all_comments, get_comments_by_author, get_comments_for_paragraph
-)
+_SUBMODULES = {
+    "comment_tools",
+    "comment_write_tools",
+    "content_tools",
+    "document_tools",
+    "extended_document_tools",
+    "footnote_tools",
+    "format_tools",
+    "hyperlink_tools",
+    "layout_tools",
+    "live_layout_tools",
+    "live_read_tools",
+    "live_tools",
+    "protection_tools",
+    "screen_capture_tools",
+    "tracked_changes_tools",
+}
 
-# Comment write tools
-from word_document_server.tools import comment_write_tools
+# Function re-exports kept for backward compatibility: name -> submodule.
+_FUNCTION_EXPORTS = {
+    # Document tools
+    "create_document": "document_tools",
+    "get_document_info": "document_tools",
+    "get_document_text": "document_tools",
+    "get_document_outline": "document_tools",
+    "list_available_documents": "document_tools",
+    "copy_document": "document_tools",
+    "merge_documents": "document_tools",
+    # Content tools
+    "add_heading": "content_tools",
+    "add_paragraph": "content_tools",
+    "add_table": "content_tools",
+    "add_picture": "content_tools",
+    "add_page_break": "content_tools",
+    "add_table_of_contents": "content_tools",
+    "delete_paragraph": "content_tools",
+    "search_and_replace": "content_tools",
+    # Format tools
+    "format_text": "format_tools",
+    "create_custom_style": "format_tools",
+    "format_table": "format_tools",
+    # Protection tools
+    "protect_document": "protection_tools",
+    "add_restricted_editing": "protection_tools",
+    "add_digital_signature": "protection_tools",
+    "verify_document": "protection_tools",
+    # Footnote tools
+    "add_footnote_to_document": "footnote_tools",
+    "add_endnote_to_document": "footnote_tools",
+    "convert_footnotes_to_endnotes_in_document": "footnote_tools",
+    "customize_footnote_style": "footnote_tools",
+    # Comment tools
+    "get_all_comments": "comment_tools",
+    "get_comments_by_author": "comment_tools",
+    "get_comments_for_paragraph": "comment_tools",
+}
 
-# Hyperlink tools
-from word_document_server.tools import hyperlink_tools
 
-# Tracked changes tools
-from word_document_server.tools import tracked_changes_tools
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    if name in _FUNCTION_EXPORTS:
+        module = importlib.import_module(f"{__name__}.{_FUNCTION_EXPORTS[name]}")
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
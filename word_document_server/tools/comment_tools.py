@@ -5,10 +5,10 @@ These tools provide high-level interfaces for extracting and analyzing
 comments from Word documents through the MCP protocol.
 """
 import os
-import json
+from word_document_server.utils import fast_json as json
 from typing import Dict, List, Optional, Any
-from docx import Document
 
+from word_document_server.utils import doc_cache
 from word_document_server.utils.file_utils import ensure_docx_extension
 from word_document_server.core.comments import (
     extract_all_comments,
@@ -36,8 +36,8 @@ async def get_all_comments(filename: str) -> str:
         }, indent=2)
     
     try:
-        # Load the document
-        doc = Document(filename)
+        # Load the document (shared read-only cache; never mutated here)
+        doc = doc_cache.get_document(filename)
         
         # Extract all comments
         comments = extract_all_comments(doc)
@@ -82,8 +82,8 @@ async def get_comments_by_author(filename: str, author: str) -> str:
         }, indent=2)
     
     try:
-        # Load the document
-        doc = Document(filename)
+        # Load the document (shared read-only cache; never mutated here)
+        doc = doc_cache.get_document(filename)
         
         # Extract all comments
         all_comments = extract_all_comments(doc)
@@ -132,8 +132,8 @@ async def get_comments_for_paragraph(filename: str, paragraph_index: int) -> str
         }, indent=2)
     
     try:
-        # Load the document
-        doc = Document(filename)
+        # Load the document (shared read-only cache; never mutated here)
+        doc = doc_cache.get_document(filename)
         
         # Check if paragraph index is valid
         if paragraph_index >= len(doc.paragraphs):
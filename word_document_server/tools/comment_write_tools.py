@@ -4,7 +4,8 @@ Comment writing tools for Word Document Server.
 These tools provide MCP interfaces for adding comments to Word documents.
 """
 
-import json
+from word_document_server.utils import fast_json as json
+import asyncio
 import os
 
 from word_document_server.defaults import DEFAULT_AUTHOR, DEFAULT_INITIALS
@@ -47,7 +48,9 @@ async def add_comment(
 
     try:
         async with get_file_lock(filename):
-            result = add_comment_to_doc(filename, target_text, comment_text, author, initials)
+            result = await asyncio.to_thread(
+                add_comment_to_doc, filename, target_text, comment_text, author, initials
+            )
         return json.dumps(result, ensure_ascii=False, indent=2)
     except Exception as e:
         return json.dumps({"success": False, "error": f"Failed to add comment: {str(e)}"})
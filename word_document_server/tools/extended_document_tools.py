@@ -3,9 +3,9 @@ Extended document tools for Word Document Server.
 
 These tools provide enhanced document content extraction and search capabilities.
 """
+import asyncio
 import os
-import json
-import subprocess
+from word_document_server.utils import fast_json as json
 import platform
 import shutil
 from typing import Dict, List, Optional, Any, Union, Tuple
@@ -33,7 +33,8 @@ async def get_paragraph_text_from_document(filename: str, paragraph_index: int)
     
     try:
         result = get_paragraph_text(filename, paragraph_index)
-        return json.dumps(result, indent=2)
+        # Compact output: MCP clients parse the JSON, they don't read it.
+        return json.dumps(result)
     except Exception as e:
         return f"Failed to get paragraph text: {str(e)}"
 
@@ -58,7 +59,7 @@ async def find_text_in_document(filename: str, text_to_find: str, match_case: bo
     try:
         
         result = find_text(filename, text_to_find, match_case, whole_word)
-        return json.dumps(result, indent=2)
+        return json.dumps(result)
     except Exception as e:
         return f"Failed to search for text: {str(e)}"
 
@@ -77,7 +78,7 @@ async def get_highlighted_text_from_document(filename: str, color: str = None) -
 
     try:
         result = get_highlighted_text(filename, color)
-        return json.dumps(result, indent=2, ensure_ascii=False)
+        return json.dumps(result, ensure_ascii=False)
     except Exception as e:
         return f"Failed to extract highlighted text: {str(e)}"
 
@@ -128,7 +129,9 @@ async def convert_to_pdf(filename: str, output_filename: Optional[str] = None) -
                 # On Windows, try docx2pdf which uses Microsoft Word
                 try:
                     from docx2pdf import convert
-                    convert(filename, output_filename)
+                    # docx2pdf drives Word synchronously; run it off-loop so
+                    # other tool calls keep being served during conversion.
+                    await asyncio.to_thread(convert, filename, output_filename)
                     return f"Document successfully converted to PDF: {output_filename}"
                 except (ImportError, Exception) as e:
                     return f"Failed to convert document to PDF: {str(e)}\nNote: docx2pdf requires Microsoft Word to be installed."
@@ -148,10 +151,24 @@ async def convert_to_pdf(filename: str, output_filename: Optional[str] = None) -
                         output_dir_for_lo = os.path.dirname(output_filename) or '.'
                         os.makedirs(output_dir_for_lo, exist_ok=True)
 
-                        cmd = [cmd_name, '--headless', '--convert-to', 'pdf', '--outdir', output_dir_for_lo, filename]
-                        result = subprocess.run(cmd, capture_output=True, text=True, timeout=60, check=False)
-
-                        if result.returncode == 0:
+                        # An async subprocess keeps the event loop free for
+                        # other tool calls while LibreOffice converts (up to
+                        # the 60 s timeout).
+                        proc = await asyncio.create_subprocess_exec(
+                            cmd_name, '--headless', '--convert-to', 'pdf',
+                            '--outdir', output_dir_for_lo, filename,
+                            stdout=asyncio.subprocess.PIPE,
+                            stderr=asyncio.subprocess.PIPE,
+                        )
+                        try:
+                            _, stderr = await asyncio.wait_for(proc.communicate(), timeout=60)
+                        except asyncio.TimeoutError:
+                            proc.kill()
+                            await proc.wait()
+                            errors.append(f"{cmd_name} timed out after 60 seconds.")
+                            continue
+
+                        if proc.returncode == 0:
                             # LibreOffice typically creates a PDF with the same base name as the source file.
                             # e.g., 'mydoc.docx' -> 'mydoc.pdf'
                             base_name = os.path.splitext(os.path.basename(filename))[0]
@@ -171,16 +188,16 @@ async def convert_to_pdf(filename: str, output_filename: Optional[str] = None) -
                             errors.append(f"{cmd_name} returned success code, but output file '{created_pdf_path}' was not found.")
                             # Continue to the next command or fallback.
                         else:
-                            errors.append(f"{cmd_name} failed. Stderr: {result.stderr.strip()}")
+                            errors.append(f"{cmd_name} failed. Stderr: {stderr.decode(errors='replace').strip()}")
                     except FileNotFoundError:
                         errors.append(f"Command '{cmd_name}' not found.")
-                    except (subprocess.SubprocessError, Exception) as e:
+                    except Exception as e:
                         errors.append(f"An error occurred with {cmd_name}: {str(e)}")
 
                 # --- Attempt 2: docx2pdf (Fallback) ---
                 try:
                     from docx2pdf import convert
-                    convert(filename, output_filename)
+                    await asyncio.to_thread(convert, filename, output_filename)
                     if os.path.exists(output_filename) and os.path.getsize(output_filename) > 0:
                         return f"Document successfully converted to PDF via docx2pdf: {output_filename}"
                     else:
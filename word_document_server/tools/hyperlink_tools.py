@@ -4,7 +4,7 @@ Hyperlink tools for Word Document Server.
 These tools provide MCP interfaces for managing hyperlinks in Word documents.
 """
 
-import json
+from word_document_server.utils import fast_json as json
 import os
 from typing import Optional
 
@@ -3,7 +3,10 @@
 Cross-platform tools using python-docx for section-level and page-level operations.
 """
 
-import json
+from word_document_server.utils import fast_json as json
+import asyncio
+import copy
+import itertools
 import os
 from typing import Optional
 
@@ -11,7 +14,7 @@ from docx import Document
 from docx.shared import Pt, Inches, Cm, Emu
 from docx.enum.section import WD_ORIENT
 from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.oxml.ns import qn, nsdecls
+from docx.oxml.ns import qn
 from docx.oxml import parse_xml
 
 from word_document_server.utils.file_utils import check_file_writeable, ensure_docx_extension, get_file_lock
@@ -25,6 +28,103 @@ _ALIGN_MAP = {
 }
 
 
+def _resolve_align(alignment: Optional[str]):
+    """Map an alignment keyword to its enum, defaulting to centered."""
+    if not alignment:
+        return WD_ALIGN_PARAGRAPH.CENTER
+    return _ALIGN_MAP.get(alignment.lower(), WD_ALIGN_PARAGRAPH.CENTER)
+
+
+# w:spacing attribute values (w:line twips, w:lineRule) produced by each
+# line_spacing_rule keyword — the same XML python-docx's line_spacing_rule
+# setter would emit.
+_SPACING_RULE_ATTRS = {
+    "single": ("240", "auto"),
+    "1.5_lines": ("360", "auto"),
+    "double": ("480", "auto"),
+    "exactly": (None, "exact"),
+    "at_least": (None, "atLeast"),
+    "multiple": (None, "auto"),
+}
+
+
+# Bookmark IDs only need to be unique within a document; a shared counter
+# guarantees that across every document touched by this process.
+_BOOKMARK_IDS = itertools.count(1000)
+
+
+# Parsing and re-zipping a document are the expensive ends of every tool
+# here; run them off-loop so concurrent tool calls keep being served.
+async def _load_doc(filename: str):
+    return await asyncio.to_thread(Document, filename)
+
+
+async def _save_doc(doc, filename: str) -> None:
+    await asyncio.to_thread(doc.save, filename)
+
+
+# Each tool body lives in a sync _apply_* helper that mutates an open
+# Document in place and returns a result dict (raising ValueError for
+# validation problems).  The per-tool wrappers load and save around one
+# helper; apply_layout_plan runs any number of them around a single
+# load/save cycle.
+
+
+def _apply_page_layout(
+    doc,
+    section_index: int = 0,
+    orientation: str = None,
+    page_width_inches: float = None,
+    page_height_inches: float = None,
+    margin_top_inches: float = None,
+    margin_bottom_inches: float = None,
+    margin_right_inches: float = None,
+    margin_left_inches: float = None,
+) -> dict:
+    """Apply page layout changes to one section of an open document."""
+    if section_index >= len(doc.sections):
+        raise ValueError(
+            f"Section {section_index} does not exist. Document has {len(doc.sections)} section(s)."
+        )
+
+    section = doc.sections[section_index]
+    changes = []
+
+    if orientation is not None:
+        if orientation.lower() == "landscape":
+            section.orientation = WD_ORIENT.LANDSCAPE
+            # Swap width/height if needed
+            if section.page_width < section.page_height:
+                section.page_width, section.page_height = section.page_height, section.page_width
+            changes.append("orientation=landscape")
+        elif orientation.lower() == "portrait":
+            section.orientation = WD_ORIENT.PORTRAIT
+            if section.page_width > section.page_height:
+                section.page_width, section.page_height = section.page_height, section.page_width
+            changes.append("orientation=portrait")
+
+    if page_width_inches is not None:
+        section.page_width = Inches(page_width_inches)
+        changes.append(f"width={page_width_inches}in")
+    if page_height_inches is not None:
+        section.page_height = Inches(page_height_inches)
+        changes.append(f"height={page_height_inches}in")
+    if margin_top_inches is not None:
+        section.top_margin = Inches(margin_top_inches)
+        changes.append(f"margin_top={margin_top_inches}in")
+    if margin_bottom_inches is not None:
+        section.bottom_margin = Inches(margin_bottom_inches)
+        changes.append(f"margin_bottom={margin_bottom_inches}in")
+    if margin_left_inches is not None:
+        section.left_margin = Inches(margin_left_inches)
+        changes.append(f"margin_left={margin_left_inches}in")
+    if margin_right_inches is not None:
+        section.right_margin = Inches(margin_right_inches)
+        changes.append(f"margin_right={margin_right_inches}in")
+
+    return {"section": section_index, "changes": changes}
+
+
 async def set_page_layout(
     filename: str,
     section_index: int = 0,
@@ -50,65 +150,101 @@ async def set_page_layout(
         margin_right_inches: Right margin in inches.
     """
     filename = ensure_docx_extension(filename)
-    if not os.path.exists(filename):
+    try:
+        st = os.stat(filename)
+    except OSError:
         return f"Document {filename} does not exist"
 
-    is_writeable, err = check_file_writeable(filename)
+    is_writeable, err = check_file_writeable(filename, st)
     if not is_writeable:
         return f"Cannot modify document: {err}"
 
     try:
         async with get_file_lock(filename):
-            doc = Document(filename)
-            if section_index >= len(doc.sections):
-                return f"Section {section_index} does not exist. Document has {len(doc.sections)} section(s)."
-
-            section = doc.sections[section_index]
-            changes = []
-
-            if orientation is not None:
-                if orientation.lower() == "landscape":
-                    section.orientation = WD_ORIENT.LANDSCAPE
-                    # Swap width/height if needed
-                    if section.page_width < section.page_height:
-                        section.page_width, section.page_height = section.page_height, section.page_width
-                    changes.append("orientation=landscape")
-                elif orientation.lower() == "portrait":
-                    section.orientation = WD_ORIENT.PORTRAIT
-                    if section.page_width > section.page_height:
-                        section.page_width, section.page_height = section.page_height, section.page_width
-                    changes.append("orientation=portrait")
-
-            if page_width_inches is not None:
-                section.page_width = Inches(page_width_inches)
-                changes.append(f"width={page_width_inches}in")
-            if page_height_inches is not None:
-                section.page_height = Inches(page_height_inches)
-                changes.append(f"height={page_height_inches}in")
-            if margin_top_inches is not None:
-                section.top_margin = Inches(margin_top_inches)
-                changes.append(f"margin_top={margin_top_inches}in")
-            if margin_bottom_inches is not None:
-                section.bottom_margin = Inches(margin_bottom_inches)
-                changes.append(f"margin_bottom={margin_bottom_inches}in")
-            if margin_left_inches is not None:
-                section.left_margin = Inches(margin_left_inches)
-                changes.append(f"margin_left={margin_left_inches}in")
-            if margin_right_inches is not None:
-                section.right_margin = Inches(margin_right_inches)
-                changes.append(f"margin_right={margin_right_inches}in")
-
-            doc.save(filename)
-        return json.dumps({
-            "success": True,
-            "section": section_index,
-            "changes": changes,
-        })
+            doc = await _load_doc(filename)
+            try:
+                result = _apply_page_layout(
+                    doc,
+                    section_index=section_index,
+                    orientation=orientation,
+                    page_width_inches=page_width_inches,
+                    page_height_inches=page_height_inches,
+                    margin_top_inches=margin_top_inches,
+                    margin_bottom_inches=margin_bottom_inches,
+                    margin_left_inches=margin_left_inches,
+                    margin_right_inches=margin_right_inches,
+                )
+            except ValueError as e:
+                return str(e)
+            if result["changes"]:
+                await _save_doc(doc, filename)
+        return json.dumps({"success": True, **result})
 
     except Exception as e:
         return json.dumps({"error": str(e)})
 
 
+def _set_single_line(container, text: str, alignment) -> None:
+    """Replace a header/footer's content with one line of text.
+
+    Reuses the first paragraph's first run (keeping its formatting)
+    instead of detaching every run and building a fresh one, so the cost
+    no longer grows with how many runs the old content held.
+    """
+    paragraphs = container.paragraphs
+    p = paragraphs[0] if paragraphs else container.add_paragraph()
+    first_run = p._p.find(qn("w:r"))
+    if first_run is None:
+        p.text = text
+    else:
+        # Drop everything except paragraph properties and the reused run.
+        for child in list(p._p):
+            if child is not first_run and child.tag != qn("w:pPr"):
+                p._p.remove(child)
+        rpr = first_run.find(qn("w:rPr"))
+        for child in list(first_run):
+            if child is not rpr:
+                first_run.remove(child)
+        t = first_run.makeelement(qn("w:t"), {})
+        if text != text.strip():
+            t.set(qn("xml:space"), "preserve")
+        t.text = text
+        first_run.append(t)
+    p.alignment = alignment
+    for extra in paragraphs[1:]:
+        extra.clear()
+
+
+def _apply_header_footer(
+    doc,
+    section_index: int = 0,
+    header_text: str = None,
+    footer_text: str = None,
+    header_alignment: str = "center",
+    footer_alignment: str = "center",
+) -> dict:
+    """Set header and/or footer text on one section of an open document."""
+    if section_index >= len(doc.sections):
+        raise ValueError(f"Section {section_index} does not exist.")
+
+    section = doc.sections[section_index]
+    added = []
+
+    if header_text is not None:
+        header = section.header
+        header.is_linked_to_previous = False
+        _set_single_line(header, header_text, _resolve_align(header_alignment))
+        added.append("header")
+
+    if footer_text is not None:
+        footer = section.footer
+        footer.is_linked_to_previous = False
+        _set_single_line(footer, footer_text, _resolve_align(footer_alignment))
+        added.append("footer")
+
+    return {"added": added, "section": section_index}
+
+
 async def add_header_footer(
     filename: str,
     section_index: int = 0,
@@ -128,45 +264,32 @@ async def add_header_footer(
         footer_alignment: "left", "center", "right", "justify".
     """
     filename = ensure_docx_extension(filename)
-    if not os.path.exists(filename):
+    try:
+        st = os.stat(filename)
+    except OSError:
         return f"Document {filename} does not exist"
 
-    is_writeable, err = check_file_writeable(filename)
+    is_writeable, err = check_file_writeable(filename, st)
     if not is_writeable:
         return f"Cannot modify document: {err}"
 
     try:
         async with get_file_lock(filename):
-            doc = Document(filename)
-            if section_index >= len(doc.sections):
-                return f"Section {section_index} does not exist."
-
-            section = doc.sections[section_index]
-            added = []
-
-            if header_text is not None:
-                header = section.header
-                header.is_linked_to_previous = False
-                # Clear existing and add new
-                for p in header.paragraphs:
-                    p.clear()
-                p = header.paragraphs[0] if header.paragraphs else header.add_paragraph()
-                p.text = header_text
-                p.alignment = _ALIGN_MAP.get(header_alignment.lower(), WD_ALIGN_PARAGRAPH.CENTER)
-                added.append("header")
-
-            if footer_text is not None:
-                footer = section.footer
-                footer.is_linked_to_previous = False
-                for p in footer.paragraphs:
-                    p.clear()
-                p = footer.paragraphs[0] if footer.paragraphs else footer.add_paragraph()
-                p.text = footer_text
-                p.alignment = _ALIGN_MAP.get(footer_alignment.lower(), WD_ALIGN_PARAGRAPH.CENTER)
-                added.append("footer")
-
-            doc.save(filename)
-        return json.dumps({"success": True, "added": added, "section": section_index})
+            doc = await _load_doc(filename)
+            try:
+                result = _apply_header_footer(
+                    doc,
+                    section_index=section_index,
+                    header_text=header_text,
+                    footer_text=footer_text,
+                    header_alignment=header_alignment,
+                    footer_alignment=footer_alignment,
+                )
+            except ValueError as e:
+                return str(e)
+            if result["added"]:
+                await _save_doc(doc, filename)
+        return json.dumps({"success": True, **result})
 
     except Exception as e:
         return json.dumps({"error": str(e)})
@@ -174,25 +297,58 @@ async def add_header_footer(
 
 def _add_field(paragraph, field_code: str):
     """Insert a Word field code (PAGE, NUMPAGES, etc.) into a paragraph."""
+    # makeelement builds each node directly instead of round-tripping an
+    # f-string through the XML parser.
     run = paragraph.add_run()
-    fld_char_begin = parse_xml(
-        f'<w:fldChar {nsdecls("w")} w:fldCharType="begin"/>'
-    )
+    fld_char_begin = run._r.makeelement(qn("w:fldChar"), {qn("w:fldCharType"): "begin"})
     run._r.append(fld_char_begin)
 
     run2 = paragraph.add_run()
-    instr = parse_xml(
-        f'<w:instrText {nsdecls("w")} xml:space="preserve"> {field_code} </w:instrText>'
-    )
+    instr = run2._r.makeelement(qn("w:instrText"), {qn("xml:space"): "preserve"})
+    instr.text = f" {field_code} "
     run2._r.append(instr)
 
     run3 = paragraph.add_run()
-    fld_char_end = parse_xml(
-        f'<w:fldChar {nsdecls("w")} w:fldCharType="end"/>'
-    )
+    fld_char_end = run3._r.makeelement(qn("w:fldChar"), {qn("w:fldCharType"): "end"})
     run3._r.append(fld_char_end)
 
 
+def _apply_page_numbers(
+    doc,
+    section_index: int = 0,
+    position: str = "footer",
+    alignment: str = "center",
+    prefix: str = "",
+    suffix: str = "",
+    include_total: bool = False,
+) -> dict:
+    """Add a page-number field paragraph to a section header or footer."""
+    if section_index >= len(doc.sections):
+        raise ValueError(f"Section {section_index} does not exist.")
+
+    section = doc.sections[section_index]
+    target = section.header if position == "header" else section.footer
+    target.is_linked_to_previous = False
+
+    # Add a new paragraph for page numbers
+    p = target.add_paragraph()
+    p.alignment = _resolve_align(alignment)
+
+    if prefix:
+        p.add_run(prefix)
+
+    _add_field(p, "PAGE")
+
+    if include_total:
+        p.add_run(" / ")
+        _add_field(p, "NUMPAGES")
+
+    if suffix:
+        p.add_run(suffix)
+
+    return {"position": position, "alignment": alignment, "include_total": include_total}
+
+
 async def add_page_numbers(
     filename: str,
     section_index: int = 0,
@@ -214,49 +370,53 @@ async def add_page_numbers(
         include_total: If True, adds " of N" after the page number.
     """
     filename = ensure_docx_extension(filename)
-    if not os.path.exists(filename):
+    try:
+        st = os.stat(filename)
+    except OSError:
         return f"Document {filename} does not exist"
 
-    is_writeable, err = check_file_writeable(filename)
+    is_writeable, err = check_file_writeable(filename, st)
     if not is_writeable:
         return f"Cannot modify document: {err}"
 
     try:
         async with get_file_lock(filename):
-            doc = Document(filename)
-            if section_index >= len(doc.sections):
-                return f"Section {section_index} does not exist."
-
-            section = doc.sections[section_index]
-            target = section.header if position == "header" else section.footer
-            target.is_linked_to_previous = False
-
-            # Add a new paragraph for page numbers
-            p = target.add_paragraph()
-            p.alignment = _ALIGN_MAP.get(alignment.lower(), WD_ALIGN_PARAGRAPH.CENTER)
+            doc = await _load_doc(filename)
+            try:
+                result = _apply_page_numbers(
+                    doc,
+                    section_index=section_index,
+                    position=position,
+                    alignment=alignment,
+                    prefix=prefix,
+                    suffix=suffix,
+                    include_total=include_total,
+                )
+            except ValueError as e:
+                return str(e)
+            await _save_doc(doc, filename)
+        return json.dumps({"success": True, **result})
 
-            if prefix:
-                p.add_run(prefix)
+    except Exception as e:
+        return json.dumps({"error": str(e)})
 
-            _add_field(p, "PAGE")
 
-            if include_total:
-                p.add_run(" / ")
-                _add_field(p, "NUMPAGES")
+def _apply_section_break(doc, break_type: str = "new_page") -> dict:
+    """Append a section break of the given type to an open document."""
+    from docx.enum.section import WD_SECTION
 
-            if suffix:
-                p.add_run(suffix)
+    type_map = {
+        "new_page": WD_SECTION.NEW_PAGE,
+        "continuous": WD_SECTION.CONTINUOUS,
+        "even_page": WD_SECTION.EVEN_PAGE,
+        "odd_page": WD_SECTION.ODD_PAGE,
+    }
 
-            doc.save(filename)
-        return json.dumps({
-            "success": True,
-            "position": position,
-            "alignment": alignment,
-            "include_total": include_total,
-        })
+    if break_type not in type_map:
+        raise ValueError(f"Invalid break_type: {break_type}. Use: {list(type_map.keys())}")
 
-    except Exception as e:
-        return json.dumps({"error": str(e)})
+    doc.add_section(type_map[break_type])
+    return {"break_type": break_type, "total_sections": len(doc.sections)}
 
 
 async def add_section_break(
@@ -269,42 +429,91 @@ async def add_section_break(
         filename: Path to the Word document.
         break_type: "new_page", "continuous", "even_page", "odd_page".
     """
-    from docx.enum.section import WD_SECTION
-
-    type_map = {
-        "new_page": WD_SECTION.NEW_PAGE,
-        "continuous": WD_SECTION.CONTINUOUS,
-        "even_page": WD_SECTION.EVEN_PAGE,
-        "odd_page": WD_SECTION.ODD_PAGE,
-    }
-
     filename = ensure_docx_extension(filename)
-    if not os.path.exists(filename):
+    try:
+        st = os.stat(filename)
+    except OSError:
         return f"Document {filename} does not exist"
 
-    is_writeable, err = check_file_writeable(filename)
+    is_writeable, err = check_file_writeable(filename, st)
     if not is_writeable:
         return f"Cannot modify document: {err}"
 
-    if break_type not in type_map:
-        return f"Invalid break_type: {break_type}. Use: {list(type_map.keys())}"
-
     try:
         async with get_file_lock(filename):
-            doc = Document(filename)
-            doc.add_section(type_map[break_type])
-            doc.save(filename)
-            total_sections = len(doc.sections)
-        return json.dumps({
-            "success": True,
-            "break_type": break_type,
-            "total_sections": total_sections,
-        })
+            doc = await _load_doc(filename)
+            try:
+                result = _apply_section_break(doc, break_type=break_type)
+            except ValueError as e:
+                return str(e)
+            await _save_doc(doc, filename)
+        return json.dumps({"success": True, **result})
 
     except Exception as e:
         return json.dumps({"error": str(e)})
 
 
+def _apply_paragraph_spacing(
+    doc,
+    paragraph_index: int = None,
+    start_paragraph: int = None,
+    end_paragraph: int = None,
+    space_before_pt: float = None,
+    space_after_pt: float = None,
+    line_spacing: float = None,
+    line_spacing_rule: str = None,
+) -> dict:
+    """Set spacing on one paragraph, a range, or every paragraph."""
+    paragraphs = doc.paragraphs
+    total = len(paragraphs)
+
+    # Determine range
+    if start_paragraph is not None and end_paragraph is not None:
+        indices = range(start_paragraph, min(end_paragraph + 1, total))
+    elif paragraph_index is not None:
+        if paragraph_index >= total:
+            raise ValueError(
+                f"Paragraph {paragraph_index} does not exist. Document has {total} paragraphs."
+            )
+        indices = range(paragraph_index, paragraph_index + 1)
+    else:
+        # Apply to all
+        indices = range(total)
+
+    # The target w:spacing attribute values are the same for every
+    # paragraph, so compute them once up front and write them straight
+    # onto the element instead of going through a paragraph_format
+    # property setter (Length wrapper, rule translation, XML lookup)
+    # per paragraph per attribute.
+    line_val = line_rule = None
+    if line_spacing_rule is not None:
+        line_val, line_rule = _SPACING_RULE_ATTRS.get(line_spacing_rule, (None, None))
+    if line_spacing is not None:
+        if line_spacing_rule in ("exactly", "at_least"):
+            line_val = str(Pt(line_spacing).twips)
+        else:
+            line_val = str(Emu(line_spacing * Pt(12)).twips)
+            line_rule = "auto"
+
+    attrs = []
+    if space_before_pt is not None:
+        attrs.append((qn("w:before"), str(Pt(space_before_pt).twips)))
+    if space_after_pt is not None:
+        attrs.append((qn("w:after"), str(Pt(space_after_pt).twips)))
+    if line_val is not None:
+        attrs.append((qn("w:line"), line_val))
+    if line_rule is not None:
+        attrs.append((qn("w:lineRule"), line_rule))
+
+    if attrs:
+        for i in indices:
+            spacing = paragraphs[i]._p.get_or_add_pPr().get_or_add_spacing()
+            for key, value in attrs:
+                spacing.set(key, value)
+
+    return {"paragraphs_affected": len(indices)}
+
+
 async def set_paragraph_spacing(
     filename: str,
     paragraph_index: int = None,
@@ -327,67 +536,69 @@ async def set_paragraph_spacing(
         line_spacing: Line spacing value (depends on rule).
         line_spacing_rule: "single", "1.5_lines", "double", "exactly", "at_least", "multiple".
     """
-    from docx.enum.text import WD_LINE_SPACING
-
-    rule_map = {
-        "single": WD_LINE_SPACING.SINGLE,
-        "1.5_lines": WD_LINE_SPACING.ONE_POINT_FIVE,
-        "double": WD_LINE_SPACING.DOUBLE,
-        "exactly": WD_LINE_SPACING.EXACTLY,
-        "at_least": WD_LINE_SPACING.AT_LEAST,
-        "multiple": WD_LINE_SPACING.MULTIPLE,
-    }
-
     filename = ensure_docx_extension(filename)
-    if not os.path.exists(filename):
+    try:
+        st = os.stat(filename)
+    except OSError:
         return f"Document {filename} does not exist"
 
-    is_writeable, err = check_file_writeable(filename)
+    is_writeable, err = check_file_writeable(filename, st)
     if not is_writeable:
         return f"Cannot modify document: {err}"
 
     try:
         async with get_file_lock(filename):
-            doc = Document(filename)
-            total = len(doc.paragraphs)
-
-            # Determine range
-            if start_paragraph is not None and end_paragraph is not None:
-                indices = range(start_paragraph, min(end_paragraph + 1, total))
-            elif paragraph_index is not None:
-                if paragraph_index >= total:
-                    return f"Paragraph {paragraph_index} does not exist. Document has {total} paragraphs."
-                indices = [paragraph_index]
-            else:
-                # Apply to all
-                indices = range(total)
-
-            count = 0
-            for i in indices:
-                pf = doc.paragraphs[i].paragraph_format
-                if space_before_pt is not None:
-                    pf.space_before = Pt(space_before_pt)
-                if space_after_pt is not None:
-                    pf.space_after = Pt(space_after_pt)
-                if line_spacing_rule is not None and line_spacing_rule in rule_map:
-                    pf.line_spacing_rule = rule_map[line_spacing_rule]
-                if line_spacing is not None:
-                    if line_spacing_rule in ("exactly", "at_least"):
-                        pf.line_spacing = Pt(line_spacing)
-                    else:
-                        pf.line_spacing = line_spacing
-                count += 1
-
-            doc.save(filename)
-        return json.dumps({
-            "success": True,
-            "paragraphs_affected": count,
-        })
+            doc = await _load_doc(filename)
+            try:
+                result = _apply_paragraph_spacing(
+                    doc,
+                    paragraph_index=paragraph_index,
+                    start_paragraph=start_paragraph,
+                    end_paragraph=end_paragraph,
+                    space_before_pt=space_before_pt,
+                    space_after_pt=space_after_pt,
+                    line_spacing=line_spacing,
+                    line_spacing_rule=line_spacing_rule,
+                )
+            except ValueError as e:
+                return str(e)
+            # No paragraphs in range, or nothing requested: the document is
+            # untouched, so skip the rewrite.
+            changed = result["paragraphs_affected"] > 0 and any(
+                v is not None
+                for v in (space_before_pt, space_after_pt, line_spacing, line_spacing_rule)
+            )
+            if changed:
+                await _save_doc(doc, filename)
+        return json.dumps({"success": True, **result})
 
     except Exception as e:
         return json.dumps({"error": str(e)})
 
 
+def _apply_bookmark(doc, paragraph_index: int, bookmark_name: str) -> dict:
+    """Wrap one paragraph of an open document in a named bookmark."""
+    if paragraph_index >= len(doc.paragraphs):
+        raise ValueError(f"Paragraph {paragraph_index} does not exist.")
+
+    para = doc.paragraphs[paragraph_index]
+
+    # Sequential IDs from a process-wide counter stay unique without the
+    # (tiny) collision chance of random draws.
+    bm_id = str(next(_BOOKMARK_IDS))
+
+    # Insert bookmarkStart before paragraph content
+    bm_start = para._p.makeelement(
+        qn("w:bookmarkStart"), {qn("w:id"): bm_id, qn("w:name"): bookmark_name}
+    )
+    bm_end = para._p.makeelement(qn("w:bookmarkEnd"), {qn("w:id"): bm_id})
+
+    para._p.insert(0, bm_start)
+    para._p.append(bm_end)
+
+    return {"bookmark_name": bookmark_name, "paragraph_index": paragraph_index}
+
+
 async def add_bookmark(
     filename: str,
     paragraph_index: int,
@@ -401,45 +612,123 @@ async def add_bookmark(
         bookmark_name: Bookmark name (no spaces, alphanumeric + underscore).
     """
     filename = ensure_docx_extension(filename)
-    if not os.path.exists(filename):
+    try:
+        st = os.stat(filename)
+    except OSError:
         return f"Document {filename} does not exist"
 
-    is_writeable, err = check_file_writeable(filename)
+    is_writeable, err = check_file_writeable(filename, st)
     if not is_writeable:
         return f"Cannot modify document: {err}"
 
     try:
         async with get_file_lock(filename):
-            doc = Document(filename)
-            if paragraph_index >= len(doc.paragraphs):
-                return f"Paragraph {paragraph_index} does not exist."
+            doc = await _load_doc(filename)
+            try:
+                result = _apply_bookmark(doc, paragraph_index=paragraph_index, bookmark_name=bookmark_name)
+            except ValueError as e:
+                return str(e)
+            await _save_doc(doc, filename)
+        return json.dumps({"success": True, **result})
 
-            para = doc.paragraphs[paragraph_index]
+    except Exception as e:
+        return json.dumps({"error": str(e)})
 
-            # Generate a unique bookmark ID
-            import random
-            bm_id = str(random.randint(1000, 99999))
 
-            # Insert bookmarkStart before paragraph content
-            bm_start = parse_xml(
-                f'<w:bookmarkStart {nsdecls("w")} w:id="{bm_id}" w:name="{bookmark_name}"/>'
-            )
-            bm_end = parse_xml(
-                f'<w:bookmarkEnd {nsdecls("w")} w:id="{bm_id}"/>'
-            )
+_VML_NS = {
+    "v": "urn:schemas-microsoft-com:vml",
+    "o": "urn:schemas-microsoft-com:office:office",
+}
 
-            para._p.insert(0, bm_start)
-            para._p.append(bm_end)
+# The ~50-line VML shape definition is identical across calls, so it is
+# parsed once at import; each call deepcopies the tree and patches only
+# the attributes that vary (style, fill color, text, font size).  The
+# namespaces are declared inline because python-docx's nsdecls() does not
+# know the VML prefixes.
+_WATERMARK_TEMPLATE = parse_xml(
+    '<w:r xmlns:w="http://schemas.openxmlformats.org/wordprocessingml/2006/main"'
+    '  xmlns:v="urn:schemas-microsoft-com:vml"'
+    '  xmlns:o="urn:schemas-microsoft-com:office:office"'
+    '  xmlns:w10="urn:schemas-microsoft-com:office:word">'
+    '  <w:rPr><w:noProof/></w:rPr>'
+    '  <w:pict>'
+    '    <v:shapetype id="_x0000_t136" coordsize="21600,21600"'
+    '      o:spt="136" adj="10800"'
+    '      path="m@7,l@8,m@5,21600l@6,21600e">'
+    '      <v:formulas>'
+    '        <v:f eqn="sum #0 0 10800"/>'
+    '        <v:f eqn="prod #0 2 1"/>'
+    '        <v:f eqn="sum 21600 0 @1"/>'
+    '        <v:f eqn="sum 0 0 @2"/>'
+    '        <v:f eqn="sum 21600 0 @3"/>'
+    '        <v:f eqn="if @0 @3 0"/>'
+    '        <v:f eqn="if @0 21600 @1"/>'
+    '        <v:f eqn="if @0 0 @2"/>'
+    '        <v:f eqn="if @0 @4 21600"/>'
+    '        <v:f eqn="mid @5 @6"/>'
+    '        <v:f eqn="mid @8 @5"/>'
+    '        <v:f eqn="mid @7 @8"/>'
+    '        <v:f eqn="mid @6 @7"/>'
+    '        <v:f eqn="sum @6 0 @5"/>'
+    '      </v:formulas>'
+    '      <v:path textpathok="t" o:connecttype="custom"'
+    '        o:connectlocs="@9,0;@10,10800;@11,21600;@12,10800"'
+    '        o:connectangles="270,180,90,0"/>'
+    '      <v:textpath on="t" fitshape="t"/>'
+    '      <v:handles><v:h position="#0,bottomRight" xrange="6629,14971"/></v:handles>'
+    '      <o:lock v:ext="edit" text="t" shapetype="t"/>'
+    '    </v:shapetype>'
+    '    <v:shape id="PowerPlusWaterMarkObject"'
+    '      o:spid="_x0000_s2049" type="#_x0000_t136"'
+    '      style="" o:allowincell="f" fillcolor="" stroked="f">'
+    '      <v:fill opacity=".5"/>'
+    '      <v:textpath style="" string=""/>'
+    '      <w10:wrap anchorx="margin" anchory="margin"/>'
+    '    </v:shape>'
+    '  </w:pict>'
+    '</w:r>'
+)
+
+
+def _apply_watermark(
+    doc,
+    text: str = "TASLAK",
+    font_size: int = 72,
+    font_color: str = "C0C0C0",
+    rotation: int = -45,
+    section_index: int = 0,
+) -> dict:
+    """Add a diagonal VML text watermark to one section's header."""
+    if section_index >= len(doc.sections):
+        raise ValueError(f"Section {section_index} does not exist.")
+
+    section = doc.sections[section_index]
+    header = section.header
+    header.is_linked_to_previous = False
+
+    run = copy.deepcopy(_WATERMARK_TEMPLATE)
+    shape = run.find(".//v:shape", _VML_NS)
+    shape.set(
+        "style",
+        "position:absolute;margin-left:0;margin-top:0;"
+        "width:500pt;height:150pt;"
+        f"rotation:{rotation};"
+        "z-index:-251658752;mso-position-horizontal:center;"
+        "mso-position-horizontal-relative:margin;"
+        "mso-position-vertical:center;"
+        "mso-position-vertical-relative:margin",
+    )
+    shape.set("fillcolor", f"#{font_color}")
+    # Direct child lookup: the shapetype definition above carries its own
+    # v:textpath that must stay untouched.
+    textpath = shape.find("v:textpath", _VML_NS)
+    textpath.set("style", f'font-family:"Calibri";font-size:{font_size}pt')
+    textpath.set("string", text)
 
-            doc.save(filename)
-        return json.dumps({
-            "success": True,
-            "bookmark_name": bookmark_name,
-            "paragraph_index": paragraph_index,
-        })
+    p = header.paragraphs[0] if header.paragraphs else header.add_paragraph()
+    p._p.append(run)
 
-    except Exception as e:
-        return json.dumps({"error": str(e)})
+    return {"text": text, "font_size": font_size, "color": font_color, "rotation": rotation}
 
 
 async def add_watermark(
@@ -461,85 +750,114 @@ async def add_watermark(
         section_index: Which section to add watermark to (0-based).
     """
     filename = ensure_docx_extension(filename)
-    if not os.path.exists(filename):
+    try:
+        st = os.stat(filename)
+    except OSError:
         return f"Document {filename} does not exist"
 
-    is_writeable, err = check_file_writeable(filename)
+    is_writeable, err = check_file_writeable(filename, st)
     if not is_writeable:
         return f"Cannot modify document: {err}"
 
     try:
         async with get_file_lock(filename):
-            doc = Document(filename)
-            if section_index >= len(doc.sections):
-                return f"Section {section_index} does not exist."
-
-            section = doc.sections[section_index]
-            header = section.header
-            header.is_linked_to_previous = False
-
-            # Build a VML shape for the watermark
-            # The shape is placed in a paragraph inside the header
-            watermark_xml = (
-                f'<w:r {nsdecls("w", "v", "o", "w10")}>'
-                f'  <w:rPr><w:noProof/></w:rPr>'
-                f'  <w:pict>'
-                f'    <v:shapetype id="_x0000_t136" coordsize="21600,21600"'
-                f'      o:spt="136" adj="10800"'
-                f'      path="m@7,l@8,m@5,21600l@6,21600e">'
-                f'      <v:formulas>'
-                f'        <v:f eqn="sum #0 0 10800"/>'
-                f'        <v:f eqn="prod #0 2 1"/>'
-                f'        <v:f eqn="sum 21600 0 @1"/>'
-                f'        <v:f eqn="sum 0 0 @2"/>'
-                f'        <v:f eqn="sum 21600 0 @3"/>'
-                f'        <v:f eqn="if @0 @3 0"/>'
-                f'        <v:f eqn="if @0 21600 @1"/>'
-                f'        <v:f eqn="if @0 0 @2"/>'
-                f'        <v:f eqn="if @0 @4 21600"/>'
-                f'        <v:f eqn="mid @5 @6"/>'
-                f'        <v:f eqn="mid @8 @5"/>'
-                f'        <v:f eqn="mid @7 @8"/>'
-                f'        <v:f eqn="mid @6 @7"/>'
-                f'        <v:f eqn="sum @6 0 @5"/>'
-                f'      </v:formulas>'
-                f'      <v:path textpathok="t" o:connecttype="custom"'
-                f'        o:connectlocs="@9,0;@10,10800;@11,21600;@12,10800"'
-                f'        o:connectangles="270,180,90,0"/>'
-                f'      <v:textpath on="t" fitshape="t"/>'
-                f'      <v:handles><v:h position="#0,bottomRight" xrange="6629,14971"/></v:handles>'
-                f'      <o:lock v:ext="edit" text="t" shapetype="t"/>'
-                f'    </v:shapetype>'
-                f'    <v:shape id="PowerPlusWaterMarkObject"'
-                f'      o:spid="_x0000_s2049" type="#_x0000_t136"'
-                f'      style="position:absolute;margin-left:0;margin-top:0;'
-                f'width:500pt;height:150pt;rotation:{rotation};'
-                f'z-index:-251658752;mso-position-horizontal:center;'
-                f'mso-position-horizontal-relative:margin;'
-                f'mso-position-vertical:center;'
-                f'mso-position-vertical-relative:margin"'
-                f'      o:allowincell="f"'
-                f'      fillcolor="#{font_color}" stroked="f">'
-                f'      <v:fill opacity=".5"/>'
-                f'      <v:textpath style="font-family:&quot;Calibri&quot;;font-size:{font_size}pt"'
-                f'        string="{text}"/>'
-                f'      <w10:wrap anchorx="margin" anchory="margin"/>'
-                f'    </v:shape>'
-                f'  </w:pict>'
-                f'</w:r>'
-            )
+            doc = await _load_doc(filename)
+            try:
+                result = _apply_watermark(
+                    doc,
+                    text=text,
+                    font_size=font_size,
+                    font_color=font_color,
+                    rotation=rotation,
+                    section_index=section_index,
+                )
+            except ValueError as e:
+                return str(e)
+            await _save_doc(doc, filename)
+        return json.dumps({"success": True, **result})
 
-            p = header.paragraphs[0] if header.paragraphs else header.add_paragraph()
-            p._p.append(parse_xml(watermark_xml))
+    except Exception as e:
+        return json.dumps({"error": str(e)})
 
-            doc.save(filename)
-        return json.dumps({
-            "success": True,
-            "text": text,
-            "font_size": font_size,
-            "color": font_color,
-            "rotation": rotation,
-        })
 
+_PLAN_OPS = {
+    "set_page_layout": _apply_page_layout,
+    "add_header_footer": _apply_header_footer,
+    "add_page_numbers": _apply_page_numbers,
+    "add_section_break": _apply_section_break,
+    "set_paragraph_spacing": _apply_paragraph_spacing,
+    "add_bookmark": _apply_bookmark,
+    "add_watermark": _apply_watermark,
+}
+
+
+async def apply_layout_plan(filename: str, ops: list) -> str:
+    """Apply several layout operations in one pass (one document load and save).
+
+    Equivalent to a sequence of set_page_layout / add_header_footer /
+    add_page_numbers / add_section_break / set_paragraph_spacing /
+    add_bookmark / add_watermark calls, but the document is parsed and
+    re-serialized only once, so multi-step layout setups run much faster.
+
+    Args:
+        filename: Path to the Word document.
+        ops: List of operation dicts. Each needs an "op" naming one of the
+            tools above; the remaining keys are that tool's arguments
+            (without filename), e.g. {"op": "set_page_layout",
+            "orientation": "landscape"}.
+
+    Returns:
+        JSON string with overall result and per-operation outcomes
+    """
+    filename = ensure_docx_extension(filename)
+    try:
+        st = os.stat(filename)
+    except OSError:
+        return json.dumps({"success": False, "error": f"Document {filename} does not exist"})
+
+    is_writeable, err = check_file_writeable(filename, st)
+    if not is_writeable:
+        return json.dumps({"success": False, "error": f"Cannot modify document: {err}"})
+
+    if not ops:
+        return json.dumps({"success": False, "error": "ops cannot be empty"})
+
+    try:
+        async with get_file_lock(filename):
+            doc = await _load_doc(filename)
+
+            results = []
+            applied = 0
+            for op in ops:
+                name = op.get("op")
+                apply_fn = _PLAN_OPS.get(name)
+                if apply_fn is None:
+                    results.append({
+                        "success": False,
+                        "error": f"Unknown op: '{name}'. Use: {list(_PLAN_OPS.keys())}",
+                    })
+                    continue
+                kwargs = {k: v for k, v in op.items() if k != "op"}
+                try:
+                    results.append({"success": True, "op": name, **apply_fn(doc, **kwargs)})
+                    applied += 1
+                except (ValueError, TypeError) as e:
+                    results.append({"success": False, "op": name, "error": str(e)})
+
+            if applied == 0:
+                return json.dumps({
+                    "success": False,
+                    "error": "No operations were applied",
+                    "results": results,
+                }, ensure_ascii=False, indent=2)
+
+            await _save_doc(doc, filename)
+
+        return json.dumps({
+            "success": applied == len(ops),
+            "applied": applied,
+            "total": len(ops),
+            "results": results,
+        }, ensure_ascii=False, indent=2)
     except Exception as e:
-        return json.dumps({"error": str(e)})
+        return json.dumps({"success": False, "error": f"Failed to apply layout plan: {str(e)}"})
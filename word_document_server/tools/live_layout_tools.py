@@ -5,7 +5,7 @@ They provide layout, header/footer, spacing, bookmark, watermark, and section
 management for files that are open (and locked) in Word.
 """
 
-import json
+from word_document_server.utils import fast_json as json
 import sys
 
 # macOS JXA dispatch
@@ -404,9 +404,16 @@ async def word_live_set_paragraph_spacing(
             indices = range(1, total + 1)
 
         with undo_record(app, "MCP: Set Paragraph Spacing"):
-            count = 0
-            for i in indices:
-                pf = doc.Paragraphs(i).Format
+            count = len(indices)
+            if count:
+                # The target paragraphs are always contiguous, so cover them
+                # with one Range and assign each property once: Word applies
+                # a ParagraphFormat set on a range to every paragraph in it
+                # in a single layout pass, instead of one COM round-trip and
+                # reflow per paragraph.
+                start = doc.Paragraphs(indices[0]).Range.Start
+                end = doc.Paragraphs(indices[-1]).Range.End
+                pf = doc.Range(start, end).ParagraphFormat
                 if space_before_pt is not None:
                     pf.SpaceBefore = space_before_pt
                 if space_after_pt is not None:
@@ -423,7 +430,6 @@ async def word_live_set_paragraph_spacing(
                     align_map = {"left": 0, "center": 1, "right": 2, "justify": 3}
                     if alignment in align_map:
                         pf.Alignment = align_map[alignment]
-                count += 1
 
         return json.dumps({
             "success": True,
@@ -4,7 +4,7 @@ These tools operate on documents that are currently open in Word,
 providing real-time editing capabilities with optional tracked changes.
 """
 
-import json
+from word_document_server.utils import fast_json as json
 import os
 import re
 import sys
@@ -1138,6 +1138,28 @@ async def word_live_insert_paragraphs(
         return json.dumps({"error": str(e)})
 
 
+def _table_payload(data: list, rows: int, cols: int):
+    """Build a tab/newline-delimited string covering a rows x cols grid.
+
+    Missing cells are padded with empty strings and excess rows/columns are
+    truncated, matching the per-cell fill behavior. Returns None when any
+    cell value contains a delimiter character (tab, newline, CR) or a cell
+    separator (\\x07) — such data would corrupt the grid and must go through
+    per-cell assignment instead.
+    """
+    lines = []
+    for r in range(rows):
+        row_data = data[r] if r < len(data) else []
+        cells = []
+        for c in range(cols):
+            val = str(row_data[c]) if c < len(row_data) else ""
+            if "\t" in val or "\n" in val or "\r" in val or "\x07" in val:
+                return None
+            cells.append(val)
+        lines.append("\t".join(cells))
+    return "\n".join(lines)
+
+
 async def word_live_add_table(
     filename: str = None,
     rows: int = 2,
@@ -1243,11 +1265,38 @@ async def word_live_add_table(
                     "fixed": (0, 0),    # wdWord8TableBehavior, wdAutoFitFixed
                 }
 
-                if autofit and autofit.lower() in AUTOFIT_MAP:
-                    default_behavior, autofit_behavior = AUTOFIT_MAP[autofit.lower()]
-                    table = doc.Tables.Add(rng, rows, cols, default_behavior, autofit_behavior)
+                behavior = AUTOFIT_MAP.get(autofit.lower()) if autofit else None
+
+                payload = _table_payload(data, rows, cols) if data else None
+                if payload is not None:
+                    # Bulk path: every Cell().Range.Text assignment is a
+                    # cross-process COM round-trip, so rows x cols of them
+                    # dominate large tables. Insert the whole grid as one
+                    # delimited string and let Word build the table in a
+                    # single ConvertToTable call (Separator=1 is
+                    # wdSeparateByTabs; positional args — dynamic dispatch
+                    # rejects keywords).
+                    rng.Text = payload
+                    table = rng.ConvertToTable(1, rows, cols)
+                    if behavior is not None:
+                        try:
+                            table.AutoFitBehavior(behavior[1])
+                        except Exception:
+                            pass  # older Word; keep default sizing
                 else:
-                    table = doc.Tables.Add(rng, rows, cols)
+                    if behavior is not None:
+                        table = doc.Tables.Add(rng, rows, cols, behavior[0], behavior[1])
+                    else:
+                        table = doc.Tables.Add(rng, rows, cols)
+
+                    if data:
+                        for r_idx, row_data in enumerate(data):
+                            if r_idx >= rows:
+                                break
+                            for c_idx, cell_val in enumerate(row_data):
+                                if c_idx >= cols:
+                                    break
+                                table.Cell(r_idx + 1, c_idx + 1).Range.Text = str(cell_val)
 
                 # Apply table style
                 if style:
@@ -1255,15 +1304,6 @@ async def word_live_add_table(
                         table.Style = doc.Styles(style)
                     except Exception:
                         pass  # Style not found; proceed without
-
-                if data:
-                    for r_idx, row_data in enumerate(data):
-                        if r_idx >= rows:
-                            break
-                        for c_idx, cell_val in enumerate(row_data):
-                            if c_idx >= cols:
-                                break
-                            table.Cell(r_idx + 1, c_idx + 1).Range.Text = str(cell_val)
             finally:
                 if track_changes:
                     doc.TrackRevisions = prev_tracking
@@ -2511,3 +2551,98 @@ async def word_live_insert_equation(
 
     except Exception as e:
         return json.dumps({"error": str(e)})
+
+
+# Mutating live tools that word_live_batch may dispatch to.  Values are
+# (module, function name); live_layout_tools resolves lazily to keep this
+# module import-light and cycle-free.
+_BATCHABLE_OPS = {
+    "insert_text": (None, "word_live_insert_text"),
+    "format_text": (None, "word_live_format_text"),
+    "replace_text": (None, "word_live_replace_text"),
+    "delete_text": (None, "word_live_delete_text"),
+    "insert_paragraphs": (None, "word_live_insert_paragraphs"),
+    "apply_list": (None, "word_live_apply_list"),
+    "add_table": (None, "word_live_add_table"),
+    "format_table": (None, "word_live_format_table"),
+    "modify_table": (None, "word_live_modify_table"),
+    "insert_image": (None, "word_live_insert_image"),
+    "set_paragraph_spacing": ("live_layout_tools", "word_live_set_paragraph_spacing"),
+    "add_bookmark": ("live_layout_tools", "word_live_add_bookmark"),
+}
+
+
+def _resolve_batch_op(op_name):
+    module_name, fn_name = _BATCHABLE_OPS[op_name]
+    if module_name is None:
+        return globals()[fn_name]
+    import importlib
+    module = importlib.import_module(f"word_document_server.tools.{module_name}")
+    return getattr(module, fn_name)
+
+
+async def word_live_batch(filename: str = None, ops: list = None) -> str:
+    """Run several live edits in one screen-frozen, single-undo session.
+
+    Each individual word_live_* call lets Word redraw, repaginate, and
+    spell-check between edits; this tool suspends that work once, applies
+    every operation, then restores the flags, so long edit sequences run
+    far faster and undo as a single Ctrl+Z step.
+
+    Args:
+        filename: Document name or path (None = active document); used as
+            the default for ops that don't name their own file.
+        ops: List of operation dicts: {"op": <name>, "args": {...}} where
+            <name> is one of insert_text, format_text, replace_text,
+            delete_text, insert_paragraphs, apply_list, add_table,
+            format_table, modify_table, insert_image,
+            set_paragraph_spacing, add_bookmark.  Args match the
+            corresponding word_live_* tool's parameters.
+
+    Returns:
+        JSON with overall success and the per-operation results in order.
+    """
+    if sys.platform != "win32":
+        return json.dumps({"error": "Batch live editing is only available on Windows"})
+
+    if not ops:
+        return json.dumps({"error": "ops cannot be empty"})
+
+    for op in ops:
+        name = op.get("op") if isinstance(op, dict) else None
+        if name not in _BATCHABLE_OPS:
+            return json.dumps({
+                "error": f"Unknown op: {name!r}. "
+                         f"Supported: {', '.join(sorted(_BATCHABLE_OPS))}"
+            })
+
+    try:
+        from word_document_server.core.word_com import get_word_app, batch_session
+
+        app = get_word_app()
+
+        results = []
+        ok = 0
+        with batch_session(app, "MCP: Batch Edits"):
+            for op in ops:
+                fn = _resolve_batch_op(op["op"])
+                args = dict(op.get("args") or {})
+                args.setdefault("filename", filename)
+                raw = await fn(**args)
+                try:
+                    result = json.loads(raw)
+                except (TypeError, ValueError):
+                    result = {"raw": raw}
+                results.append({"op": op["op"], "result": result})
+                if isinstance(result, dict) and not result.get("error"):
+                    ok += 1
+
+        return json.dumps({
+            "success": ok == len(ops),
+            "completed": ok,
+            "total": len(ops),
+            "results": results,
+        }, ensure_ascii=False)
+
+    except Exception as e:
+        return json.dumps({"error": str(e)})
@@ -1,6 +1,6 @@
 """Screen capture tool for Microsoft Word documents via COM + Win32 API."""
 
-import json
+from word_document_server.utils import fast_json as json
 import os
 import sys
 
@@ -5,7 +5,8 @@ These tools provide MCP interfaces for creating, listing, accepting,
 and rejecting tracked changes in Word documents.
 """
 
-import json
+from word_document_server.utils import fast_json as json
+import asyncio
 import os
 from typing import Optional
 
@@ -13,9 +14,11 @@ from word_document_server.defaults import DEFAULT_AUTHOR
 
 from word_document_server.utils.file_utils import check_file_writeable, ensure_docx_extension, get_file_lock
 from word_document_server.core.tracked_changes import (
+    text_absent_quick,
     track_replace_in_doc,
     track_insert_in_doc,
     track_delete_in_doc,
+    track_batch_edits_in_doc,
     list_tracked_changes_in_doc,
     accept_tracked_changes_in_doc,
     reject_tracked_changes_in_doc,
@@ -52,10 +55,17 @@ async def track_replace(
 
     if not old_text:
         return json.dumps({"success": False, "error": "old_text cannot be empty"})
+    if old_text == new_text:
+        return json.dumps({"success": False, "error": "old_text and new_text are identical — nothing to change"})
+
+    # Agents commonly retry with text that isn't in the document; a raw
+    # scan of document.xml rejects those without the parse + re-zip cost.
+    if text_absent_quick(filename, old_text):
+        return json.dumps({"success": False, "error": f"Text not found: '{old_text}'"})
 
     try:
         async with get_file_lock(filename):
-            result = track_replace_in_doc(filename, old_text, new_text, author)
+            result = await asyncio.to_thread(track_replace_in_doc, filename, old_text, new_text, author)
         return json.dumps(result, ensure_ascii=False, indent=2)
     except Exception as e:
         return json.dumps({"success": False, "error": f"Failed to track replace: {str(e)}"})
@@ -95,7 +105,7 @@ async def track_insert(
 
     try:
         async with get_file_lock(filename):
-            result = track_insert_in_doc(filename, after_text, insert_text, author)
+            result = await asyncio.to_thread(track_insert_in_doc, filename, after_text, insert_text, author)
         return json.dumps(result, ensure_ascii=False, indent=2)
     except Exception as e:
         return json.dumps({"success": False, "error": f"Failed to track insert: {str(e)}"})
@@ -129,14 +139,59 @@ async def track_delete(
     if not text:
         return json.dumps({"success": False, "error": "text cannot be empty"})
 
+    if text_absent_quick(filename, text):
+        return json.dumps({"success": False, "error": f"Text not found: '{text}'"})
+
     try:
         async with get_file_lock(filename):
-            result = track_delete_in_doc(filename, text, author)
+            result = await asyncio.to_thread(track_delete_in_doc, filename, text, author)
         return json.dumps(result, ensure_ascii=False, indent=2)
     except Exception as e:
         return json.dumps({"success": False, "error": f"Failed to track delete: {str(e)}"})
 
 
+async def track_batch_edits(
+    filename: str,
+    edits: list,
+    author: str = DEFAULT_AUTHOR,
+) -> str:
+    """Apply several tracked edits in one pass (one document load and save).
+
+    Equivalent to a sequence of track_replace / track_insert / track_delete
+    calls, but the document is unzipped, parsed, and re-zipped only once,
+    so long edit lists run much faster.
+
+    Args:
+        filename: Path to Word document.
+        edits: List of edit dicts. Each needs an "action" of "replace"
+            ({"old_text", "new_text"}), "insert" ({"after_text",
+            "insert_text"}), or "delete" ({"text"}), plus an optional
+            per-edit "author".
+        author: Default author for edits that don't specify their own.
+
+    Returns:
+        JSON string with overall result and per-edit outcomes
+    """
+    filename = ensure_docx_extension(filename)
+
+    if not os.path.exists(filename):
+        return json.dumps({"success": False, "error": f"Document {filename} does not exist"})
+
+    is_writeable, error_message = check_file_writeable(filename)
+    if not is_writeable:
+        return json.dumps({"success": False, "error": f"Cannot modify document: {error_message}"})
+
+    if not edits:
+        return json.dumps({"success": False, "error": "edits cannot be empty"})
+
+    try:
+        async with get_file_lock(filename):
+            result = await asyncio.to_thread(track_batch_edits_in_doc, filename, edits, author)
+        return json.dumps(result, ensure_ascii=False, indent=2)
+    except Exception as e:
+        return json.dumps({"success": False, "error": f"Failed to apply batch edits: {str(e)}"})
+
+
 async def list_tracked_changes(filename: str) -> str:
     """List all tracked changes in a Word document.
 
@@ -152,7 +207,7 @@ async def list_tracked_changes(filename: str) -> str:
         return json.dumps({"success": False, "error": f"Document {filename} does not exist"})
 
     try:
-        result = list_tracked_changes_in_doc(filename)
+        result = await asyncio.to_thread(list_tracked_changes_in_doc, filename)
         return json.dumps(result, ensure_ascii=False, indent=2)
     except Exception as e:
         return json.dumps({"success": False, "error": f"Failed to list tracked changes: {str(e)}"})
@@ -184,7 +239,7 @@ async def accept_tracked_changes(
 
     try:
         async with get_file_lock(filename):
-            result = accept_tracked_changes_in_doc(filename, author, change_ids)
+            result = await asyncio.to_thread(accept_tracked_changes_in_doc, filename, author, change_ids)
         return json.dumps(result, ensure_ascii=False, indent=2)
     except Exception as e:
         return json.dumps({"success": False, "error": f"Failed to accept tracked changes: {str(e)}"})
@@ -216,7 +271,7 @@ async def reject_tracked_changes(
 
     try:
         async with get_file_lock(filename):
-            result = reject_tracked_changes_in_doc(filename, author, change_ids)
+            result = await asyncio.to_thread(reject_tracked_changes_in_doc, filename, author, change_ids)
         return json.dumps(result, ensure_ascii=False, indent=2)
     except Exception as e:
         return json.dumps({"success": False, "error": f"Failed to reject tracked changes: {str(e)}"})
@@ -1,8 +1,42 @@
 """
 Utility functions for the Word Document Server.
 
-This package contains utility modules for file operations and document handling.
+This package contains utility modules for file operations and document
+handling.  Submodules and the historically re-exported helpers resolve
+lazily (PEP 562) so that importing the package does not pull python-docx
+into the process.
 """
 
-from word_document_server.utils.file_utils import check_file_writeable, create_document_copy, ensure_docx_extension
-from word_document_server.utils.document_utils import get_document_properties, extract_document_text, get_document_structure, find_paragraph_by_text, find_and_replace_text
+import importlib
+
+_SUBMODULES = {
+    "doc_cache",
+    "document_utils",
+    "extended_document_utils",
+    "fast_json",
+    "file_utils",
+    "path_utils",
+    "save_utils",
+    "text_safety",
+}
+
+# Helper re-exports kept for backward compatibility: name -> submodule.
+_FUNCTION_EXPORTS = {
+    "check_file_writeable": "file_utils",
+    "create_document_copy": "file_utils",
+    "ensure_docx_extension": "file_utils",
+    "get_document_properties": "document_utils",
+    "extract_document_text": "document_utils",
+    "get_document_structure": "document_utils",
+    "find_paragraph_by_text": "document_utils",
+    "find_and_replace_text": "document_utils",
+}
+
+
+def __getattr__(name):
+    if name in _SUBMODULES:
+        return importlib.import_module(f"{__name__}.{name}")
+    if name in _FUNCTION_EXPORTS:
+        module = importlib.import_module(f"{__name__}.{_FUNCTION_EXPORTS[name]}")
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,95 @@
+"""
+In-process cache of parsed Document objects for read-only tools.
+
+Parsing a .docx with python-docx re-reads the zip archive and rebuilds the
+whole element tree, which dominates the cost of read-only tools like
+get_document_text or get_all_comments when a client inspects the same file
+repeatedly.  This module keeps a small LRU of parsed Documents keyed on the
+file's resolved path and mtime, so a repeat read of an unchanged file skips
+the parse entirely.  Any save (including an external edit) changes the
+mtime and therefore the cache key, so stale entries are never served.
+
+Only genuinely read-only code paths may use :func:`get_document` — the
+returned Document is shared, so mutating it (or saving it) would corrupt
+later reads.  Write tools must keep parsing their own fresh copy with
+``Document(path)``.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+
+from docx import Document
+
+# Small by design: entries hold full element trees, and read-heavy sessions
+# rarely touch more than a handful of documents at once.
+_MAX_ENTRIES = 8
+
+_lock = threading.Lock()
+_cache = OrderedDict()
+
+
+def get_document(doc_path: str):
+    """Return a parsed Document for a read-only caller, caching by (path, mtime).
+
+    Raises the same exceptions as ``Document(doc_path)`` (missing file,
+    malformed package, ...), so call sites keep their existing error
+    handling.  The returned object must not be modified or saved.
+    """
+    real_path = os.path.realpath(doc_path)
+    stat = os.stat(real_path)
+    key = (real_path, stat.st_mtime_ns, stat.st_size)
+
+    with _lock:
+        doc = _cache.get(key)
+        if doc is not None:
+            _cache.move_to_end(key)
+            return doc
+
+    doc = Document(real_path)
+
+    with _lock:
+        _cache[key] = doc
+        _cache.move_to_end(key)
+        while len(_cache) > _MAX_ENTRIES:
+            _cache.popitem(last=False)
+    return doc
+
+
+def peek(doc_path: str):
+    """Return the cached Document for an unchanged file, or None.
+
+    Lets callers that also have a cheaper streaming path reuse an
+    already-paid-for parse when one exists, without forcing a full parse
+    when it doesn't (which :func:`get_document` would).
+    """
+    try:
+        real_path = os.path.realpath(doc_path)
+        stat = os.stat(real_path)
+    except OSError:
+        return None
+    key = (real_path, stat.st_mtime_ns, stat.st_size)
+    with _lock:
+        doc = _cache.get(key)
+        if doc is not None:
+            _cache.move_to_end(key)
+        return doc
+
+
+def invalidate(doc_path: str):
+    """Drop any cached parse of the given file.
+
+    The mtime in the cache key already keeps stale entries from being
+    served after a save; calling this additionally frees their element
+    trees right away instead of waiting for LRU eviction.
+    """
+    real_path = os.path.realpath(doc_path)
+    with _lock:
+        for key in [k for k in _cache if k[0] == real_path]:
+            del _cache[key]
+
+
+def clear():
+    """Drop all cached documents (used by tests and long-running sessions)."""
+    with _lock:
+        _cache.clear()
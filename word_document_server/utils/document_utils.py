@@ -9,6 +9,8 @@ from docx.oxml.text.paragraph import CT_P
 from docx.oxml.ns import qn
 from docx.oxml import OxmlElement
 
+from word_document_server.utils import doc_cache
+
 
 def get_effective_text(paragraph) -> str:
     """Get the effective (final) text of a paragraph, correctly handling tracked changes.
@@ -26,16 +28,26 @@ def get_effective_text(paragraph) -> str:
     For documents without tracked changes this returns the same result as
     paragraph.text (just slightly slower due to XML iteration).
     """
+    return get_effective_element_text(paragraph._element)
+
+
+def get_effective_element_text(p_elem) -> str:
+    """Element-level form of :func:`get_effective_text`.
+
+    Takes a raw ``<w:p>`` lxml element so callers that stream document.xml
+    directly (without building Paragraph proxies) share the same
+    tracked-change semantics.
+    """
     ns = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
     W_T = f"{{{ns}}}t"
     W_MOVEFROM = f"{{{ns}}}moveFrom"
 
     texts = []
-    for t_elem in paragraph._element.iter(W_T):
+    for t_elem in p_elem.iter(W_T):
         # Skip text inside <w:moveFrom> (moved-away text should not appear)
         skip = False
         ancestor = t_elem.getparent()
-        while ancestor is not None and ancestor is not paragraph._element:
+        while ancestor is not None and ancestor is not p_elem:
             if ancestor.tag == W_MOVEFROM:
                 skip = True
                 break
@@ -110,7 +122,7 @@ def get_document_properties(doc_path: str) -> Dict[str, Any]:
         return {"error": f"Document {doc_path} does not exist"}
     
     try:
-        doc = Document(doc_path)
+        doc = doc_cache.get_document(doc_path)
         core_props = doc.core_properties
         
         return {
@@ -152,7 +164,7 @@ def extract_document_text(doc_path: str, show_revisions: bool = False) -> str:
     text_fn = get_redline_text if show_revisions else get_effective_text
 
     try:
-        doc = Document(doc_path)
+        doc = doc_cache.get_document(doc_path)
         text = []
 
         for paragraph in doc.paragraphs:
@@ -176,7 +188,7 @@ def get_document_structure(doc_path: str) -> Dict[str, Any]:
         return {"error": f"Document {doc_path} does not exist"}
     
     try:
-        doc = Document(doc_path)
+        doc = doc_cache.get_document(doc_path)
         structure = {
             "paragraphs": [],
             "tables": []
@@ -4,33 +4,116 @@ Extended document utilities for Word Document Server.
 from typing import Dict, List, Any, Tuple
 from docx import Document
 
-from word_document_server.utils.document_utils import get_effective_text
+from word_document_server.utils import doc_cache
+from word_document_server.utils.document_utils import get_effective_text, get_effective_element_text
+
+_W_NS = "http://schemas.openxmlformats.org/wordprocessingml/2006/main"
+
+
+def _style_name_from_id(zf, style_id: str) -> str:
+    """Resolve a styleId from document.xml to its display name via styles.xml."""
+    from lxml import etree
+    from docx.styles import BabelFish
+
+    if style_id is None:
+        return "Normal"
+    try:
+        styles_root = etree.fromstring(zf.read("word/styles.xml"))
+    except KeyError:
+        return style_id
+    for style in styles_root.iter(f"{{{_W_NS}}}style"):
+        if style.get(f"{{{_W_NS}}}styleId") == style_id:
+            name = style.find(f"{{{_W_NS}}}name")
+            if name is not None and name.get(f"{{{_W_NS}}}val"):
+                # Same built-in name translation python-docx applies
+                # ("heading 1" -> "Heading 1"), so both code paths report
+                # identical style names.
+                return BabelFish.internal2ui(name.get(f"{{{_W_NS}}}val"))
+            return style_id
+    return style_id
+
+
+def _stream_paragraph_text(doc_path: str, paragraph_index: int) -> Dict[str, Any]:
+    """Pull one body paragraph out of document.xml without a full parse.
+
+    iterparse stops as soon as the Nth body-level <w:p> closes, so small
+    indexes on large documents never pay for the rest of the file (or for
+    numbering, relationships, and the other parts Document() loads).
+    Paragraphs inside tables and text boxes are skipped, matching
+    doc.paragraphs indexing.
+    """
+    import zipfile
+    from lxml import etree
+
+    W_P = f"{{{_W_NS}}}p"
+    W_TBL = f"{{{_W_NS}}}tbl"
+
+    with zipfile.ZipFile(doc_path) as zf:
+        target = None
+        index = -1
+        with zf.open("word/document.xml") as stream:
+            tbl_depth = 0
+            p_depth = 0
+            for event, elem in etree.iterparse(stream, events=("start", "end"), tag=(W_P, W_TBL)):
+                if elem.tag == W_TBL:
+                    tbl_depth += 1 if event == "start" else -1
+                    if event == "end":
+                        elem.clear()
+                    continue
+                if event == "start":
+                    p_depth += 1
+                    continue
+                p_depth -= 1
+                if tbl_depth or p_depth:
+                    continue
+                index += 1
+                if index == paragraph_index:
+                    target = elem
+                    break
+                elem.clear()
+
+        if target is None:
+            return {"error": f"Invalid paragraph index: {paragraph_index}. Document has {index + 1} paragraphs."}
+
+        pstyle = target.find(f"{{{_W_NS}}}pPr/{{{_W_NS}}}pStyle")
+        style = _style_name_from_id(zf, pstyle.get(f"{{{_W_NS}}}val") if pstyle is not None else None)
+
+    return {
+        "index": paragraph_index,
+        "text": get_effective_element_text(target),
+        "style": style,
+        "is_heading": style.startswith("Heading"),
+    }
 
 
 def get_paragraph_text(doc_path: str, paragraph_index: int) -> Dict[str, Any]:
     """
     Get text from a specific paragraph in a Word document.
-    
+
     Args:
         doc_path: Path to the Word document
         paragraph_index: Index of the paragraph to extract (0-based)
-    
+
     Returns:
         Dictionary with paragraph text and metadata
     """
     import os
     if not os.path.exists(doc_path):
         return {"error": f"Document {doc_path} does not exist"}
-    
+
     try:
-        doc = Document(doc_path)
-        
+        # A parse someone already paid for beats streaming; otherwise read
+        # just enough of document.xml instead of building a Document.
+        doc = doc_cache.peek(doc_path)
+        if doc is None:
+            return _stream_paragraph_text(doc_path, paragraph_index)
+
         # Check if paragraph index is valid
         if paragraph_index < 0 or paragraph_index >= len(doc.paragraphs):
             return {"error": f"Invalid paragraph index: {paragraph_index}. Document has {len(doc.paragraphs)} paragraphs."}
-        
+
         paragraph = doc.paragraphs[paragraph_index]
-        
+
         return {
             "index": paragraph_index,
             "text": get_effective_text(paragraph),
@@ -41,6 +124,25 @@ def get_paragraph_text(doc_path: str, paragraph_index: int) -> Dict[str, Any]:
         return {"error": f"Failed to get paragraph text: {str(e)}"}
 
 
+def _find_occurrences(hay: str, needle: str, whole_word: bool):
+    """Yield match positions of ``needle`` in one paragraph's text.
+
+    Both arguments must already be case-normalized by the caller.
+    Positions are word indexes for whole-word searches and character
+    offsets otherwise, matching the documented result shape.
+    """
+    if whole_word:
+        for word_idx, word in enumerate(hay.split()):
+            if word == needle:
+                yield word_idx
+    else:
+        step = len(needle)
+        pos = hay.find(needle)
+        while pos != -1:
+            yield pos
+            pos = hay.find(needle, pos + step)
+
+
 def find_text(doc_path: str, text_to_find: str, match_case: bool = True, whole_word: bool = False) -> Dict[str, Any]:
     """
     Find all occurrences of specific text in a Word document.
@@ -60,9 +162,25 @@ def find_text(doc_path: str, text_to_find: str, match_case: bool = True, whole_w
     
     if not text_to_find:
         return {"error": "Search text cannot be empty"}
-    
+
+    if match_case:
+        # Cheap miss path: a raw scan of document.xml proves absence (the
+        # effective text searched below is a subset of the flattened part
+        # text, and absence of a substring rules out whole-word matches
+        # too), so provably-absent queries skip the parse entirely.
+        from word_document_server.core.tracked_changes import text_absent_quick
+
+        if text_absent_quick(doc_path, text_to_find):
+            return {
+                "query": text_to_find,
+                "match_case": match_case,
+                "whole_word": whole_word,
+                "occurrences": [],
+                "total_count": 0,
+            }
+
     try:
-        doc = Document(doc_path)
+        doc = doc_cache.get_document(doc_path)
         results = {
             "query": text_to_find,
             "match_case": match_case,
@@ -70,100 +188,44 @@ def find_text(doc_path: str, text_to_find: str, match_case: bool = True, whole_w
             "occurrences": [],
             "total_count": 0
         }
-        
-        # Search in paragraphs
+
+        # Normalize the needle once; each paragraph only pays for lowering
+        # its own text.
+        needle = text_to_find if match_case else text_to_find.lower()
+
+        # Search in paragraphs — use get_effective_text for tracked-change support
         for i, para in enumerate(doc.paragraphs):
-            # Prepare text for comparison — use get_effective_text for tracked-change support
             effective = get_effective_text(para)
-            para_text = effective
-            search_text = text_to_find
-
-            if not match_case:
-                para_text = para_text.lower()
-                search_text = search_text.lower()
-
-            # Find all occurrences (simple implementation)
-            start_pos = 0
-            while True:
-                if whole_word:
-                    # For whole word search, we need to check word boundaries
-                    words = para_text.split()
-                    found = False
-                    for word_idx, word in enumerate(words):
-                        if (word == search_text or
-                            (not match_case and word.lower() == search_text.lower())):
-                            results["occurrences"].append({
-                                "paragraph_index": i,
-                                "position": word_idx,
-                                "context": effective[:100] + ("..." if len(effective) > 100 else "")
-                            })
-                            results["total_count"] += 1
-                            found = True
+            hay = effective if match_case else effective.lower()
+            context = None
+            for pos in _find_occurrences(hay, needle, whole_word):
+                if context is None:
+                    context = effective[:100] + ("..." if len(effective) > 100 else "")
+                results["occurrences"].append({
+                    "paragraph_index": i,
+                    "position": pos,
+                    "context": context
+                })
+                results["total_count"] += 1
 
-                    # Break after checking all words
-                    break
-                else:
-                    # For substring search
-                    pos = para_text.find(search_text, start_pos)
-                    if pos == -1:
-                        break
-
-                    results["occurrences"].append({
-                        "paragraph_index": i,
-                        "position": pos,
-                        "context": effective[:100] + ("..." if len(effective) > 100 else "")
-                    })
-                    results["total_count"] += 1
-                    start_pos = pos + len(search_text)
-        
         # Search in tables
         for table_idx, table in enumerate(doc.tables):
             for row_idx, row in enumerate(table.rows):
                 for col_idx, cell in enumerate(row.cells):
-                    for para_idx, para in enumerate(cell.paragraphs):
-                        # Prepare text for comparison
+                    for para in cell.paragraphs:
                         effective = get_effective_text(para)
-                        para_text = effective
-                        search_text = text_to_find
-
-                        if not match_case:
-                            para_text = para_text.lower()
-                            search_text = search_text.lower()
-
-                        # Find all occurrences (simple implementation)
-                        start_pos = 0
-                        while True:
-                            if whole_word:
-                                # For whole word search, check word boundaries
-                                words = para_text.split()
-                                found = False
-                                for word_idx, word in enumerate(words):
-                                    if (word == search_text or
-                                        (not match_case and word.lower() == search_text.lower())):
-                                        results["occurrences"].append({
-                                            "location": f"Table {table_idx}, Row {row_idx}, Column {col_idx}",
-                                            "position": word_idx,
-                                            "context": effective[:100] + ("..." if len(effective) > 100 else "")
-                                        })
-                                        results["total_count"] += 1
-                                        found = True
-
-                                # Break after checking all words
-                                break
-                            else:
-                                # For substring search
-                                pos = para_text.find(search_text, start_pos)
-                                if pos == -1:
-                                    break
-
-                                results["occurrences"].append({
-                                    "location": f"Table {table_idx}, Row {row_idx}, Column {col_idx}",
-                                    "position": pos,
-                                    "context": effective[:100] + ("..." if len(effective) > 100 else "")
-                                })
-                                results["total_count"] += 1
-                                start_pos = pos + len(search_text)
-        
+                        hay = effective if match_case else effective.lower()
+                        context = None
+                        for pos in _find_occurrences(hay, needle, whole_word):
+                            if context is None:
+                                context = effective[:100] + ("..." if len(effective) > 100 else "")
+                            results["occurrences"].append({
+                                "location": f"Table {table_idx}, Row {row_idx}, Column {col_idx}",
+                                "position": pos,
+                                "context": context
+                            })
+                            results["total_count"] += 1
+
         return results
     except Exception as e:
         return {"error": f"Failed to search for text: {str(e)}"}
@@ -189,7 +251,7 @@ def get_highlighted_text(doc_path: str, color: str = None) -> Dict[str, Any]:
         return {"error": f"Document {doc_path} does not exist"}
 
     try:
-        doc = Document(doc_path)
+        doc = doc_cache.get_document(doc_path)
         results = {
             "filter_color": color,
             "highlights": [],
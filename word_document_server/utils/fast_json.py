@@ -0,0 +1,39 @@
+"""
+Drop-in replacement for the stdlib ``json`` module used by the tool layer.
+
+Tool results are JSON strings, and payloads like document text, XML dumps,
+and comment listings run to many kilobytes; orjson encodes these several
+times faster than the stdlib's pure-Python escaping loop.  Importing this
+module as ``json`` keeps every call site unchanged, and everything falls
+back to the stdlib when orjson is not installed.
+"""
+
+import json as _json
+
+try:
+    import orjson as _orjson
+except ImportError:
+    _orjson = None
+
+load = _json.load
+loads = _json.loads if _orjson is None else _orjson.loads
+
+
+def dumps(obj, *, indent=None, ensure_ascii=True, default=None, **kwargs):
+    """``json.dumps``-compatible serializer backed by orjson.
+
+    Falls through to the stdlib for options orjson does not support
+    (indents other than 2, extra keyword arguments) or for values it
+    cannot encode.  Note that orjson emits raw UTF-8 rather than \\uXXXX
+    escapes; both forms are valid JSON.
+    """
+    if _orjson is not None and not kwargs and indent in (None, 2):
+        option = _orjson.OPT_INDENT_2 if indent == 2 else 0
+        try:
+            out = _orjson.dumps(obj, default=default, option=option)
+        except TypeError:
+            pass  # e.g. non-string dict keys; the stdlib handles more types
+        else:
+            return out.decode()
+    return _json.dumps(obj, indent=indent, ensure_ascii=ensure_ascii,
+                       default=default, **kwargs)
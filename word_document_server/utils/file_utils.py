@@ -23,18 +23,26 @@ def get_file_lock(filepath: str) -> asyncio.Lock:
     return _file_locks.setdefault(path, asyncio.Lock())
 
 
-def check_file_writeable(filepath: str) -> Tuple[bool, str]:
+def check_file_writeable(filepath: str, st: Optional[os.stat_result] = None) -> Tuple[bool, str]:
     """
     Check if a file can be written to.
-    
+
     Args:
         filepath: Path to the file
-        
+        st: Optional stat result for the file, if the caller already has
+            one — skips the existence stat so the whole existence +
+            writeability probe costs a single stat plus one open.
+
     Returns:
         Tuple of (is_writeable, error_message)
     """
-    # If file doesn't exist, check if directory is writeable
-    if not os.path.exists(filepath):
+    # One stat answers existence (an open('a') probe would create a missing
+    # file, so it can't be the first touch).
+    try:
+        if st is None:
+            os.stat(filepath)
+    except FileNotFoundError:
+        # File doesn't exist — check if the directory is writeable instead
         directory = os.path.dirname(filepath)
         # If no directory is specified (empty string), use current directory
         if directory == '':
@@ -44,16 +52,17 @@ def check_file_writeable(filepath: str) -> Tuple[bool, str]:
         if not os.access(directory, os.W_OK):
             return False, f"Directory {directory} is not writeable"
         return True, ""
-    
-    # If file exists, check if it's writeable
-    if not os.access(filepath, os.W_OK):
-        return False, f"File {filepath} is not writeable (permission denied)"
-    
-    # Try to open the file for writing to see if it's locked
+    except OSError as e:
+        return False, f"Unknown error checking file permissions: {str(e)}"
+
+    # Try to open the file for writing; this covers both permissions and
+    # locks held by Word, so no separate os.access check is needed.
     try:
         with open(filepath, 'a'):
             pass
         return True, ""
+    except PermissionError:
+        return False, f"File {filepath} is not writeable (permission denied)"
     except IOError as e:
         return False, f"File {filepath} is not writeable: {str(e)}"
     except Exception as e:
@@ -90,13 +99,16 @@ def create_document_copy(source_path: str, dest_path: Optional[str] = None) -> T
 def ensure_docx_extension(filename: str) -> str:
     """
     Ensure filename has .docx extension.
-    
+
     Args:
         filename: The filename to check
-        
+
     Returns:
         Filename with .docx extension
     """
-    if not filename.endswith('.docx'):
+    # endswith with a tuple is a single zero-allocation C call; the spelled-out
+    # case variants also stop ".docx" being appended to an already-suffixed
+    # uppercase name.
+    if not filename.endswith(('.docx', '.DOCX', '.Docx')):
         return filename + '.docx'
     return filename
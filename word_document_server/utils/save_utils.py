@@ -31,16 +31,19 @@ REL_NS = "http://schemas.openxmlformats.org/package/2006/relationships"
 CT_NS = "http://schemas.openxmlformats.org/package/2006/content-types"
 
 
-def _extract_custom_parts(zip_bytes: bytes) -> dict | None:
-    """Extract custom parts, relationships, and content-type overrides from a docx zip.
+def _extract_custom_parts(filepath: Path) -> dict | None:
+    """Extract custom parts, relationships, and content-type overrides from a docx file.
 
-    Returns a dict with keys 'parts', 'rels', 'overrides', or None if nothing to preserve.
+    Returns a dict with keys 'parts', 'rels', 'overrides', or None if nothing
+    to preserve.  Opening the zip by path reads only the central directory up
+    front, so documents without custom parts cost one directory scan instead
+    of a full read of the file into memory.
     """
     parts = {}
     rels = []
     overrides = []
 
-    with zipfile.ZipFile(BytesIO(zip_bytes), "r") as zf:
+    with zipfile.ZipFile(filepath, "r") as zf:
         namelist = zf.namelist()
 
         # 1. Extract custom part files
@@ -79,9 +82,9 @@ def _extract_custom_parts(zip_bytes: bytes) -> dict | None:
 
 def _reinject_custom_parts(filepath: Path, preserved: dict) -> None:
     """Re-inject preserved custom parts into a saved docx file."""
-    zip_bytes = filepath.read_bytes()
+    from word_document_server.core.ooxml_utils import copy_zip_entry
 
-    with zipfile.ZipFile(BytesIO(zip_bytes), "r") as zf_in:
+    with zipfile.ZipFile(filepath, "r") as zf_in:
         existing_names = set(zf_in.namelist())
 
         # --- Patch document.xml.rels ---
@@ -147,15 +150,19 @@ def _reinject_custom_parts(filepath: Path, preserved: dict) -> None:
             )
 
         # --- Rebuild the zip ---
+        # Untouched entries bypass compression entirely via copy_zip_entry;
+        # only the patched metadata parts and the re-added custom parts are
+        # DEFLATEd, at the fastest level since they are tiny next to the
+        # copied media.
         buffer = BytesIO()
-        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED) as zf_out:
+        with zipfile.ZipFile(buffer, "w", zipfile.ZIP_DEFLATED, compresslevel=1) as zf_out:
             for item in zf_in.infolist():
                 if item.filename == rels_path and patched_rels_xml is not None:
                     zf_out.writestr(item, patched_rels_xml)
                 elif item.filename == "[Content_Types].xml" and patched_ct_xml is not None:
                     zf_out.writestr(item, patched_ct_xml)
                 else:
-                    zf_out.writestr(item, zf_in.read(item.filename))
+                    copy_zip_entry(zf_in, zf_out, item)
 
             # Re-add custom part files that python-docx stripped
             for part_name, part_bytes in preserved["parts"].items():
@@ -188,7 +195,7 @@ def install_save_hook() -> None:
             # Extract custom parts from the existing file before python-docx overwrites it
             if filepath.exists():
                 try:
-                    preserved = _extract_custom_parts(filepath.read_bytes())
+                    preserved = _extract_custom_parts(filepath)
                 except Exception:
                     preserved = None
 
@@ -201,6 +208,12 @@ def install_save_hook() -> None:
                     _reinject_custom_parts(filepath, preserved)
                 except Exception:
                     pass  # Fail silently — better to have a saved doc without comments than crash
+
+            # Free any cached read-only parse of the old file contents now
+            # rather than waiting for LRU eviction (the mtime key already
+            # prevents stale reads).
+            from word_document_server.utils import doc_cache
+            doc_cache.invalidate(filepath)
         else:
             # Stream-based save — don't interfere
             _original_save(self, path_or_stream)